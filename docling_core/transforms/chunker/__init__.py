@@ -7,8 +7,13 @@
 
 from docling_core.transforms.chunker.base import BaseChunk, BaseChunker, BaseMeta
 from docling_core.transforms.chunker.hierarchical_chunker import (
+    ChunkingState,
     DocChunk,
+    DocItemRef,
     DocMeta,
+    DocRefChunk,
+    DocRefMeta,
     HierarchicalChunker,
+    RechunkResult,
 )
 from docling_core.transforms.chunker.page_chunker import PageChunker
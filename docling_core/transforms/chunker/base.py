@@ -4,9 +4,29 @@
 #
 
 """Define base classes for chunking."""
+import itertools
 import json
+import os
 from abc import ABC, abstractmethod
-from typing import Any, ClassVar, Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from functools import partial
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Collection,
+    Iterable,
+    Iterator,
+    Literal,
+    Optional,
+)
 
 from pydantic import BaseModel
 from typing_extensions import deprecated
@@ -22,13 +42,30 @@ class BaseMeta(BaseModel):
     excluded_embed: ClassVar[list[str]] = []
     excluded_llm: ClassVar[list[str]] = []
 
-    def export_json_dict(self) -> dict[str, Any]:
+    def export_json_dict(
+        self, excluded: Optional[Collection[str]] = None
+    ) -> dict[str, Any]:
         """Helper method for exporting non-None keys to JSON mode.
 
+        Args:
+            excluded: keys (i.e. field aliases) not to export, which are then not
+                serialized at all, e.g. `excluded_embed` or `excluded_llm`
+
         Returns:
             dict[str, Any]: The exported dictionary.
         """
-        return self.model_dump(mode="json", by_alias=True, exclude_none=True)
+        exclude: Optional[set[str]] = None
+        if excluded:
+            exclude = {
+                name
+                for name, field in type(self).model_fields.items()
+                if (field.alias or name) in excluded
+            }
+            if self.model_extra:
+                exclude.update(k for k in self.model_extra if k in excluded)
+        return self.model_dump(
+            mode="json", by_alias=True, exclude_none=True, exclude=exclude
+        )
 
 
 class BaseChunk(BaseModel):
@@ -66,6 +103,79 @@ class BaseChunker(BaseModel, ABC):
         """
         raise NotImplementedError()
 
+    def chunk_many(
+        self,
+        docs: Iterable[DLDocument],
+        workers: Optional[int] = None,
+        executor: Literal["process", "thread"] = "process",
+        ordered: bool = True,
+        max_pending: Optional[int] = None,
+        **kwargs: Any,
+    ) -> Iterator[tuple[int, BaseChunk]]:
+        """Chunk the provided documents in parallel.
+
+        The documents are chunked by a pool of workers, each of them chunking whole
+        documents. In a process pool, the chunker (including e.g. its tokenizer) is
+        sent to each worker once, when the worker starts. At most `max_pending`
+        documents are taken from `docs` ahead of the consumer.
+
+        Args:
+            docs: documents to chunk
+            workers: number of workers; defaults to the number of CPUs
+            executor: whether the workers are processes or threads
+            ordered: whether to yield the chunks in the order of the documents, or
+                as soon as the chunking of each document completes
+            max_pending: maximum number of documents submitted and not yet yielded;
+                defaults to twice the number of workers
+            **kwargs: arguments passed to `chunk()`
+
+        Raises:
+            ValueError: if the executor is not supported
+
+        Yields:
+            Iterator[tuple[int, BaseChunk]]: index of the document in `docs` and
+                chunk, for each chunk of each document
+        """
+        num_workers = workers or os.cpu_count() or 1
+        pool: Executor
+        task: Callable[[DLDocument, dict[str, Any]], list[BaseChunk]]
+        if executor == "process":
+            pool = ProcessPoolExecutor(
+                max_workers=num_workers,
+                initializer=_init_worker,
+                initargs=(self,),
+            )
+            task = _chunk_in_worker
+        elif executor == "thread":
+            pool = ThreadPoolExecutor(max_workers=num_workers)
+            task = partial(_chunk, self)
+        else:
+            raise ValueError(f"Unsupported executor: {executor}")
+
+        indexed_docs = enumerate(docs)
+        # submitted futures, in the order of the documents
+        pending: dict[Future[list[BaseChunk]], int] = {}
+
+        def _submit(num_docs: int) -> None:
+            for doc_index, doc in itertools.islice(indexed_docs, num_docs):
+                pending[pool.submit(task, doc, kwargs)] = doc_index
+
+        try:
+            _submit(max_pending or 2 * num_workers)
+            while pending:
+                if ordered:
+                    completed: Iterable[Future[list[BaseChunk]]] = [next(iter(pending))]
+                else:
+                    completed, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in completed:
+                    chunks = future.result()
+                    doc_index = pending.pop(future)
+                    _submit(1)
+                    for chunk in chunks:
+                        yield doc_index, chunk
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
     def contextualize(self, chunk: BaseChunk) -> str:
         """Contextualize the given chunk. This implementation is embedding-targeted.
 
@@ -75,22 +185,18 @@ class BaseChunker(BaseModel, ABC):
         Returns:
             str: the serialized form of the chunk
         """
-        meta = chunk.meta.export_json_dict()
+        meta = chunk.meta.export_json_dict(excluded=chunk.meta.excluded_embed)
 
         items = []
         for k in meta:
-            if k not in chunk.meta.excluded_embed:
-                if isinstance(meta[k], list):
-                    items.append(
-                        self.delim.join(
-                            [
-                                d if isinstance(d, str) else json.dumps(d)
-                                for d in meta[k]
-                            ]
-                        )
+            if isinstance(meta[k], list):
+                items.append(
+                    self.delim.join(
+                        [d if isinstance(d, str) else json.dumps(d) for d in meta[k]]
                     )
-                else:
-                    items.append(json.dumps(meta[k]))
+                )
+            else:
+                items.append(json.dumps(meta[k]))
         items.append(chunk.text)
 
         return self.delim.join(items)
@@ -99,3 +205,23 @@ class BaseChunker(BaseModel, ABC):
     def serialize(self, chunk: BaseChunk) -> str:
         """Contextualize the given chunk. This implementation is embedding-targeted."""
         return self.contextualize(chunk=chunk)
+
+
+_worker_chunker: Optional[BaseChunker] = None
+
+
+def _init_worker(chunker: BaseChunker) -> None:
+    global _worker_chunker
+    _worker_chunker = chunker
+
+
+def _chunk(
+    chunker: BaseChunker, dl_doc: DLDocument, kwargs: dict[str, Any]
+) -> list[BaseChunk]:
+    return list(chunker.chunk(dl_doc=dl_doc, **kwargs))
+
+
+def _chunk_in_worker(dl_doc: DLDocument, kwargs: dict[str, Any]) -> list[BaseChunk]:
+    if _worker_chunker is None:
+        raise RuntimeError("Chunking worker not initialized")
+    return _chunk(_worker_chunker, dl_doc=dl_doc, kwargs=kwargs)
@@ -7,11 +7,26 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
 import re
-from typing import Any, ClassVar, Final, Iterator, Literal, Optional
+from collections import defaultdict
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Final,
+    Generic,
+    Iterable,
+    Iterator,
+    Literal,
+    Mapping,
+    Optional,
+    TypeVar,
+)
 
-from pydantic import ConfigDict, Field, StringConstraints, field_validator
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, field_validator
 from typing_extensions import Annotated, override
 
 from docling_core.search.package import VERSION_PATTERN
@@ -30,16 +45,22 @@ from docling_core.transforms.serializer.markdown import (
 from docling_core.types import DoclingDocument as DLDocument
 from docling_core.types.doc.base import ImageRefMode
 from docling_core.types.doc.document import (
+    ContentLayer,
     DocItem,
     DoclingDocument,
     DocumentOrigin,
+    FloatingItem,
     InlineGroup,
     LevelNumber,
     ListGroup,
+    NodeItem,
+    ProvenanceItem,
+    RefItem,
     SectionHeaderItem,
     TableItem,
     TitleItem,
 )
+from docling_core.types.doc.labels import DocItemLabel
 
 _VERSION: Final = "1.0.0"
 
@@ -50,23 +71,68 @@ _KEY_HEADINGS = "headings"
 _KEY_CAPTIONS = "captions"
 _KEY_ORIGIN = "origin"
 
+DocItemT = TypeVar("DocItemT", bound=BaseModel)
+
+# fields of the items referring to other items, i.e. depending on their positions
+_POSITION_FIELDS: Final = {"self_ref", "parent", "children"}
+_REF_FIELDS: Final = ("captions", "references", "footnotes")
+
 _logger = logging.getLogger(__name__)
 
 
-class DocMeta(BaseMeta):
-    """Data model for Hierarchical Chunker chunk metadata."""
+def _digest(text: str) -> str:
+    return hashlib.blake2b(
+        text.encode("utf-8", errors="surrogatepass"), digest_size=16
+    ).hexdigest()
 
-    schema_name: Literal["docling_core.transforms.chunker.DocMeta"] = Field(
-        default="docling_core.transforms.chunker.DocMeta",
-        alias=_KEY_SCHEMA_NAME,
-    )
+
+def get_item_fingerprint(item: NodeItem) -> str:
+    """Get the content fingerprint of a document item.
+
+    The fingerprint covers the content of the item itself, but not its position in
+    the document, i.e. its own reference and the references to its parent, children,
+    captions, references and footnotes, so that it does not change when other items
+    are inserted or removed.
+
+    Args:
+        item: the item to fingerprint
+
+    Returns:
+        str: the fingerprint of the item
+    """
+    return _digest(item.model_dump_json(exclude={*_POSITION_FIELDS, *_REF_FIELDS}))
+
+
+def get_item_fingerprints(doc: DoclingDocument) -> dict[str, str]:
+    """Get the content fingerprints of all the items of a document.
+
+    Args:
+        doc: the document whose items to fingerprint
+
+    Returns:
+        dict[str, str]: the fingerprints by item reference
+    """
+    return {
+        item.self_ref: get_item_fingerprint(item)
+        for item, _ in doc.iterate_items(
+            with_groups=True,
+            traverse_pictures=True,
+            included_content_layers=set(ContentLayer),
+        )
+    }
+
+
+class _BaseDocMeta(BaseMeta, Generic[DocItemT]):
+    """Chunk metadata common to the full and the reference-only doc items."""
+
+    schema_name: str = Field(alias=_KEY_SCHEMA_NAME)
     version: Annotated[str, StringConstraints(pattern=VERSION_PATTERN, strict=True)] = (
         Field(
             default=_VERSION,
             alias=_KEY_VERSION,
         )
     )
-    doc_items: list[DocItem] = Field(
+    doc_items: list[DocItemT] = Field(
         alias=_KEY_DOC_ITEMS,
         min_length=1,
     )
@@ -116,11 +182,189 @@ class DocMeta(BaseMeta):
             return _VERSION
 
 
+class DocMeta(_BaseDocMeta[DocItem]):
+    """Data model for Hierarchical Chunker chunk metadata."""
+
+    schema_name: Literal["docling_core.transforms.chunker.DocMeta"] = Field(
+        default="docling_core.transforms.chunker.DocMeta",
+        alias=_KEY_SCHEMA_NAME,
+    )
+
+    def to_ref_meta(self, include_prov: bool = True) -> DocRefMeta:
+        """Get the reference-only counterpart of this metadata.
+
+        Args:
+            include_prov: whether to keep the provenance (page numbers and bounding
+                boxes) of the doc items
+
+        Returns:
+            DocRefMeta: the metadata, with the doc items replaced by references
+        """
+        return DocRefMeta(
+            doc_items=[
+                DocItemRef.from_doc_item(item=item, include_prov=include_prov)
+                for item in self.doc_items
+            ],
+            **self.model_dump(exclude={_KEY_SCHEMA_NAME, _KEY_DOC_ITEMS}),
+        )
+
+
+class DocItemRef(BaseModel):
+    """Reference to a doc item, with its label and optionally its provenance."""
+
+    self_ref: str
+    label: DocItemLabel
+    prov: Optional[list[ProvenanceItem]] = None
+
+    @classmethod
+    def from_doc_item(cls, item: DocItem, include_prov: bool = True) -> DocItemRef:
+        """Create a reference to the given doc item."""
+        return cls(
+            self_ref=item.self_ref,
+            label=item.label,
+            prov=item.prov if include_prov else None,
+        )
+
+    def resolve(self, doc: DoclingDocument) -> DocItem:
+        """Resolve the referenced doc item in the given document.
+
+        Raises:
+            ValueError: if the reference does not match an item of the document
+        """
+        try:
+            item = RefItem(cref=self.self_ref).resolve(doc=doc)
+        except (IndexError, KeyError, AttributeError) as e:
+            raise ValueError(f"Reference {self.self_ref} not found in document") from e
+        if not isinstance(item, DocItem) or item.label != self.label:
+            raise ValueError(f"Reference {self.self_ref} does not match the document")
+        return item
+
+
+class DocRefMeta(_BaseDocMeta[DocItemRef]):
+    """Chunk metadata referring to the doc items instead of containing them.
+
+    Can be resolved to a `DocMeta` against the source document.
+    """
+
+    schema_name: Literal["docling_core.transforms.chunker.DocRefMeta"] = Field(
+        default="docling_core.transforms.chunker.DocRefMeta",
+        alias=_KEY_SCHEMA_NAME,
+    )
+
+    def resolve(self, doc: DoclingDocument) -> DocMeta:
+        """Get the full metadata, with the doc items resolved in the given document.
+
+        Raises:
+            ValueError: if a reference does not match an item of the document
+        """
+        return DocMeta(
+            doc_items=[item_ref.resolve(doc=doc) for item_ref in self.doc_items],
+            **self.model_dump(exclude={_KEY_SCHEMA_NAME, _KEY_DOC_ITEMS}),
+        )
+
+
 class DocChunk(BaseChunk):
     """Data model for document chunks."""
 
     meta: DocMeta
 
+    def to_ref_chunk(self, include_prov: bool = True) -> DocRefChunk:
+        """Get the counterpart of this chunk with reference-only metadata.
+
+        Args:
+            include_prov: whether to keep the provenance (page numbers and bounding
+                boxes) of the doc items
+
+        Returns:
+            DocRefChunk: the chunk, with the doc items replaced by references
+        """
+        return DocRefChunk(
+            text=self.text, meta=self.meta.to_ref_meta(include_prov=include_prov)
+        )
+
+
+class DocRefChunk(BaseChunk):
+    """Data model for document chunks with reference-only metadata."""
+
+    meta: DocRefMeta
+
+    def resolve(self, doc: DoclingDocument) -> DocChunk:
+        """Get the full chunk, with the doc items resolved in the given document."""
+        return DocChunk(text=self.text, meta=self.meta.resolve(doc=doc))
+
+
+class UnitChunk(BaseModel):
+    """Chunk of a chunking unit, as recorded for incremental chunking."""
+
+    text: str
+    headings: Optional[list[str]] = None
+    # positions of the doc items among the items the unit depends on
+    doc_items: list[int]
+
+
+class ChunkingUnit(BaseModel):
+    """Chunks of a document subtree serialized as a whole, for incremental chunking.
+
+    A unit is e.g. a paragraph, a table or a list. It is identified by a key covering
+    the fingerprints of the items it depends on (i.e. the items of the subtree and the
+    items they refer to, such as captions) as well as its headings.
+    """
+
+    key: str
+    # positions of the items marked as visited by the serialization of the unit
+    visited: list[int]
+    chunks: list[UnitChunk]
+
+
+class ChunkingState(BaseModel):
+    """State of a chunking, to chunk a new version of the document incrementally."""
+
+    units: list[ChunkingUnit] = []
+    chunk_ids: list[str] = []
+    # IDs of the unit chunks making each chunk, for chunkers merging unit chunks
+    windows: Optional[list[list[str]]] = None
+
+
+class RechunkResult(BaseModel):
+    """Result of an incremental chunking.
+
+    The chunk IDs are stable as long as the items contributing to a chunk, and its
+    headings, do not change.
+    """
+
+    chunks: list[DocChunk]
+    chunk_ids: list[str]
+    added: list[str]
+    removed: list[str]
+    kept: list[str]
+    num_reused_units: int
+    state: ChunkingState
+
+    @classmethod
+    def from_chunks(
+        cls,
+        chunks: list[DocChunk],
+        state: ChunkingState,
+        previous: Optional[ChunkingState],
+        num_reused_units: int,
+    ) -> RechunkResult:
+        """Create the result, comparing the chunk IDs with the previous ones."""
+        prev_ids = set(previous.chunk_ids) if previous is not None else set()
+        ids = set(state.chunk_ids)
+        return cls(
+            chunks=chunks,
+            chunk_ids=state.chunk_ids,
+            added=[cid for cid in state.chunk_ids if cid not in prev_ids],
+            removed=(
+                [cid for cid in previous.chunk_ids if cid not in ids]
+                if previous is not None
+                else []
+            ),
+            kept=[cid for cid in state.chunk_ids if cid in prev_ids],
+            num_reused_units=num_reused_units,
+            state=state,
+        )
+
 
 class TripletTableSerializer(BaseTableSerializer):
     """Triplet-based table item serializer."""
@@ -222,10 +466,72 @@ class HierarchicalChunker(BaseChunker):
             Iterator[Chunk]: iterator over extracted chunks
         """
         my_doc_ser = self.serializer_provider.get_serializer(doc=dl_doc)
-        heading_by_level: dict[LevelNumber, str] = {}
         visited: set[str] = set()
-        ser_res = create_ser_result()
-        excluded_refs = my_doc_ser.get_excluded_refs(**kwargs)
+        for item, headings in self._iterate_units(
+            dl_doc=dl_doc, doc_ser=my_doc_ser, visited=visited, **kwargs
+        ):
+            ser_res = my_doc_ser.serialize(item=item, visited=visited)
+            if c := self._make_chunk(ser_res=ser_res, headings=headings, dl_doc=dl_doc):
+                yield c
+
+    def rechunk(
+        self,
+        dl_doc: DLDocument,
+        previous: Optional[ChunkingState] = None,
+        fingerprints: Optional[Mapping[str, str]] = None,
+        **kwargs: Any,
+    ) -> RechunkResult:
+        r"""Chunk the provided document, re-using the chunking of a previous version.
+
+        Only the units (i.e. document subtrees serialized as a whole) whose items or
+        headings changed are serialized again; the result reports the IDs of the
+        chunks added, removed and kept with respect to the previous chunking, e.g. to
+        only update the changed chunks of an index. The previous chunking must have
+        been made by a chunker with the same configuration.
+
+        Args:
+            dl_doc (DLDocument): document to chunk
+            previous: the state of the chunking of the previous version of the
+                document, if any
+            fingerprints: the content fingerprints of the items by reference, e.g.
+                from `get_item_fingerprints()`; missing ones are computed
+
+        Returns:
+            RechunkResult: the chunks with their IDs, and the state of the chunking
+        """
+        chunks: list[DocChunk] = []
+        state = ChunkingState()
+        num_reused_units = 0
+        for unit, chunk_ids, unit_chunks, reused in self._rechunk_units(
+            dl_doc=dl_doc,
+            previous=previous,
+            fingerprints=fingerprints,
+            split=lambda c: [c],
+            **kwargs,
+        ):
+            if unit is not None:
+                state.units.append(unit)
+            state.chunk_ids.extend(chunk_ids)
+            chunks.extend(unit_chunks)
+            num_reused_units += reused
+        return RechunkResult.from_chunks(
+            chunks=chunks,
+            state=state,
+            previous=previous,
+            num_reused_units=num_reused_units,
+        )
+
+    def _iterate_units(
+        self,
+        dl_doc: DLDocument,
+        doc_ser: BaseDocSerializer,
+        visited: set[str],
+        **kwargs: Any,
+    ) -> Iterator[tuple[NodeItem, Optional[list[str]]]]:
+        # the items to serialize as a whole with their headings, skipping the items
+        # visited by the serialization of the previous ones
+        heading_by_level: dict[LevelNumber, str] = {}
+        excluded_refs = doc_ser.get_excluded_refs(**kwargs)
         for item, level in dl_doc.iterate_items(with_groups=True):
             if item.self_ref in excluded_refs:
                 continue
@@ -242,20 +548,163 @@ class HierarchicalChunker(BaseChunker):
                 isinstance(item, (ListGroup, InlineGroup, DocItem))
                 and item.self_ref not in visited
             ):
-                ser_res = my_doc_ser.serialize(item=item, visited=visited)
-            else:
-                continue
+                yield item, [
+                    heading_by_level[k] for k in sorted(heading_by_level)
+                ] or None
 
-            if not ser_res.text:
-                continue
-            if doc_items := [u.item for u in ser_res.spans]:
-                c = DocChunk(
-                    text=ser_res.text,
-                    meta=DocMeta(
-                        doc_items=doc_items,
-                        headings=[heading_by_level[k] for k in sorted(heading_by_level)]
-                        or None,
-                        origin=dl_doc.origin,
-                    ),
+    def _make_chunk(
+        self,
+        ser_res: SerializationResult,
+        headings: Optional[list[str]],
+        dl_doc: DLDocument,
+    ) -> Optional[DocChunk]:
+        if not ser_res.text:
+            return None
+        if doc_items := [u.item for u in ser_res.spans]:
+            return DocChunk(
+                text=ser_res.text,
+                meta=DocMeta(
+                    doc_items=doc_items,
+                    headings=headings,
+                    origin=dl_doc.origin,
+                ),
+            )
+        return None
+
+    def _rechunk_units(
+        self,
+        dl_doc: DLDocument,
+        previous: Optional[ChunkingState],
+        fingerprints: Optional[Mapping[str, str]],
+        split: Callable[[DocChunk], Iterable[DocChunk]],
+        **kwargs: Any,
+    ) -> Iterator[tuple[Optional[ChunkingUnit], list[str], list[DocChunk], bool]]:
+        # for each unit: its record (if it can be re-used), the IDs of its chunks,
+        # its chunks, as refined by `split`, and whether it was re-used
+        my_doc_ser = self.serializer_provider.get_serializer(doc=dl_doc)
+        prev_units = (
+            {unit.key: unit for unit in previous.units} if previous is not None else {}
+        )
+        my_fingerprints = dict(fingerprints or {})
+        caption_refs = {
+            cap.cref
+            for item, _ in dl_doc.iterate_items(
+                with_groups=True,
+                traverse_pictures=True,
+                included_content_layers=set(ContentLayer),
+            )
+            if isinstance(item, FloatingItem)
+            for cap in item.captions
+        }
+        occurrences: dict[str, int] = defaultdict(int)
+        visited: set[str] = set()
+        for item, headings in self._iterate_units(
+            dl_doc=dl_doc, doc_ser=my_doc_ser, visited=visited, **kwargs
+        ):
+            deps = self._get_unit_dependencies(dl_doc=dl_doc, item=item)
+            positions = {dep.self_ref: i for i, dep in enumerate(deps)}
+            prev_visited = [dep.self_ref in visited for dep in deps]
+            key_data: list[Any] = [headings, prev_visited]
+            for dep in deps:
+                if (fingerprint := my_fingerprints.get(dep.self_ref)) is None:
+                    fingerprint = get_item_fingerprint(dep)
+                    my_fingerprints[dep.self_ref] = fingerprint
+                key_data.append(
+                    [
+                        fingerprint,
+                        # captions are serialized with the item holding them
+                        dep.self_ref in caption_refs,
+                        [
+                            [positions[ref.cref] for ref in getattr(dep, field)]
+                            for field in _REF_FIELDS
+                            if isinstance(dep, FloatingItem)
+                        ],
+                    ]
                 )
-                yield c
+            key = _digest(json.dumps(key_data))
+            occurrences[key] += 1
+            unit_id = _digest(f"{key}/{occurrences[key]}")
+
+            unit: Optional[ChunkingUnit] = prev_units.get(key)
+            reused = unit is not None
+            if unit is not None:
+                visited.update(deps[i].self_ref for i in unit.visited)
+                chunks = [
+                    DocChunk(
+                        text=unit_chunk.text,
+                        meta=DocMeta(
+                            doc_items=[deps[i] for i in unit_chunk.doc_items],
+                            headings=unit_chunk.headings,
+                            origin=dl_doc.origin,
+                        ),
+                    )
+                    for unit_chunk in unit.chunks
+                ]
+            else:
+                num_visited = len(visited)
+                ser_res = my_doc_ser.serialize(item=item, visited=visited)
+                chunk = self._make_chunk(
+                    ser_res=ser_res, headings=headings, dl_doc=dl_doc
+                )
+                chunks = list(split(chunk)) if chunk is not None else []
+
+                unit_visited = [
+                    i
+                    for i, dep in enumerate(deps)
+                    if dep.self_ref in visited and not prev_visited[i]
+                ]
+                if len(visited) - num_visited == len(unit_visited) and all(
+                    it.self_ref in positions for c in chunks for it in c.meta.doc_items
+                ):
+                    unit = ChunkingUnit(
+                        key=key,
+                        visited=unit_visited,
+                        chunks=[
+                            UnitChunk(
+                                text=c.text,
+                                headings=c.meta.headings,
+                                doc_items=[
+                                    positions[it.self_ref] for it in c.meta.doc_items
+                                ],
+                            )
+                            for c in chunks
+                        ],
+                    )
+                else:
+                    # the serialization depends on other items: the unit cannot be
+                    # re-used, and its chunk IDs depend on their actual content
+                    unit_id = _digest(
+                        json.dumps(
+                            [unit_id]
+                            + [
+                                [c.text, c.meta.headings]
+                                + [it.self_ref for it in c.meta.doc_items]
+                                for c in chunks
+                            ]
+                        )
+                    )
+            chunk_ids = [_digest(f"{unit_id}/{i}") for i in range(len(chunks))]
+            yield unit, chunk_ids, chunks, reused
+
+    @staticmethod
+    def _get_unit_dependencies(dl_doc: DLDocument, item: NodeItem) -> list[NodeItem]:
+        # the items of the subtree, in pre-order, followed by the other items they
+        # refer to
+        deps = [
+            node
+            for node, _ in dl_doc.iterate_items(
+                root=item,
+                with_groups=True,
+                traverse_pictures=True,
+                included_content_layers=set(ContentLayer),
+            )
+        ]
+        dep_refs = {dep.self_ref for dep in deps}
+        for node in list(deps):
+            if isinstance(node, FloatingItem):
+                for field in _REF_FIELDS:
+                    for ref in getattr(node, field):
+                        if ref.cref not in dep_refs:
+                            dep_refs.add(ref.cref)
+                            deps.append(ref.resolve(doc=dl_doc))
+        return deps
@@ -5,14 +5,25 @@
 
 """Hybrid chunker implementation leveraging both doc structure & token awareness."""
 import warnings
+from bisect import bisect_right
 from functools import cached_property
-from typing import Any, Iterable, Iterator, Optional, Union
+from typing import Any, Iterable, Iterator, Mapping, Optional, Union
 
-from pydantic import BaseModel, ConfigDict, Field, computed_field, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    computed_field,
+    model_validator,
+)
 from transformers import PreTrainedTokenizerBase
 
 from docling_core.transforms.chunker.hierarchical_chunker import (
     ChunkingSerializerProvider,
+    ChunkingState,
+    RechunkResult,
+    _digest,
 )
 from docling_core.transforms.chunker.tokenizer.base import BaseTokenizer
 
@@ -39,6 +50,9 @@ from docling_core.transforms.serializer.base import (
 )
 from docling_core.types import DoclingDocument
 
+# bound of the token counts memoized for the plain-text splitters
+_MAX_SEM_TOKEN_COUNTS = 2**14
+
 
 def _get_default_tokenizer():
     from docling_core.transforms.chunker.tokenizer.huggingface import (
@@ -68,6 +82,11 @@ class HybridChunker(BaseChunker):
 
     serializer_provider: BaseSerializerProvider = ChunkingSerializerProvider()
 
+    # plain-text splitters by token budget, sharing the memoized token counts
+    _sem_chunkers: dict[int, semchunk.Chunker] = PrivateAttr(default_factory=dict)
+    _sem_token_counts: dict[str, int] = PrivateAttr(default_factory=dict)
+    _sem_max_token_chars: Optional[int] = PrivateAttr(default=None)
+
     @model_validator(mode="before")
     @classmethod
     def _patch(cls, data: Any) -> Any:
@@ -120,10 +139,7 @@ class HybridChunker(BaseChunker):
         if text is None:
             return 0
         elif isinstance(text, list):
-            total = 0
-            for t in text:
-                total += self._count_text_tokens(t)
-            return total
+            return sum(self.tokenizer.count_tokens_batch(texts=text))
         return self.tokenizer.count_tokens(text=text)
 
     class _ChunkLengthInfo(BaseModel):
@@ -136,13 +152,23 @@ class HybridChunker(BaseChunker):
         return self.tokenizer.count_tokens(text=ser_txt)
 
     def _doc_chunk_length(self, doc_chunk: DocChunk):
-        text_length = self._count_text_tokens(doc_chunk.text)
-        total = self._count_chunk_tokens(doc_chunk=doc_chunk)
-        return self._ChunkLengthInfo(
-            total_len=total,
-            text_len=text_length,
-            other_len=total - text_length,
+        return self._doc_chunk_lengths(doc_chunks=[doc_chunk])[0]
+
+    def _doc_chunk_lengths(self, doc_chunks: list[DocChunk]):
+        # texts and contextualized texts of all chunks, counted in a single batch
+        counts = self.tokenizer.count_tokens_batch(
+            texts=[doc_chunk.text for doc_chunk in doc_chunks]
+            + [self.contextualize(chunk=doc_chunk) for doc_chunk in doc_chunks]
         )
+        num_chunks = len(doc_chunks)
+        return [
+            self._ChunkLengthInfo(
+                total_len=total,
+                text_len=text_length,
+                other_len=total - text_length,
+            )
+            for text_length, total in zip(counts[:num_chunks], counts[num_chunks:])
+        ]
 
     def _make_chunk_from_doc_items(
         self,
@@ -175,62 +201,94 @@ class HybridChunker(BaseChunker):
     def _split_by_doc_items(
         self, doc_chunk: DocChunk, doc_serializer: BaseDocSerializer
     ) -> list[DocChunk]:
-        chunks = []
-        window_start = 0
-        window_end = 0  # an inclusive index
         num_items = len(doc_chunk.meta.doc_items)
-        while window_end < num_items:
-            new_chunk = self._make_chunk_from_doc_items(
-                doc_chunk=doc_chunk,
-                window_start=window_start,
-                window_end=window_end,
-                doc_serializer=doc_serializer,
-            )
-            if self._count_chunk_tokens(doc_chunk=new_chunk) <= self.max_tokens:
-                if window_end < num_items - 1:
-                    window_end += 1
-                    # Still room left to add more to this chunk AND still at least one
-                    # item left
-                    continue
-                else:
-                    # All the items in the window fit into the chunk and there are no
-                    # other items left
-                    window_end = num_items  # signalizing the last loop
-            elif window_start == window_end:
-                # Only one item in the window and it doesn't fit into the chunk. So
-                # we'll just make it a chunk for now and it will get split in the
-                # plain text splitter.
-                window_end += 1
-                window_start = window_end
-            else:
-                # Multiple items in the window but they don't fit into the chunk.
-                # However, the existing items must have fit or we wouldn't have
-                # gotten here. So we put everything but the last item into the chunk
-                # and then start a new window INCLUDING the current window end.
-                new_chunk = self._make_chunk_from_doc_items(
+        if num_items == 1:
+            return [
+                self._make_chunk_from_doc_items(
                     doc_chunk=doc_chunk,
-                    window_start=window_start,
-                    window_end=window_end - 1,
+                    window_start=0,
+                    window_end=0,
                     doc_serializer=doc_serializer,
                 )
-                window_start = window_end
+            ]
+
+        # serialize and count each item once; the token count of a window is then
+        # estimated as the count of its context (i.e. a chunk without text), plus the
+        # counts of its items and delimiters, and only checked for the windows around
+        # the estimated cut point
+        texts = [
+            doc_serializer.serialize(item=doc_item).text
+            for doc_item in doc_chunk.meta.doc_items
+        ]
+        delim_len, context_len, *text_lens = self.tokenizer.count_tokens_batch(
+            texts=[
+                self.delim,
+                self.contextualize(chunk=DocChunk(text="", meta=doc_chunk.meta)),
+                *[text for text in texts if text],
+            ]
+        )
+        # cum_lens[i]: estimated length of the first i items, each with a delimiter
+        cum_lens = [0]
+        text_lens_iter = iter(text_lens)
+        for text in texts:
+            item_len = next(text_lens_iter) + delim_len if text else 0
+            cum_lens.append(cum_lens[-1] + item_len)
+
+        def _make_chunk(window_start: int, window_end: int) -> DocChunk:
+            return DocChunk(
+                text=self.delim.join(
+                    [text for text in texts[window_start : window_end + 1] if text]
+                ),
+                meta=DocMeta(
+                    doc_items=doc_chunk.meta.doc_items[window_start : window_end + 1],
+                    headings=doc_chunk.meta.headings,
+                    origin=doc_chunk.meta.origin,
+                ),
+            )
+
+        def _fits(chunk: DocChunk) -> bool:
+            return self._count_chunk_tokens(doc_chunk=chunk) <= self.max_tokens
+
+        chunks = []
+        window_start = 0
+        while window_start < num_items:
+            # the last window end (inclusive) within the estimated budget
+            budget = self.max_tokens - context_len + delim_len + cum_lens[window_start]
+            window_end = bisect_right(cum_lens, budget, lo=window_start + 1) - 2
+            window_end = min(max(window_end, window_start), num_items - 1)
+            new_chunk = _make_chunk(window_start, window_end)
+            if _fits(new_chunk):
+                # the estimate may be short: grow the window while it fits
+                while window_end < num_items - 1 and _fits(
+                    candidate := _make_chunk(window_start, window_end + 1)
+                ):
+                    window_end += 1
+                    new_chunk = candidate
+            else:
+                # shrink the window until it fits; an item which does not fit on its
+                # own makes a chunk anyway, to be split by the plain text splitter
+                while window_end > window_start:
+                    window_end -= 1
+                    new_chunk = _make_chunk(window_start, window_end)
+                    if _fits(new_chunk):
+                        break
             chunks.append(new_chunk)
+            window_start = window_end + 1
         return chunks
 
     def _split_using_plain_text(
         self,
         doc_chunk: DocChunk,
+        lengths: Optional[_ChunkLengthInfo] = None,
     ) -> list[DocChunk]:
-        lengths = self._doc_chunk_length(doc_chunk)
+        if lengths is None:
+            lengths = self._doc_chunk_length(doc_chunk)
         if lengths.total_len <= self.max_tokens:
             return [DocChunk(**doc_chunk.export_json_dict())]
         else:
             # How much room is there for text after subtracting out the headers and
             # captions:
             available_length = self.max_tokens - lengths.other_len
-            sem_chunker = semchunk.chunkerify(
-                self.tokenizer.get_tokenizer(), chunk_size=available_length
-            )
             if available_length <= 0:
                 warnings.warn(
                     "Headers and captions for this chunk are longer than the total "
@@ -242,58 +300,132 @@ class HybridChunker(BaseChunker):
                 new_chunk.meta.headings = None
                 return self._split_using_plain_text(doc_chunk=new_chunk)
             text = doc_chunk.text
-            segments = sem_chunker.chunk(text)
+            self._remember_sem_token_count(text=text, count=lengths.text_len)
+            segments = self._get_sem_chunker(chunk_size=available_length).chunk(text)
             chunks = [DocChunk(text=s, meta=doc_chunk.meta) for s in segments]
             return chunks
 
-    def _merge_chunks_with_matching_metadata(self, chunks: list[DocChunk]):
-        output_chunks = []
-        window_start = 0
-        window_end = 0  # an inclusive index
+    def _get_sem_chunker(self, chunk_size: int) -> semchunk.Chunker:
+        sem_chunker = self._sem_chunkers.get(chunk_size)
+        if sem_chunker is None:
+            if self._sem_max_token_chars is None:
+                # as determined by semchunk from the vocabulary, if any; only computed
+                # once as this is the most expensive part of the splitter setup
+                self._sem_max_token_chars = 0
+                tokenizer = self.tokenizer.get_tokenizer()
+                for vocab_getter in ("token_byte_values", "get_vocab"):
+                    if callable(getattr(tokenizer, vocab_getter, None)):
+                        vocab = getattr(tokenizer, vocab_getter)()
+                        if vocab and all(hasattr(token, "__len__") for token in vocab):
+                            self._sem_max_token_chars = max(len(t) for t in vocab)
+                            break
+            sem_chunker = semchunk.chunkerify(
+                self._count_sem_tokens,
+                chunk_size=chunk_size,
+                max_token_chars=self._sem_max_token_chars or None,
+                memoize=False,
+            )
+            self._sem_chunkers[chunk_size] = sem_chunker
+        return sem_chunker
+
+    def _count_sem_tokens(self, text: str) -> int:
+        count = self._sem_token_counts.get(text)
+        if count is None:
+            count = self.tokenizer.count_tokens(text=text)
+            self._remember_sem_token_count(text=text, count=count)
+        return count
+
+    def _remember_sem_token_count(self, text: str, count: int) -> None:
+        if len(self._sem_token_counts) >= _MAX_SEM_TOKEN_COUNTS:
+            self._sem_token_counts.clear()
+        self._sem_token_counts[text] = count
+
+    def _split_chunks(
+        self, doc_chunks: Iterable[DocChunk], doc_serializer: BaseDocSerializer
+    ) -> Iterator[DocChunk]:
+        # lazily split each chunk coming from the inner chunker, counting the
+        # lengths of its parts in a single batch
+        for doc_chunk in doc_chunks:
+            parts = self._split_by_doc_items(doc_chunk, doc_serializer=doc_serializer)
+            for part, lengths in zip(parts, self._doc_chunk_lengths(doc_chunks=parts)):
+                yield from self._split_using_plain_text(part, lengths=lengths)
+
+    def _make_merged_chunk(self, chunks: list[DocChunk]) -> DocChunk:
+        return DocChunk(
+            # TODO: merging should ideally be done by the serializer:
+            text=self.delim.join([chk.text for chk in chunks]),
+            meta=DocMeta(
+                doc_items=[it for chk in chunks for it in chk.meta.doc_items],
+                headings=chunks[0].meta.headings,
+                origin=chunks[-1].meta.origin,
+            ),
+        )
+
+    def _merge_chunks_with_matching_metadata(
+        self, chunks: Iterable[DocChunk]
+    ) -> Iterator[DocChunk]:
+        # the look-ahead buffer only holds the chunks of the current window, which is
+        # bounded by the token limit
+        window: list[DocChunk] = []
+        merged_chunk: Optional[DocChunk] = None
+        for chunk in chunks:
+            if window:
+                if chunk.meta.headings == window[0].meta.headings:
+                    candidate = self._make_merged_chunk(window + [chunk])
+                    if self._count_chunk_tokens(doc_chunk=candidate) <= self.max_tokens:
+                        # there is room to include the new chunk so add it to the
+                        # window and continue
+                        window.append(chunk)
+                        merged_chunk = candidate
+                        continue
+                # no more room OR the start of new metadata. Either way, end the
+                # window and start a new one with the current chunk
+                yield merged_chunk if merged_chunk is not None else window[0]
+            window = [chunk]
+            merged_chunk = None
+        if window:
+            yield merged_chunk if merged_chunk is not None else window[0]
+
+    def _get_merge_windows(
+        self,
+        chunk_ids: list[str],
+        chunks: list[DocChunk],
+        previous_windows: Optional[list[list[str]]],
+    ) -> list[list[int]]:
+        # the windows of chunks to merge, as computed by the merging above; a previous
+        # window is re-used without counting tokens if it starts a window here, and
+        # its chunks as well as the chunk which ended it are the same
+        prev_windows: dict[str, tuple[list[str], Optional[str]]] = {}
+        if previous_windows:
+            next_ids = [w[0] for w in previous_windows[1:]] + [None]
+            for prev_window, next_id in zip(previous_windows, next_ids):
+                prev_windows[prev_window[0]] = (prev_window, next_id)
+
         num_chunks = len(chunks)
-        while window_end < num_chunks:
-            chunk = chunks[window_end]
-            headings = chunk.meta.headings
-            ready_to_append = False
-            if window_start == window_end:
-                current_headings = headings
-                window_end += 1
-                first_chunk_of_window = chunk
-            else:
-                chks = chunks[window_start : window_end + 1]
-                doc_items = [it for chk in chks for it in chk.meta.doc_items]
-                candidate = DocChunk(
-                    # TODO: merging should ideally be done by the serializer:
-                    text=self.delim.join([chk.text for chk in chks]),
-                    meta=DocMeta(
-                        doc_items=doc_items,
-                        headings=current_headings,
-                        origin=chunk.meta.origin,
-                    ),
-                )
-                if (
-                    headings == current_headings
-                    and self._count_chunk_tokens(doc_chunk=candidate) <= self.max_tokens
+        windows: list[list[int]] = []
+        start = 0
+        while start < num_chunks:
+            prev_window, next_id = prev_windows.get(chunk_ids[start], ([], None))
+            end = start + len(prev_window)
+            if not (
+                prev_window
+                and chunk_ids[start:end] == prev_window
+                and (chunk_ids[end] if end < num_chunks else None) == next_id
+            ):
+                end = start + 1
+                headings = chunks[start].meta.headings
+                while (
+                    end < num_chunks
+                    and chunks[end].meta.headings == headings
+                    and self._count_chunk_tokens(
+                        doc_chunk=self._make_merged_chunk(chunks[start : end + 1])
+                    )
+                    <= self.max_tokens
                 ):
-                    # there is room to include the new chunk so add it to the window and
-                    # continue
-                    window_end += 1
-                    new_chunk = candidate
-                else:
-                    ready_to_append = True
-            if ready_to_append or window_end == num_chunks:
-                # no more room OR the start of new metadata.  Either way, end the block
-                # and use the current window_end as the start of a new block
-                if window_start + 1 == window_end:
-                    # just one chunk so use it as is
-                    output_chunks.append(first_chunk_of_window)
-                else:
-                    output_chunks.append(new_chunk)
-                # no need to reset window_text, etc. because that will be reset in the
-                # next iteration in the if window_start == window_end block
-                window_start = window_end
-
-        return output_chunks
+                    end += 1
+            windows.append(list(range(start, end)))
+            start = end
+        return windows
 
     def chunk(
         self,
@@ -315,12 +447,75 @@ class HybridChunker(BaseChunker):
             doc_serializer=my_doc_ser,
             **kwargs,
         )  # type: ignore
-        res = [
-            x
-            for c in res
-            for x in self._split_by_doc_items(c, doc_serializer=my_doc_ser)
-        ]
-        res = [x for c in res for x in self._split_using_plain_text(c)]
+        res = self._split_chunks(res, doc_serializer=my_doc_ser)
         if self.merge_peers:
             res = self._merge_chunks_with_matching_metadata(res)
-        return iter(res)
+        yield from res
+
+    def rechunk(
+        self,
+        dl_doc: DoclingDocument,
+        previous: Optional[ChunkingState] = None,
+        fingerprints: Optional[Mapping[str, str]] = None,
+        **kwargs: Any,
+    ) -> RechunkResult:
+        r"""Chunk the provided document, re-using the chunking of a previous version.
+
+        Only the units (i.e. document subtrees serialized as a whole) whose items or
+        headings changed are serialized and split again, and only the chunks around
+        them are merged again; the result reports the IDs of the chunks added, removed
+        and kept with respect to the previous chunking, e.g. to only update the
+        changed chunks of an index. The previous chunking must have been made by a
+        chunker with the same configuration.
+
+        Args:
+            dl_doc (DLDocument): document to chunk
+            previous: the state of the chunking of the previous version of the
+                document, if any
+            fingerprints: the content fingerprints of the items by reference, e.g.
+                from `get_item_fingerprints()`; missing ones are computed
+
+        Returns:
+            RechunkResult: the chunks with their IDs, and the state of the chunking
+        """
+        my_doc_ser = self.serializer_provider.get_serializer(doc=dl_doc)
+        state = ChunkingState()
+        unit_chunk_ids: list[str] = []
+        unit_chunks: list[DocChunk] = []
+        num_reused_units = 0
+        for unit, chunk_ids, chunks, reused in self._inner_chunker._rechunk_units(
+            dl_doc=dl_doc,
+            previous=previous,
+            fingerprints=fingerprints,
+            split=lambda c: self._split_chunks([c], doc_serializer=my_doc_ser),
+            **kwargs,
+        ):
+            if unit is not None:
+                state.units.append(unit)
+            unit_chunk_ids.extend(chunk_ids)
+            unit_chunks.extend(chunks)
+            num_reused_units += reused
+
+        if self.merge_peers:
+            windows = self._get_merge_windows(
+                chunk_ids=unit_chunk_ids,
+                chunks=unit_chunks,
+                previous_windows=previous.windows if previous is not None else None,
+            )
+        else:
+            windows = [[i] for i in range(len(unit_chunks))]
+        state.windows = [[unit_chunk_ids[i] for i in window] for window in windows]
+        res: list[DocChunk] = []
+        for window, window_ids in zip(windows, state.windows):
+            if len(window) == 1:
+                res.append(unit_chunks[window[0]])
+                state.chunk_ids.append(window_ids[0])
+            else:
+                res.append(self._make_merged_chunk([unit_chunks[i] for i in window]))
+                state.chunk_ids.append(_digest("+".join(window_ids)))
+        return RechunkResult.from_chunks(
+            chunks=res,
+            state=state,
+            previous=previous,
+            num_reused_units=num_reused_units,
+        )
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Iterator
+from typing import Any, Iterator, Optional
 
 from pydantic import ConfigDict
 from typing_extensions import override
@@ -11,7 +11,19 @@ from docling_core.transforms.chunker import BaseChunker, DocChunk, DocMeta
 from docling_core.transforms.chunker.hierarchical_chunker import (
     ChunkingSerializerProvider,
 )
+from docling_core.transforms.serializer.base import (
+    BaseDocSerializer,
+    SerializationResult,
+)
+from docling_core.transforms.serializer.common import DocSerializer
 from docling_core.types import DoclingDocument as DLDocument
+from docling_core.types.doc.document import (
+    DocItem,
+    NodeItem,
+    PictureItem,
+    TableItem,
+    TextItem,
+)
 
 
 class PageChunker(BaseChunker):
@@ -31,8 +43,22 @@ class PageChunker(BaseChunker):
         my_doc_ser = self.serializer_provider.get_serializer(doc=dl_doc)
         if dl_doc.pages:
             # chunk by page
+            page_buckets = self._get_page_buckets(doc_ser=my_doc_ser)
+            params_dump = (
+                my_doc_ser.params.model_dump()
+                if isinstance(my_doc_ser, DocSerializer)
+                else {}
+            )
             for page_no in sorted(dl_doc.pages.keys()):
-                ser_res = my_doc_ser.serialize(pages={page_no})
+                if page_buckets is None or not isinstance(my_doc_ser, DocSerializer):
+                    ser_res = my_doc_ser.serialize(pages={page_no})
+                else:
+                    ser_res = self._serialize_page(
+                        doc_ser=my_doc_ser,
+                        page_no=page_no,
+                        nodes=page_buckets.get(page_no, []),
+                        params_dump=params_dump,
+                    )
                 if not ser_res.text:
                     continue
                 yield DocChunk(
@@ -57,3 +83,90 @@ class PageChunker(BaseChunker):
                         origin=dl_doc.origin,
                     ),
                 )
+
+    @staticmethod
+    def _get_page_buckets(
+        doc_ser: BaseDocSerializer,
+    ) -> Optional[dict[int, list[NodeItem]]]:
+        """Get, for each page, the nodes to serialize for it, in document order.
+
+        The nodes are those whose subtree contains an item of the page, as any
+        other node serializes to nothing when restricting to the page. Items whose
+        serialization is not restricted to pages (i.e. other than texts, tables and
+        pictures) are considered part of every page. Returns None if the
+        serializer does not allow serializing a page out of its nodes.
+        """
+        if not isinstance(doc_ser, DocSerializer) or doc_ser.requires_page_break():
+            return None
+
+        # same traversal as DocSerializer.get_parts(), with the pages of each
+        # subtree propagated to the ancestors as they go out of scope
+        nodes: list[NodeItem] = []
+        levels: list[int] = []
+        node_pages: list[set[int]] = []
+        on_all_pages: list[bool] = []
+        stack: list[int] = []  # indexes of the ancestors of the current node
+
+        def _pop() -> None:
+            child = stack.pop()
+            if stack:
+                node_pages[stack[-1]] |= node_pages[child]
+                on_all_pages[stack[-1]] |= on_all_pages[child]
+
+        for item, level in doc_ser.doc.iterate_items(
+            with_groups=True,
+            included_content_layers=doc_ser.params.layers,
+        ):
+            while stack and levels[stack[-1]] >= level:
+                _pop()
+            stack.append(len(nodes))
+            nodes.append(item)
+            levels.append(level)
+            if isinstance(item, (TextItem, TableItem, PictureItem)):
+                node_pages.append({item.prov[0].page_no} if item.prov else set())
+                on_all_pages.append(False)
+            else:
+                node_pages.append(set())
+                on_all_pages.append(isinstance(item, DocItem))
+        while stack:
+            _pop()
+
+        all_pages = set(doc_ser.doc.pages.keys())
+        buckets: dict[int, list[NodeItem]] = {}
+        for node, pages, on_all in zip(nodes, node_pages, on_all_pages):
+            if node is doc_ser.doc.body:
+                continue
+            for page_no in all_pages if on_all else pages:
+                buckets.setdefault(page_no, []).append(node)
+        return buckets
+
+    @staticmethod
+    def _serialize_page(
+        doc_ser: DocSerializer,
+        page_no: int,
+        nodes: list[NodeItem],
+        params_dump: dict[str, Any],
+    ) -> SerializationResult:
+        """Serialize a page out of its nodes, like serialize(pages={page_no}).
+
+        The params_dump is the dump of the serializer params, taken once for all
+        pages.
+        """
+        # hashable, for the params restricted to the page to be validated once
+        my_kwargs = {**params_dump, "pages": frozenset({page_no})}
+        visited: set[str] = {doc_ser.doc.body.self_ref}
+        parts: list[SerializationResult] = []
+        # a single serialization run for the nodes of the page
+        _, token = doc_ser._begin_run()
+        try:
+            for node in nodes:
+                if node.self_ref in visited:
+                    continue
+                visited.add(node.self_ref)
+                part = doc_ser.serialize(item=node, visited=visited, **my_kwargs)
+                if part.text:
+                    parts.append(part)
+            return doc_ser.serialize_doc(parts=parts, **my_kwargs)
+        finally:
+            if token is not None:
+                doc_ser._end_run(token)
@@ -14,6 +14,10 @@ class BaseTokenizer(BaseModel, ABC):
         """Get number of tokens for given text."""
         ...
 
+    def count_tokens_batch(self, texts: list[str]) -> list[int]:
+        """Get number of tokens for each of the given texts."""
+        return [self.count_tokens(text=text) for text in texts]
+
     @abstractmethod
     def get_max_tokens(self) -> int:
         """Get maximum number of tokens allowed."""
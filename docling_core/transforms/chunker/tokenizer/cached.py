@@ -0,0 +1,143 @@
+"""Caching tokenization."""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any
+
+from pydantic import BaseModel, Field, PrivateAttr
+
+from docling_core.transforms.chunker.tokenizer.base import BaseTokenizer
+
+
+class TokenCountCacheInfo(BaseModel):
+    """Statistics of a token count cache."""
+
+    hits: int
+    misses: int
+    max_entries: int
+    num_entries: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Get the share of the lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class CachedTokenizer(BaseTokenizer):
+    """Tokenizer memoizing the token counts of another tokenizer.
+
+    Counts are keyed by a digest of the text, so that each entry has a fixed size
+    regardless of the length of the text, and the least recently used entries are
+    evicted beyond `max_entries`. The same instance can be shared by several
+    chunkers and across documents, also from multiple threads.
+
+    Args:
+        tokenizer: The tokenizer whose counts to cache
+        max_entries: The maximum number of cached counts; each entry takes about
+            150 bytes
+    """
+
+    tokenizer: BaseTokenizer
+    max_entries: int = Field(default=2**16, gt=0)
+
+    _counts: OrderedDict[bytes, int] = PrivateAttr(default_factory=OrderedDict)
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _hits: int = PrivateAttr(default=0)
+    _misses: int = PrivateAttr(default=0)
+
+    def __getstate__(self) -> dict[Any, Any]:
+        """Get the state for pickling, e.g. for process workers, without the lock."""
+        state = super().__getstate__()
+        private = dict(state["__pydantic_private__"])
+        del private["_lock"]
+        return {**state, "__pydantic_private__": private}
+
+    def __setstate__(self, state: dict[Any, Any]) -> None:
+        """Restore the state from pickling, with a new lock."""
+        super().__setstate__(state)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(text: str) -> bytes:
+        return hashlib.blake2b(
+            text.encode("utf-8", errors="surrogatepass"), digest_size=16
+        ).digest()
+
+    def _lookup(self, key: bytes) -> Any:
+        # to be called holding the lock
+        count = self._counts.get(key)
+        if count is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+            self._counts.move_to_end(key)
+        return count
+
+    def _store(self, key: bytes, count: int) -> None:
+        # to be called holding the lock
+        self._counts[key] = count
+        self._counts.move_to_end(key)
+        while len(self._counts) > self.max_entries:
+            self._counts.popitem(last=False)
+
+    def count_tokens(self, text: str) -> int:
+        """Get number of tokens for given text."""
+        key = self._key(text)
+        with self._lock:
+            count = self._lookup(key)
+        if count is None:
+            count = self.tokenizer.count_tokens(text=text)
+            with self._lock:
+                self._store(key, count)
+        return count
+
+    def count_tokens_batch(self, texts: list[str]) -> list[int]:
+        """Get number of tokens for each of the given texts."""
+        keys = [self._key(text) for text in texts]
+        with self._lock:
+            counts = [self._lookup(key) for key in keys]
+        missing = {
+            key: text for key, text, count in zip(keys, texts, counts) if count is None
+        }
+        if missing:
+            missing_counts = dict(
+                zip(
+                    missing.keys(),
+                    self.tokenizer.count_tokens_batch(texts=list(missing.values())),
+                )
+            )
+            with self._lock:
+                for key, count in missing_counts.items():
+                    self._store(key, count)
+            counts = [
+                missing_counts[key] if count is None else count
+                for key, count in zip(keys, counts)
+            ]
+        return counts
+
+    def get_max_tokens(self) -> int:
+        """Get maximum number of tokens allowed."""
+        return self.tokenizer.get_max_tokens()
+
+    def get_tokenizer(self) -> Any:
+        """Get underlying tokenizer object."""
+        return self.tokenizer.get_tokenizer()
+
+    def cache_info(self) -> TokenCountCacheInfo:
+        """Get the hit and miss statistics of the cache."""
+        with self._lock:
+            return TokenCountCacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                max_entries=self.max_entries,
+                num_entries=len(self._counts),
+            )
+
+    def cache_clear(self) -> None:
+        """Clear the cache and its statistics."""
+        with self._lock:
+            self._counts.clear()
+            self._hits = 0
+            self._misses = 0
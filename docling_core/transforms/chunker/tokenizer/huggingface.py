@@ -52,6 +52,19 @@ class HuggingFaceTokenizer(BaseTokenizer):
         """Get number of tokens for given text."""
         return len(self.tokenizer.tokenize(text=text))
 
+    def count_tokens_batch(self, texts: list[str]) -> list[int]:
+        """Get number of tokens for each of the given texts."""
+        if not texts or not self.tokenizer.is_fast:
+            return super().count_tokens_batch(texts=texts)
+        encodings = self.tokenizer(
+            texts,
+            add_special_tokens=False,
+            return_attention_mask=False,
+            return_token_type_ids=False,
+            verbose=False,
+        )
+        return [len(input_ids) for input_ids in encodings["input_ids"]]
+
     def get_max_tokens(self):
         """Get maximum number of tokens allowed."""
         return self.max_tokens
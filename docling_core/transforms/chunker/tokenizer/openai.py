@@ -25,6 +25,10 @@ class OpenAITokenizer(BaseTokenizer):
         """Get number of tokens for given text."""
         return len(self.tokenizer.encode(text=text))
 
+    def count_tokens_batch(self, texts: list[str]) -> list[int]:
+        """Get number of tokens for each of the given texts."""
+        return [len(tokens) for tokens in self.tokenizer.encode_batch(text=texts)]
+
     def get_max_tokens(self) -> int:
         """Get maximum number of tokens allowed."""
         return self.max_tokens
@@ -6,7 +6,7 @@
 """Define base classes for serialization."""
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any, Optional, Union
+from typing import AbstractSet, Any, Optional, Union
 
 from pydantic import AnyUrl, BaseModel
 
@@ -268,7 +268,7 @@ class BaseDocSerializer(ABC):
         ...
 
     @abstractmethod
-    def get_excluded_refs(self, **kwargs: Any) -> set[str]:
+    def get_excluded_refs(self, **kwargs: Any) -> AbstractSet[str]:
         """Get references to excluded items."""
         ...
 
@@ -4,14 +4,37 @@
 #
 
 """Define base classes for serialization."""
-import re
+import copy
 import sys
+import threading
 from abc import abstractmethod
+from collections import OrderedDict
+from contextvars import ContextVar, Token
 from functools import cached_property
 from pathlib import Path
-from typing import Any, Iterable, Optional, Tuple, Union
+from typing import (
+    AbstractSet,
+    Any,
+    Callable,
+    Hashable,
+    Iterable,
+    Iterator,
+    Optional,
+    TextIO,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
 
-from pydantic import AnyUrl, BaseModel, ConfigDict, NonNegativeInt, computed_field
+from pydantic import (
+    AnyUrl,
+    BaseModel,
+    ConfigDict,
+    NonNegativeInt,
+    PrivateAttr,
+    computed_field,
+)
 from typing_extensions import Self, override
 
 from docling_core.transforms.serializer.base import (
@@ -69,6 +92,12 @@ class _PageBreakSerResult(SerializationResult):
     node: _PageBreakNode
 
 
+class _PagedSerResult(SerializationResult):
+    """Serialization result with page breaks within its text, e.g. of a list."""
+
+    page_breaks: list[_PageBreakSerResult]
+
+
 def _iterate_items(
     doc: DoclingDocument,
     layers: Optional[set[ContentLayer]],
@@ -198,6 +227,213 @@ class CommonParams(BaseModel):
         return res
 
 
+_P = TypeVar("_P", bound=CommonParams)
+
+
+def _get_defining_class(cls: type, name: str) -> type:
+    return next(c for c in cls.__mro__ if name in c.__dict__)
+
+
+class _ParamsRun:
+    """Params of a doc serializer, resolved once for a serialization run."""
+
+    def __init__(self, owner: "DocSerializer", params: CommonParams):
+        self.owner = owner
+        self.params = params
+        self.dump = params.model_dump()
+        self.excluded_refs: Optional[AbstractSet[str]] = None
+        self.page_breaks: list[_PageBreakSerResult] = []  # in serialization order
+        self._patched: dict[Hashable, CommonParams] = {}
+
+    def get_params(
+        self,
+        key: Hashable,
+        kwargs: dict[str, Any],
+        factory: Callable[[], CommonParams],
+    ) -> CommonParams:
+        """Get the params for the passed kwargs, creating them only when patched."""
+        dump = self.dump
+        if dump.items() <= kwargs.items():
+            return self.params
+        # kwargs passed down from the dump are recognized by identity
+        patch = {
+            name: value
+            for name, value in kwargs.items()
+            if name in dump
+            and value is not dump[name]
+            and value != getattr(self.params, name)
+        }
+        if not patch:
+            return self.params
+        try:
+            cache_key = (key, tuple(sorted(patch.items())))
+            hash(cache_key)
+        except TypeError:
+            return factory()
+        params = self._patched.get(cache_key)
+        if params is None:
+            params = self._patched[cache_key] = factory()
+        return params
+
+
+# the serialization run in progress in the current context, if any; as a context
+# variable, it is specific to each thread (and asyncio task), and restored when a
+# nested run (e.g. of a copy of the serializer with other params) ends
+_params_run: ContextVar[Optional[_ParamsRun]] = ContextVar("_params_run", default=None)
+
+
+# position in the traversal, label (None for non-doc items), content layer and page
+_ItemEntry = Tuple[int, Optional[DocItemLabel], ContentLayer, Optional[int]]
+
+
+def _index_items(
+    doc: DoclingDocument, layers: AbstractSet[ContentLayer]
+) -> dict[str, _ItemEntry]:
+    index: dict[str, _ItemEntry] = {}
+    for ix, item in enumerate(
+        _iterate_items(doc=doc, traverse_pictures=True, layers=set(layers))
+    ):
+        entry: _ItemEntry
+        if isinstance(item, DocItem):
+            page_no = item.prov[0].page_no if item.prov else None
+            entry = (ix, item.label, item.content_layer, page_no)
+        else:
+            entry = (ix, None, item.content_layer, None)
+        index.setdefault(item.self_ref, entry)
+    return index
+
+
+def _get_exclusion_key(params: CommonParams) -> Hashable:
+    # fingerprint of the params determining the excluded items
+    return (
+        params.start_idx,
+        params.stop_idx,
+        frozenset(params.labels),
+        frozenset(params.layers),
+        None if params.pages is None else frozenset(params.pages),
+    )
+
+
+class _ExcludedRefs(AbstractSet[str]):
+    """References to the items excluded by some params.
+
+    Membership is checked against an index of the document items, so that the
+    references need not be collected for each params, e.g. for each page; they are
+    only collected when iterating.
+    """
+
+    def __init__(self, index: dict[str, _ItemEntry], params: CommonParams):
+        self._index = index
+        self._start_idx = params.start_idx
+        self._stop_idx = params.stop_idx
+        self._labels = frozenset(params.labels)
+        self._layers = frozenset(params.layers)
+        self._pages = None if params.pages is None else frozenset(params.pages)
+        self._refs: Optional[list[str]] = None
+
+    def __contains__(self, ref: object) -> bool:
+        entry = self._index.get(cast(str, ref))
+        if entry is None:
+            return False
+        ix, label, layer, page_no = entry
+        return not (self._start_idx <= ix < self._stop_idx) or (
+            label is not None
+            and (
+                label not in self._labels
+                or layer not in self._layers
+                or (self._pages is not None and page_no not in self._pages)
+            )
+        )
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._get_refs())
+
+    def __len__(self) -> int:
+        return len(self._get_refs())
+
+    @classmethod
+    def _from_iterable(cls, it: Iterable[Any]) -> AbstractSet[Any]:
+        # results of set operations are plain sets
+        return set(it)
+
+    def _get_refs(self) -> list[str]:
+        if self._refs is None:
+            self._refs = [ref for ref in self._index if ref in self]
+        return self._refs
+
+
+class _ExcludedRefsCache:
+    """Bounded cache of the excluded refs of a doc serializer by params fingerprint.
+
+    It can be shared by concurrent serializations. Like a model cache, it never takes
+    part in equality and is never carried over by copying or pickling.
+    """
+
+    def __init__(self, max_entries: int = 64):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._indexes: dict[frozenset[ContentLayer], dict[str, _ItemEntry]] = {}
+        self._entries: OrderedDict[Hashable, _ExcludedRefs] = OrderedDict()
+
+    def get(self, doc: DoclingDocument, params: CommonParams) -> _ExcludedRefs:
+        """Get the refs excluded by the passed params."""
+        key = _get_exclusion_key(params)
+        layers = frozenset(params.layers)
+        with self._lock:
+            refs = self._entries.get(key)
+            if refs is not None:
+                self._entries.move_to_end(key)
+                return refs
+            index = self._indexes.get(layers)
+        if index is None:
+            index = _index_items(doc=doc, layers=layers)
+        refs = _ExcludedRefs(index=index, params=params)
+        with self._lock:
+            self._indexes.setdefault(layers, index)
+            self._entries[key] = refs
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return refs
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _ExcludedRefsCache)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __copy__(self) -> "_ExcludedRefsCache":
+        return type(self)(max_entries=self.max_entries)
+
+    def __deepcopy__(self, memo: dict) -> "_ExcludedRefsCache":
+        return type(self)(max_entries=self.max_entries)
+
+    def __reduce__(self):
+        return (type(self), (self.max_entries,))
+
+
+def resolve_params(
+    params_type: type[_P],
+    doc_serializer: BaseDocSerializer,
+    kwargs: dict[str, Any],
+) -> _P:
+    """Get the parameters of a component serializer from the passed kwargs.
+
+    Equivalent to `params_type(**kwargs)`, but re-uses the parameters resolved by the
+    doc serializer for the current serialization run, unless the kwargs actually
+    override some of them. The returned instance must not be modified.
+
+    Args:
+        params_type: the type of the parameters
+        doc_serializer: the doc serializer driving the serialization
+        kwargs: the kwargs passed to the component serializer
+
+    Returns:
+        The parameters.
+    """
+    if isinstance(doc_serializer, DocSerializer):
+        return doc_serializer._validate_params(params_type=params_type, kwargs=kwargs)
+    return params_type(**kwargs)
+
+
 class DocSerializer(BaseModel, BaseDocSerializer):
     """Class for document serializers."""
 
@@ -219,7 +455,61 @@ class DocSerializer(BaseModel, BaseDocSerializer):
 
     params: CommonParams = CommonParams()
 
-    _excluded_refs_cache: dict[str, set[str]] = {}
+    _excluded_refs_cache: _ExcludedRefsCache = PrivateAttr(
+        default_factory=_ExcludedRefsCache
+    )
+
+    def __copy__(self) -> Self:
+        """Shallow copy, e.g. by `model_copy()`, with its own excluded refs cache."""
+        copied = super().__copy__()
+        copied._excluded_refs_cache = copy.copy(self._excluded_refs_cache)
+        return copied
+
+    def _get_run(self) -> Optional[_ParamsRun]:
+        # the run in progress of this serializer, if any
+        run = _params_run.get()
+        return run if run is not None and run.owner is self else None
+
+    def _begin_run(self) -> tuple[_ParamsRun, Optional[Token]]:
+        # resolve the params once for an outermost serialization call, also returning
+        # the token to end the run with, if one was begun
+        run = self._get_run()
+        if run is not None:
+            return run, None
+        run = _ParamsRun(owner=self, params=self.params)
+        return run, _params_run.set(run)
+
+    def _end_run(self, token: Token) -> None:
+        _params_run.reset(token)
+
+    def _merge_params(self, kwargs: dict[str, Any]) -> CommonParams:
+        # same as `self.params.merge_with_patch(patch=kwargs)`, without copying
+        if (run := self._get_run()) is None:
+            return self.params.merge_with_patch(patch=kwargs)
+        return run.get_params(
+            key="merge",
+            kwargs=kwargs,
+            factory=lambda: self.params.merge_with_patch(patch=kwargs),
+        )
+
+    def _validate_params(self, params_type: type[_P], kwargs: dict[str, Any]) -> _P:
+        # same as `params_type(**kwargs)`, without validating the params again when
+        # all of them are passed in kwargs, from the params of the run
+        run = self._get_run()
+        if (
+            run is None
+            or type(self.params) is not params_type
+            or not run.dump.keys() <= kwargs.keys()
+        ):
+            return params_type(**kwargs)
+        return cast(
+            _P,
+            run.get_params(
+                key=params_type,
+                kwargs=kwargs,
+                factory=lambda: params_type(**kwargs),
+            ),
+        )
 
     @computed_field  # type: ignore[misc]
     @cached_property
@@ -237,41 +527,17 @@ class DocSerializer(BaseModel, BaseDocSerializer):
         return refs
 
     @override
-    def get_excluded_refs(self, **kwargs: Any) -> set[str]:
+    def get_excluded_refs(self, **kwargs: Any) -> AbstractSet[str]:
         """References to excluded items."""
-        params = self.params.merge_with_patch(patch=kwargs)
-        params_json = params.model_dump_json()
-        refs = self._excluded_refs_cache.get(params_json)
-        if refs is None:
-            refs = {
-                item.self_ref
-                for ix, item in enumerate(
-                    _iterate_items(
-                        doc=self.doc,
-                        traverse_pictures=True,
-                        layers=params.layers,
-                    )
+        params = self._merge_params(kwargs)
+        run = self._get_run()
+        if run is not None and params is run.params:
+            if run.excluded_refs is None:
+                run.excluded_refs = self._excluded_refs_cache.get(
+                    doc=self.doc, params=params
                 )
-                if (
-                    (ix < params.start_idx or ix >= params.stop_idx)
-                    or (
-                        isinstance(item, DocItem)
-                        and (
-                            item.label not in params.labels
-                            or item.content_layer not in params.layers
-                            or (
-                                params.pages is not None
-                                and (
-                                    (not item.prov)
-                                    or item.prov[0].page_no not in params.pages
-                                )
-                            )
-                        )
-                    )
-                )
-            }
-            self._excluded_refs_cache[params_json] = refs
-        return refs
+            return run.excluded_refs
+        return self._excluded_refs_cache.get(doc=self.doc, params=params)
 
     @abstractmethod
     def serialize_doc(
@@ -301,102 +567,108 @@ class DocSerializer(BaseModel, BaseDocSerializer):
     ) -> SerializationResult:
         """Serialize a given node."""
         my_visited: set[str] = visited if visited is not None else set()
-        my_kwargs = {**self.params.model_dump(), **kwargs}
-        empty_res = create_ser_result()
-        if item is None or item == self.doc.body:
-            if self.doc.body.self_ref not in my_visited:
-                my_visited.add(self.doc.body.self_ref)
-                return self._serialize_body(**my_kwargs)
-            else:
-                return empty_res
-
-        my_visited.add(item.self_ref)
-
-        ########
-        # groups
-        ########
-        if isinstance(item, ListGroup):
-            part = self.list_serializer.serialize(
-                item=item,
-                doc_serializer=self,
-                doc=self.doc,
-                list_level=list_level,
-                is_inline_scope=is_inline_scope,
-                visited=my_visited,
-                **my_kwargs,
-            )
-        elif isinstance(item, InlineGroup):
-            part = self.inline_serializer.serialize(
-                item=item,
-                doc_serializer=self,
-                doc=self.doc,
-                list_level=list_level,
-                visited=my_visited,
-                **my_kwargs,
-            )
-        ###########
-        # doc items
-        ###########
-        elif isinstance(item, TextItem):
-            if item.self_ref in self._captions_of_some_item:
-                # those captions will be handled by the floating item holding them
-                return empty_res
-            else:
-                part = (
-                    self.text_serializer.serialize(
-                        item=item,
-                        doc_serializer=self,
-                        doc=self.doc,
-                        is_inline_scope=is_inline_scope,
-                        visited=my_visited,
-                        **my_kwargs,
+        run, token = self._begin_run()
+        try:
+            my_kwargs = {**run.dump, **kwargs}
+            empty_res = create_ser_result()
+            if item is None or item == self.doc.body:
+                if self.doc.body.self_ref not in my_visited:
+                    my_visited.add(self.doc.body.self_ref)
+                    return self._serialize_body(**my_kwargs)
+                else:
+                    return empty_res
+
+            my_visited.add(item.self_ref)
+
+            ########
+            # groups
+            ########
+            if isinstance(item, ListGroup):
+                part = self.list_serializer.serialize(
+                    item=item,
+                    doc_serializer=self,
+                    doc=self.doc,
+                    list_level=list_level,
+                    is_inline_scope=is_inline_scope,
+                    visited=my_visited,
+                    **my_kwargs,
+                )
+            elif isinstance(item, InlineGroup):
+                part = self.inline_serializer.serialize(
+                    item=item,
+                    doc_serializer=self,
+                    doc=self.doc,
+                    list_level=list_level,
+                    visited=my_visited,
+                    **my_kwargs,
+                )
+            ###########
+            # doc items
+            ###########
+            elif isinstance(item, TextItem):
+                if item.self_ref in self._captions_of_some_item:
+                    # those captions will be handled by the floating item holding them
+                    return empty_res
+                else:
+                    part = (
+                        self.text_serializer.serialize(
+                            item=item,
+                            doc_serializer=self,
+                            doc=self.doc,
+                            is_inline_scope=is_inline_scope,
+                            visited=my_visited,
+                            **my_kwargs,
+                        )
+                        if item.self_ref not in self.get_excluded_refs(**kwargs)
+                        else empty_res
                     )
-                    if item.self_ref not in self.get_excluded_refs(**kwargs)
-                    else empty_res
+            elif isinstance(item, TableItem):
+                part = self.table_serializer.serialize(
+                    item=item,
+                    doc_serializer=self,
+                    doc=self.doc,
+                    visited=my_visited,
+                    **my_kwargs,
                 )
-        elif isinstance(item, TableItem):
-            part = self.table_serializer.serialize(
-                item=item,
-                doc_serializer=self,
-                doc=self.doc,
-                visited=my_visited,
-                **my_kwargs,
-            )
-        elif isinstance(item, PictureItem):
-            part = self.picture_serializer.serialize(
-                item=item,
-                doc_serializer=self,
-                doc=self.doc,
-                visited=my_visited,
-                **my_kwargs,
-            )
-        elif isinstance(item, KeyValueItem):
-            part = self.key_value_serializer.serialize(
-                item=item,
-                doc_serializer=self,
-                doc=self.doc,
-                **my_kwargs,
-            )
-        elif isinstance(item, FormItem):
-            part = self.form_serializer.serialize(
-                item=item,
-                doc_serializer=self,
-                doc=self.doc,
-                **my_kwargs,
-            )
-        elif isinstance(item, _PageBreakNode):
-            part = _PageBreakSerResult(
-                text=self._create_page_break(node=item),
-                node=item,
-            )
-        else:
-            part = self.fallback_serializer.serialize(
-                item=item,
-                doc_serializer=self,
-                doc=self.doc,
-                **my_kwargs,
-            )
-        return part
+            elif isinstance(item, PictureItem):
+                part = self.picture_serializer.serialize(
+                    item=item,
+                    doc_serializer=self,
+                    doc=self.doc,
+                    visited=my_visited,
+                    **my_kwargs,
+                )
+            elif isinstance(item, KeyValueItem):
+                part = self.key_value_serializer.serialize(
+                    item=item,
+                    doc_serializer=self,
+                    doc=self.doc,
+                    **my_kwargs,
+                )
+            elif isinstance(item, FormItem):
+                part = self.form_serializer.serialize(
+                    item=item,
+                    doc_serializer=self,
+                    doc=self.doc,
+                    **my_kwargs,
+                )
+            elif isinstance(item, _PageBreakNode):
+                part = _PageBreakSerResult(
+                    text=self._create_page_break(node=item),
+                    node=item,
+                )
+                run.page_breaks.append(part)
+            else:
+                part = self.fallback_serializer.serialize(
+                    item=item,
+                    doc_serializer=self,
+                    doc=self.doc,
+                    **my_kwargs,
+                )
+            return part
+        finally:
+            if token is not None:
+                self._end_run(token)
 
     # making some assumptions about the kwargs it can pass
     @override
@@ -411,10 +683,36 @@ class DocSerializer(BaseModel, BaseDocSerializer):
         **kwargs: Any,
     ) -> list[SerializationResult]:
         """Get the components to be combined for serializing this node."""
-        parts: list[SerializationResult] = []
-        my_visited: set[str] = visited if visited is not None else set()
-        params = self.params.merge_with_patch(patch=kwargs)
+        _, token = self._begin_run()
+        try:
+            return list(
+                self._iter_parts(
+                    item=item,
+                    list_level=list_level,
+                    is_inline_scope=is_inline_scope,
+                    visited=visited,
+                    **kwargs,
+                )
+            )
+        finally:
+            if token is not None:
+                self._end_run(token)
 
+    def _iter_parts(
+        self,
+        item: Optional[NodeItem] = None,
+        *,
+        list_level: int = 0,
+        is_inline_scope: bool = False,
+        visited: Optional[set[str]] = None,  # refs of visited items
+        **kwargs: Any,
+    ) -> Iterator[SerializationResult]:
+        # the components of get_parts(), serialized one at a time as they are consumed
+        my_visited: set[str] = visited if visited is not None else set()
+        params = self._merge_params(kwargs)
+        run = self._get_run()
+        assert run is not None  # only called within a run
+        page_breaks = run.page_breaks
         for node in _iterate_items(
             node=item,
             doc=self.doc,
@@ -425,6 +723,7 @@ class DocSerializer(BaseModel, BaseDocSerializer):
                 continue
             else:
                 my_visited.add(node.self_ref)
+            num_page_breaks = len(page_breaks)
             part = self.serialize(
                 item=node,
                 list_level=list_level,
@@ -433,8 +732,116 @@ class DocSerializer(BaseModel, BaseDocSerializer):
                 **kwargs,
             )
             if part.text:
-                parts.append(part)
-        return parts
+                if len(page_breaks) > num_page_breaks and not isinstance(
+                    part, _PageBreakSerResult
+                ):
+                    part = _PagedSerResult(
+                        text=part.text,
+                        spans=part.spans,
+                        page_breaks=page_breaks[num_page_breaks:],
+                    )
+                yield part
+
+    def serialize_to_stream(self, fw: TextIO, **kwargs: Any) -> None:
+        """Serialize the document, writing the output to a text stream.
+
+        The output is the same as `serialize().text`, but it is written as the body
+        is traversed, part by part, so that the memory needed is bounded by the
+        largest part rather than the whole output, where the serializer supports it.
+
+        Args:
+            fw: the text stream to write to
+            **kwargs: the params to override, as for `serialize()`
+        """
+        cls = type(self)
+        if any(
+            _get_defining_class(cls, name) is not DocSerializer
+            for name in ("serialize", "_serialize_body")
+        ) or not issubclass(
+            _get_defining_class(cls, "_write_doc"),
+            _get_defining_class(cls, "serialize_doc"),
+        ):
+            # customized below the streaming implementation, so not streamed
+            fw.write(self.serialize(**kwargs).text)
+            return
+        run, token = self._begin_run()
+        try:
+            my_kwargs = {**run.dump, **kwargs}
+            parts: Iterable[SerializationResult]
+            if _get_defining_class(cls, "get_parts") is DocSerializer:
+                parts = self._iter_parts(**my_kwargs)
+            else:
+                parts = self.get_parts(**my_kwargs)
+            self._write_doc(fw=fw, parts=parts, **my_kwargs)
+        finally:
+            if token is not None:
+                self._end_run(token)
+
+    def _write_doc(
+        self,
+        fw: TextIO,
+        parts: Iterable[SerializationResult],
+        **kwargs: Any,
+    ) -> None:
+        """Write a document out of its parts to a text stream, like serialize_doc().
+
+        To be overridden for streaming the parts as they are serialized; this
+        implementation collects them first.
+        """
+        fw.write(self.serialize_doc(parts=list(parts), **kwargs).text)
+
+    def _iter_segments(
+        self,
+        parts: Iterable[SerializationResult],
+        delim: str,
+    ) -> Iterator[Union[str, _PageBreakNode]]:
+        # the texts of the non-empty parts joined with the delimiter, as segments
+        # separated by the page breaks, whether parts of their own or within a part
+        first = True
+        for part in parts:
+            if not part.text:
+                continue
+            if not first:
+                yield delim
+            first = False
+            if isinstance(part, _PageBreakSerResult):
+                yield part.node
+            elif isinstance(part, _PagedSerResult):
+                text = part.text
+                pos = 0
+                for page_break in part.page_breaks:
+                    ix = text.find(page_break.text, pos)
+                    if ix >= 0:  # unless left out, e.g. by a custom serializer
+                        yield text[pos:ix]
+                        yield page_break.node
+                        pos = ix + len(page_break.text)
+                yield text[pos:]
+            else:
+                yield part.text
+
+    def _join_parts(
+        self,
+        parts: Iterable[SerializationResult],
+        delim: str,
+        page_sep: str = "",
+    ) -> str:
+        # the texts of the non-empty parts joined with the delimiter, with the page
+        # breaks replaced by the passed separator
+        return "".join(
+            seg if isinstance(seg, str) else page_sep
+            for seg in self._iter_segments(parts=parts, delim=delim)
+        )
+
+    def _write_parts(
+        self,
+        fw: TextIO,
+        parts: Iterable[SerializationResult],
+        delim: str,
+        page_sep: str = "",
+    ) -> None:
+        # like _join_parts(), writing to the text stream
+        for seg in self._iter_segments(parts=parts, delim=delim):
+            fw.write(seg if isinstance(seg, str) else page_sep)
 
     @override
     def post_process(
@@ -446,7 +853,7 @@ class DocSerializer(BaseModel, BaseDocSerializer):
         **kwargs: Any,
     ) -> str:
         """Apply some text post-processing steps."""
-        params = self.params.merge_with_patch(patch=kwargs)
+        params = self._merge_params(kwargs)
         res = text
         if params.include_formatting and formatting:
             if formatting.bold:
@@ -512,7 +919,7 @@ class DocSerializer(BaseModel, BaseDocSerializer):
         **kwargs: Any,
     ) -> SerializationResult:
         """Serialize the item's captions."""
-        params = self.params.merge_with_patch(patch=kwargs)
+        params = self._merge_params(kwargs)
         results: list[SerializationResult] = []
         if DocItemLabel.CAPTION in params.labels:
             results = [
@@ -565,12 +972,3 @@ class DocSerializer(BaseModel, BaseDocSerializer):
 
     def _create_page_break(self, node: _PageBreakNode) -> str:
         return f"#_#_DOCLING_DOC_PAGE_BREAK_{node.prev_page}_{node.next_page}_#_#"
-
-    def _get_page_breaks(self, text: str) -> Iterable[Tuple[str, int, int]]:
-        pattern = r"#_#_DOCLING_DOC_PAGE_BREAK_(\d+)_(\d+)_#_#"
-        matches = re.finditer(pattern, text)
-        for match in matches:
-            full_match = match.group(0)
-            prev_page_nr = int(match.group(1))
-            next_page_nr = int(match.group(2))
-            yield (full_match, prev_page_nr, next_page_nr)
@@ -1,7 +1,8 @@
 """Define classes for Doctags serialization."""
 
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from functools import cached_property
+from typing import Any, Dict, Iterable, List, Optional, TextIO
 
 from pydantic import BaseModel
 from typing_extensions import override
@@ -24,6 +25,7 @@ from docling_core.transforms.serializer.common import (
     CommonParams,
     DocSerializer,
     create_ser_result,
+    resolve_params,
 )
 from docling_core.types.doc.base import BoundingBox
 from docling_core.types.doc.document import (
@@ -44,6 +46,7 @@ from docling_core.types.doc.document import (
     ProvenanceItem,
     TableItem,
     TextItem,
+    _create_rich_cell_serializer,
 )
 from docling_core.types.doc.labels import DocItemLabel, PictureClassificationLabel
 from docling_core.types.doc.tokens import DocumentToken
@@ -99,7 +102,9 @@ class DocTagsTextSerializer(BaseModel, BaseTextSerializer):
         """Serializes the passed item."""
         from docling_core.types.doc.document import SectionHeaderItem
 
-        params = DocTagsParams(**kwargs)
+        params = resolve_params(
+            params_type=DocTagsParams, doc_serializer=doc_serializer, kwargs=kwargs
+        )
         wrap_tag: Optional[str] = DocumentToken.create_token_name_from_doc_item_label(
             label=item.label,
             **({"level": item.level} if isinstance(item, SectionHeaderItem) else {}),
@@ -161,7 +166,9 @@ class DocTagsTableSerializer(BaseTableSerializer):
         **kwargs: Any,
     ) -> SerializationResult:
         """Serializes the passed item."""
-        params = DocTagsParams(**kwargs)
+        params = resolve_params(
+            params_type=DocTagsParams, doc_serializer=doc_serializer, kwargs=kwargs
+        )
 
         res_parts: list[SerializationResult] = []
 
@@ -180,6 +187,11 @@ class DocTagsTableSerializer(BaseTableSerializer):
                 add_cell_text=params.add_table_cell_text,
                 xsize=params.xsize,
                 ysize=params.ysize,
+                doc_serializer=(
+                    doc_serializer._rich_cell_serializer
+                    if isinstance(doc_serializer, DocTagsDocSerializer)
+                    else None
+                ),
                 visited=visited,
             )
             res_parts.append(create_ser_result(text=otsl_text, span_source=item))
@@ -209,7 +221,9 @@ class DocTagsPictureSerializer(BasePictureSerializer):
         **kwargs: Any,
     ) -> SerializationResult:
         """Serializes the passed item."""
-        params = DocTagsParams(**kwargs)
+        params = resolve_params(
+            params_type=DocTagsParams, doc_serializer=doc_serializer, kwargs=kwargs
+        )
         res_parts: list[SerializationResult] = []
         is_chart = False
 
@@ -292,7 +306,9 @@ class DocTagsKeyValueSerializer(BaseKeyValueSerializer):
         **kwargs: Any,
     ) -> SerializationResult:
         """Serializes the passed item."""
-        params = DocTagsParams(**kwargs)
+        params = resolve_params(
+            params_type=DocTagsParams, doc_serializer=doc_serializer, kwargs=kwargs
+        )
         body = ""
         results: list[SerializationResult] = []
 
@@ -387,7 +403,9 @@ class DocTagsListSerializer(BaseModel, BaseListSerializer):
     ) -> SerializationResult:
         """Serializes the passed item."""
         my_visited = visited if visited is not None else set()
-        params = DocTagsParams(**kwargs)
+        params = resolve_params(
+            params_type=DocTagsParams, doc_serializer=doc_serializer, kwargs=kwargs
+        )
         parts = doc_serializer.get_parts(
             item=item,
             list_level=list_level + 1,
@@ -465,7 +483,9 @@ class DocTagsInlineSerializer(BaseInlineSerializer):
     ) -> SerializationResult:
         """Serializes the passed item."""
         my_visited = visited if visited is not None else set()
-        params = DocTagsParams(**kwargs)
+        params = resolve_params(
+            params_type=DocTagsParams, doc_serializer=doc_serializer, kwargs=kwargs
+        )
         parts: List[SerializationResult] = []
         if params.add_location:
             inline_loc_tags_ser_res = self._get_inline_location_tags(
@@ -474,7 +494,8 @@ class DocTagsInlineSerializer(BaseInlineSerializer):
                 params=params,
             )
             parts.append(inline_loc_tags_ser_res)
-            params.add_location = False  # suppress children location serialization
+            # suppress children location serialization
+            params = params.model_copy(update={"add_location": False})
         parts.extend(
             doc_serializer.get_parts(
                 item=item,
@@ -535,6 +556,12 @@ class DocTagsDocSerializer(DocSerializer):
 
     params: DocTagsParams = DocTagsParams()
 
+    @cached_property
+    def _rich_cell_serializer(self) -> BaseDocSerializer:
+        # rich table cells are serialized to Markdown within OTSL, with a serializer
+        # shared by all of them
+        return _create_rich_cell_serializer(doc=self.doc)
+
     @override
     def serialize_doc(
         self,
@@ -544,17 +571,35 @@ class DocTagsDocSerializer(DocSerializer):
     ) -> SerializationResult:
         """Serialize a document out of its pages."""
         delim = _get_delim(params=self.params)
-        text_res = delim.join([p.text for p in parts if p.text])
-
-        if self.params.add_page_break:
-            page_sep = f"<{DocumentToken.PAGE_BREAK.value}>"
-            for full_match, _, _ in self._get_page_breaks(text=text_res):
-                text_res = text_res.replace(full_match, page_sep)
+        text_res = self._join_parts(
+            parts=parts,
+            delim=delim,
+            page_sep=f"<{DocumentToken.PAGE_BREAK.value}>",
+        )
 
         wrap_tag = DocumentToken.DOCUMENT.value
         text_res = f"<{wrap_tag}>{text_res}{delim}</{wrap_tag}>"
         return create_ser_result(text=text_res, span_source=parts)
 
+    @override
+    def _write_doc(
+        self,
+        fw: TextIO,
+        parts: Iterable[SerializationResult],
+        **kwargs: Any,
+    ) -> None:
+        """Write a document out of its parts to a text stream, like serialize_doc()."""
+        delim = _get_delim(params=self.params)
+        wrap_tag = DocumentToken.DOCUMENT.value
+        fw.write(f"<{wrap_tag}>")
+        self._write_parts(
+            fw=fw,
+            parts=parts,
+            delim=delim,
+            page_sep=f"<{DocumentToken.PAGE_BREAK.value}>",
+        )
+        fw.write(f"{delim}</{wrap_tag}>")
+
     @override
     def serialize_captions(
         self,
@@ -562,7 +607,7 @@ class DocTagsDocSerializer(DocSerializer):
         **kwargs: Any,
     ) -> SerializationResult:
         """Serialize the item's captions."""
-        params = DocTagsParams(**kwargs)
+        params = self._validate_params(params_type=DocTagsParams, kwargs=kwargs)
         results: list[SerializationResult] = []
         if item.captions:
             cap_res = super().serialize_captions(item, **kwargs)
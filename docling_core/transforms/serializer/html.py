@@ -10,7 +10,7 @@ import logging
 from enum import Enum
 from io import BytesIO
 from pathlib import Path
-from typing import Any, Optional, Union
+from typing import Any, Iterable, Optional, TextIO, Union, cast
 from urllib.parse import quote
 from xml.etree.cElementTree import SubElement, tostring
 from xml.sax.saxutils import unescape
@@ -38,6 +38,7 @@ from docling_core.transforms.serializer.common import (
     DocSerializer,
     _get_annotation_text,
     create_ser_result,
+    resolve_params,
 )
 from docling_core.transforms.serializer.html_styles import (
     _get_css_for_single_column,
@@ -135,7 +136,9 @@ class HTMLTextSerializer(BaseModel, BaseTextSerializer):
         **kwargs: Any,
     ) -> SerializationResult:
         """Serializes the passed text item to HTML."""
-        params = HTMLParams(**kwargs)
+        params = resolve_params(
+            params_type=HTMLParams, doc_serializer=doc_serializer, kwargs=kwargs
+        )
         my_visited: set[str] = visited if visited is not None else set()
         res_parts: list[SerializationResult] = []
         post_processed = False
@@ -359,10 +362,11 @@ class HTMLTableSerializer(BaseTableSerializer):
             body = ""
             span_source: Union[DocItem, list[SerializationResult]] = []
 
+            grid = item.data.grid
             for i in range(nrows):
                 body += "<tr>"
                 for j in range(ncols):
-                    cell: TableCell = item.data.grid[i][j]
+                    cell: TableCell = grid[i][j]
 
                     rowspan, rowstart = (
                         cell.row_span,
@@ -435,7 +439,9 @@ class HTMLPictureSerializer(BasePictureSerializer):
             row += "</td></tr>\n"
             return row
 
-        params = HTMLParams(**kwargs)
+        params = resolve_params(
+            params_type=HTMLParams, doc_serializer=doc_serializer, kwargs=kwargs
+        )
 
         res_parts: list[SerializationResult] = []
 
@@ -932,21 +938,7 @@ class HTMLDocSerializer(DocSerializer):
 
         if self.params.output_style == HTMLOutputStyle.SPLIT_PAGE:
             applicable_pages = self._get_applicable_pages()
-
-            html_content = "\n".join([p.text for p in parts if p.text])
-            next_page: Optional[int] = None
-            prev_full_match_end = 0
-            pages = {}
-            for full_match, prev_page, next_page in self._get_page_breaks(html_content):
-                this_match_start = html_content.find(full_match)
-                pages[prev_page] = html_content[prev_full_match_end:this_match_start]
-                prev_full_match_end = this_match_start + len(full_match)
-
-            # capture last page
-            if next_page is not None:
-                pages[next_page] = html_content[prev_full_match_end:]
-            elif applicable_pages is not None and len(applicable_pages) == 1:
-                pages[applicable_pages[0]] = html_content
+            pages = self._split_pages(parts=parts, applicable_pages=applicable_pages)
 
             html_parts.append("<table>")
             html_parts.append("<tbody>")
@@ -1015,6 +1007,47 @@ class HTMLDocSerializer(DocSerializer):
 
         return create_ser_result(text=html_content, span_source=parts)
 
+    def _split_pages(
+        self,
+        parts: list[SerializationResult],
+        applicable_pages: Optional[list[int]],
+    ) -> dict[Optional[int], str]:
+        """Split the joined texts of the parts into pages at their page breaks."""
+        next_page: Optional[int] = None
+        pages: dict[Optional[int], str] = {}
+        page_texts: list[str] = []
+        for seg in self._iter_segments(parts=parts, delim="\n"):
+            if isinstance(seg, str):
+                page_texts.append(seg)
+            else:
+                pages[seg.prev_page] = "".join(page_texts)
+                page_texts = []
+                next_page = seg.next_page
+
+        # capture last page
+        if next_page is not None:
+            pages[next_page] = "".join(page_texts)
+        elif applicable_pages is not None and len(applicable_pages) == 1:
+            pages[applicable_pages[0]] = "".join(page_texts)
+        return pages
+
+    @override
+    def _write_doc(
+        self,
+        fw: TextIO,
+        parts: Iterable[SerializationResult],
+        **kwargs: Any,
+    ) -> None:
+        """Write a document out of its parts to a text stream, like serialize_doc()."""
+        if self.params.output_style != HTMLOutputStyle.SINGLE_COLUMN:
+            # the split-page view needs all pages before laying them out
+            super()._write_doc(fw=fw, parts=parts, **kwargs)
+            return
+        fw.write(f"<!DOCTYPE html>\n<html>\n{self._generate_head()}\n<body>\n")
+        fw.write("<div class='page'>\n")
+        self._write_parts(fw=fw, parts=parts, delim="\n")
+        fw.write("\n</div>\n</body>\n</html>")
+
     @override
     def serialize_captions(
         self,
@@ -1023,7 +1056,7 @@ class HTMLDocSerializer(DocSerializer):
         **kwargs: Any,
     ) -> SerializationResult:
         """Serialize the item's captions."""
-        params = self.params.merge_with_patch(patch=kwargs)
+        params = cast(HTMLParams, self._merge_params(kwargs))
         results: list[SerializationResult] = []
         text_res = ""
         excluded_refs = self.get_excluded_refs(**kwargs)
@@ -9,7 +9,7 @@ import re
 import textwrap
 from enum import Enum
 from pathlib import Path
-from typing import Any, Optional, Union
+from typing import Any, Iterable, Optional, TextIO, Union, cast
 
 from pydantic import AnyUrl, BaseModel, PositiveInt
 from tabulate import tabulate
@@ -33,6 +33,7 @@ from docling_core.transforms.serializer.common import (
     DocSerializer,
     _get_annotation_text,
     create_ser_result,
+    resolve_params,
 )
 from docling_core.types.doc.base import ImageRefMode
 from docling_core.types.doc.document import (
@@ -122,7 +123,9 @@ class MarkdownTextSerializer(BaseModel, BaseTextSerializer):
     ) -> SerializationResult:
         """Serializes the passed item."""
         my_visited = visited if visited is not None else set()
-        params = MarkdownParams(**kwargs)
+        params = resolve_params(
+            params_type=MarkdownParams, doc_serializer=doc_serializer, kwargs=kwargs
+        )
         res_parts: list[SerializationResult] = []
         text = item.text
         escape_html = True
@@ -296,7 +299,9 @@ class MarkdownTableSerializer(BaseTableSerializer):
         **kwargs: Any,
     ) -> SerializationResult:
         """Serializes the passed item."""
-        params = MarkdownParams(**kwargs)
+        params = resolve_params(
+            params_type=MarkdownParams, doc_serializer=doc_serializer, kwargs=kwargs
+        )
         res_parts: list[SerializationResult] = []
 
         cap_res = doc_serializer.serialize_captions(
@@ -365,7 +370,9 @@ class MarkdownPictureSerializer(BasePictureSerializer):
         **kwargs: Any,
     ) -> SerializationResult:
         """Serializes the passed item."""
-        params = MarkdownParams(**kwargs)
+        params = resolve_params(
+            params_type=MarkdownParams, doc_serializer=doc_serializer, kwargs=kwargs
+        )
 
         res_parts: list[SerializationResult] = []
 
@@ -525,7 +532,9 @@ class MarkdownListSerializer(BaseModel, BaseListSerializer):
         **kwargs: Any,
     ) -> SerializationResult:
         """Serializes the passed item."""
-        params = MarkdownParams(**kwargs)
+        params = resolve_params(
+            params_type=MarkdownParams, doc_serializer=doc_serializer, kwargs=kwargs
+        )
         my_visited = visited if visited is not None else set()
         parts = doc_serializer.get_parts(
             item=item,
@@ -688,7 +697,7 @@ class MarkdownDocSerializer(DocSerializer):
     ) -> str:
         """Apply some text post-processing steps."""
         res = text
-        params = self.params.merge_with_patch(patch=kwargs)
+        params = cast(MarkdownParams, self._merge_params(kwargs))
         if escape_underscores and params.escape_underscores:
             res = self._escape_underscores(text)
         if escape_html and params.escape_html:
@@ -708,14 +717,28 @@ class MarkdownDocSerializer(DocSerializer):
         **kwargs: Any,
     ) -> SerializationResult:
         """Serialize a document out of its parts."""
-        text_res = "\n\n".join([p.text for p in parts if p.text])
-        if self.requires_page_break():
-            page_sep = self.params.page_break_placeholder or ""
-            for full_match, _, _ in self._get_page_breaks(text=text_res):
-                text_res = text_res.replace(full_match, page_sep)
-
+        text_res = self._join_parts(
+            parts=parts,
+            delim="\n\n",
+            page_sep=self.params.page_break_placeholder or "",
+        )
         return create_ser_result(text=text_res, span_source=parts)
 
+    @override
+    def _write_doc(
+        self,
+        fw: TextIO,
+        parts: Iterable[SerializationResult],
+        **kwargs: Any,
+    ) -> None:
+        """Write a document out of its parts to a text stream, like serialize_doc()."""
+        self._write_parts(
+            fw=fw,
+            parts=parts,
+            delim="\n\n",
+            page_sep=self.params.page_break_placeholder or "",
+        )
+
     @override
     def requires_page_break(self) -> bool:
         """Whether to add page breaks."""
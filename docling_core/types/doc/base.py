@@ -28,6 +28,13 @@ class PydanticSerCtxKey(str, Enum):
     CONFID_PREC = "confid_prec"  # key for confidence values precision
 
 
+class PydanticValCtxKey(str, Enum):
+    """Pydantic validation context keys."""
+
+    TRUSTED = "trusted"  # key for skipping the document consistency checks
+    LAZY_IMAGES = "lazy_images"  # key for the image data URIs left in the source
+
+
 def round_pydantic_float(
     val: float, ctx: Any, precision_ctx_key: PydanticSerCtxKey
 ) -> float:
@@ -2,19 +2,37 @@
 
 import base64
 import copy
+import gzip
 import hashlib
+import itertools
 import json
 import logging
 import mimetypes
+import operator
 import os
 import re
 import sys
 import typing
 import warnings
+from array import array
+from contextlib import contextmanager
 from enum import Enum
 from io import BytesIO
 from pathlib import Path
-from typing import Any, Dict, Final, List, Literal, Optional, Sequence, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Final,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    TextIO,
+    Tuple,
+    Union,
+)
 from urllib.parse import unquote
 
 import pandas as pd
@@ -26,7 +44,9 @@ from pydantic import (
     ConfigDict,
     Field,
     FieldSerializationInfo,
+    PrivateAttr,
     StringConstraints,
+    ValidationInfo,
     computed_field,
     field_serializer,
     field_validator,
@@ -43,6 +63,7 @@ from docling_core.types.doc.base import (
     CoordOrigin,
     ImageRefMode,
     PydanticSerCtxKey,
+    PydanticValCtxKey,
     round_pydantic_float,
 )
 from docling_core.types.doc.labels import (
@@ -56,6 +77,12 @@ from docling_core.types.doc.labels import (
 from docling_core.types.doc.tokens import DocumentToken, TableToken
 from docling_core.types.doc.utils import parse_otsl_table_content, relative_path
 
+if TYPE_CHECKING:
+    from docling_core.transforms.serializer.base import BaseDocSerializer
+    from docling_core.transforms.serializer.doctags import DocTagsDocSerializer
+    from docling_core.transforms.serializer.html import HTMLDocSerializer
+    from docling_core.transforms.serializer.markdown import MarkdownDocSerializer
+
 _logger = logging.getLogger(__name__)
 
 Uint64 = typing.Annotated[int, Field(ge=0, le=(2**64 - 1))]
@@ -92,6 +119,31 @@ DOCUMENT_TOKENS_EXPORT_LABELS.update(
 )
 
 
+class _ModelCache(dict):
+    """Store for data derived from a model, kept in a pydantic private attribute.
+
+    A cache never takes part in model equality and is never carried over by copying
+    or pickling; its owner is expected to rebuild the entries lazily.
+    """
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _ModelCache)
+
+    def __ne__(self, other: object) -> bool:
+        return not isinstance(other, _ModelCache)
+
+    def __copy__(self) -> "_ModelCache":
+        return type(self)()
+
+    def __deepcopy__(self, memo: dict) -> "_ModelCache":
+        return type(self)()
+
+    def __reduce__(self):
+        return (type(self), ())
+
+
 class BaseAnnotation(BaseModel):
     """Base class for all annotation types."""
 
@@ -347,17 +399,29 @@ class RichTableCell(TableCell):
     ref: "RefItem"
 
     @override
-    def _get_text(self, doc: Optional["DoclingDocument"] = None, **kwargs: Any) -> str:
-        from docling_core.transforms.serializer.markdown import MarkdownDocSerializer
-
+    def _get_text(
+        self,
+        doc: Optional["DoclingDocument"] = None,
+        doc_serializer: Optional["BaseDocSerializer"] = None,
+        **kwargs: Any,
+    ) -> str:
         if doc is not None:
-            doc_serializer = MarkdownDocSerializer(doc=doc)
+            if doc_serializer is None:
+                doc_serializer = _create_rich_cell_serializer(doc=doc)
             ser_res = doc_serializer.serialize(item=self.ref.resolve(doc=doc), **kwargs)
             return ser_res.text
         else:
             return "<!-- rich cell -->"
 
 
+def _create_rich_cell_serializer(doc: "DoclingDocument") -> "BaseDocSerializer":
+    # the serializer of the text of rich cells; to be shared by all the rich cells
+    # serialized together, as it traverses the whole document on first use
+    from docling_core.transforms.serializer.markdown import MarkdownDocSerializer
+
+    return MarkdownDocSerializer(doc=doc)
+
+
 AnyTableCell = Annotated[
     Union[RichTableCell, TableCell],
     Field(union_mode="left_to_right"),
@@ -371,12 +435,57 @@ class TableData(BaseModel):  # TBD
     num_rows: int = 0
     num_cols: int = 0
 
+    _cache: _ModelCache = PrivateAttr(default_factory=_ModelCache)
+
     @computed_field  # type: ignore
     @property
     def grid(
         self,
     ) -> List[List[TableCell]]:
-        """grid."""
+        """grid.
+
+        The grid is built on first access and reused until the table structure
+        changes, hence it must be treated as read-only. Changes of the cell list,
+        in place or not, are detected, while the offsets of a cell in the list must
+        not be edited in place; replace the cell instead.
+        """
+        return self._get_grid_and_index()[0]
+
+    def get_cell_index(self, row_idx: int, col_idx: int) -> Optional[int]:
+        """Get the index in `table_cells` of the cell covering a grid position.
+
+        :param row_idx: int: The row of the grid position. (Starting from 0)
+        :param col_idx: int: The column of the grid position. (Starting from 0)
+
+        :returns: Optional[int]: The index of the covering cell, or None if the
+            position is not covered by any cell.
+        """
+        if not (0 <= row_idx < self.num_rows and 0 <= col_idx < self.num_cols):
+            raise IndexError(
+                f"Position ({row_idx}, {col_idx}) is out of bounds for table of size "
+                f"{self.num_rows}x{self.num_cols}."
+            )
+        cell_idx = self._get_grid_and_index()[1][row_idx * self.num_cols + col_idx]
+        return cell_idx if cell_idx >= 0 else None
+
+    def _invalidate_grid(self) -> None:
+        """Drop the cached grid, e.g. after modifying the table structure."""
+        self._cache.clear()
+
+    def _get_grid_and_index(self) -> Tuple[List[List[TableCell]], "array[int]"]:
+        """Get the grid together with its row-major matrix of cell indices."""
+        # direct edits of the cell list, in place or not, or of the table size (not
+        # going through the methods of this class) are detected as well, comparing
+        # the cells by identity against a snapshot of the list
+        key = (len(self.table_cells), self.num_rows, self.num_cols)
+        cells = self._cache.get("cells")
+        if (
+            cells is not None
+            and self._cache["key"] == key
+            and all(map(operator.is_, cells, self.table_cells))
+        ):
+            return self._cache["grid"], self._cache["index"]
+
         # Initialise empty table data grid (only empty cells)
         table_data = [
             [
@@ -391,9 +500,10 @@ class TableData(BaseModel):  # TBD
             ]
             for i in range(self.num_rows)
         ]
+        cell_index = array("i", [-1]) * (self.num_rows * self.num_cols)
 
         # Overwrite cells in table data for which there is actual cell content.
-        for cell in self.table_cells:
+        for cell_idx, cell in enumerate(self.table_cells):
             for i in range(
                 min(cell.start_row_offset_idx, self.num_rows),
                 min(cell.end_row_offset_idx, self.num_rows),
@@ -403,8 +513,12 @@ class TableData(BaseModel):  # TBD
                     min(cell.end_col_offset_idx, self.num_cols),
                 ):
                     table_data[i][j] = cell
+                    cell_index[i * self.num_cols + j] = cell_idx
 
-        return table_data
+        self._cache.update(
+            cells=list(self.table_cells), key=key, grid=table_data, index=cell_index
+        )
+        return table_data, cell_index
 
     def remove_rows(
         self, indices: List[int], doc: Optional["DoclingDocument"] = None
@@ -450,6 +564,8 @@ class TableData(BaseModel):  # TBD
 
             all_removed_cells.append(removed_cells)
 
+        self._invalidate_grid()
+
         if refs_to_remove:
             if doc is None:
                 _logger.warning(
@@ -543,6 +659,7 @@ class TableData(BaseModel):  # TBD
             cell.end_row_offset_idx = new_index + 1
 
         self.num_rows += 1
+        self._invalidate_grid()
 
     def add_rows(self, rows: List[List[str]]) -> None:
         """Add multiple new rows to the table from a list of lists of strings.
@@ -795,6 +912,107 @@ class RefItem(BaseModel):
         return obj
 
 
+# AnyUrl wraps the core URL in a Python class, which can be derived, since 2.10
+_LAZY_DATA_URL_SUPPORTED: Final = AnyUrl.__module__ == "pydantic.networks"
+
+# the JSON string value of a "uri" key holding a data URL
+_DATA_URI_PATTERN: Final = re.compile(rb'"uri":\s*"(data:[^"\\]*(?:\\.[^"\\]*)*)"')
+
+
+class _LazyDataUrl(AnyUrl):
+    """Data URL of an embedded image, left in the JSON file it was loaded from.
+
+    Only the position of the URL in the file is kept, or its raw bytes for compressed
+    files, until the URL is first accessed; it is then read and parsed once.
+    """
+
+    def __init__(
+        self,
+        source: Union[Path, bytes],
+        offset: int = 0,
+        length: int = 0,
+        stamp: Optional[tuple[int, int]] = None,
+    ) -> None:
+        self._source = source
+        self._offset = offset
+        self._length = length
+        self._stamp = stamp
+        self._parsed: Optional[AnyUrl] = None
+
+    def read(self) -> str:
+        """Read the data URL from the source."""
+        if isinstance(self._source, bytes):
+            raw = self._source
+        else:
+            stat = self._source.stat()
+            if (stat.st_size, stat.st_mtime_ns) != self._stamp:
+                raise RuntimeError(
+                    f"Cannot read image: {self._source} changed since it was loaded"
+                )
+            with open(self._source, "rb") as f:
+                f.seek(self._offset)
+                raw = f.read(self._length)
+        if b"\\" in raw:  # JSON escape sequences
+            return json.loads(b'"' + raw + b'"')
+        return raw.decode("utf-8")
+
+    @property  # type: ignore[override]
+    def _url(self):
+        if self._parsed is None:
+            self._parsed = AnyUrl(self.read())
+        return self._parsed._url
+
+    @property
+    def scheme(self) -> str:
+        """The scheme of the URL, always "data"."""
+        return "data"
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, AnyUrl) and self._url == other._url
+
+    __hash__ = AnyUrl.__hash__
+
+    def __deepcopy__(self, memo: dict) -> AnyUrl:  # type: ignore[override]
+        # a copy does not depend on the source file
+        return AnyUrl(self._url)
+
+
+def _extract_data_uris(
+    json_data: bytes, source: Optional[Path]
+) -> tuple[bytes, dict[str, _LazyDataUrl]]:
+    """Replace the data URIs in a JSON document with placeholders.
+
+    :param json_data: The JSON document.
+    :param source: The file holding json_data, or None to keep the data URIs in
+        memory.
+
+    :returns: The JSON document with placeholders, and the lazy data URLs by
+        placeholder.
+    """
+    stamp = None
+    if source is not None:
+        source = source.resolve()
+        stat = source.stat()
+        stamp = (stat.st_size, stat.st_mtime_ns)
+    parts: list[bytes] = []
+    lazy_urls: dict[str, _LazyDataUrl] = {}
+    pos = 0
+    for match in _DATA_URI_PATTERN.finditer(json_data):
+        start, end = match.span(1)
+        placeholder = f"data:,{len(lazy_urls)}"
+        if source is None:
+            lazy_urls[placeholder] = _LazyDataUrl(json_data[start:end])
+        else:
+            lazy_urls[placeholder] = _LazyDataUrl(
+                source, offset=start, length=end - start, stamp=stamp
+            )
+        parts.append(json_data[pos:start])
+        parts.append(placeholder.encode())
+        pos = end
+    parts.append(json_data[pos:])
+    return b"".join(parts), lazy_urls
+
+
 class ImageRef(BaseModel):
     """ImageRef."""
 
@@ -823,6 +1041,19 @@ class ImageRef(BaseModel):
 
         return self._pil
 
+    @field_validator("uri", mode="wrap")
+    @classmethod
+    def validate_uri(cls, v, handler, info: ValidationInfo):
+        """Resolve the placeholders of the data URIs left in the source file."""
+        if (
+            isinstance(v, str)
+            and isinstance(info.context, dict)
+            and (lazy_urls := info.context.get(PydanticValCtxKey.LAZY_IMAGES.value))
+            and v in lazy_urls
+        ):
+            return lazy_urls.pop(v)
+        return handler(v)
+
     @field_validator("mimetype")
     @classmethod
     def validate_mimetype(cls, v):
@@ -1556,6 +1787,16 @@ class TableItem(FloatingItem):
 
     annotations: List[TableAnnotationType] = []
 
+    def _get_rich_cell_serializer(
+        self, doc: Optional["DoclingDocument"]
+    ) -> Optional["BaseDocSerializer"]:
+        """Get a serializer to share among the rich cells of the table, if any."""
+        if doc is None or not any(
+            isinstance(cell, RichTableCell) for cell in self.data.table_cells
+        ):
+            return None
+        return _create_rich_cell_serializer(doc=doc)
+
     def export_to_dataframe(
         self, doc: Optional["DoclingDocument"] = None
     ) -> pd.DataFrame:
@@ -1569,8 +1810,9 @@ class TableItem(FloatingItem):
             return pd.DataFrame()
 
         # Count how many rows are column headers
+        grid = self.data.grid
         num_headers = 0
-        for i, row in enumerate(self.data.grid):
+        for i, row in enumerate(grid):
             if len(row) == 0:
                 raise RuntimeError(
                     f"Invalid table. {len(row)=} but {self.data.num_cols=}."
@@ -1587,21 +1829,23 @@ class TableItem(FloatingItem):
             else:
                 break
 
+        rich_cell_ser = self._get_rich_cell_serializer(doc=doc)
+
         # Create the column names from all col_headers
         columns: Optional[List[str]] = None
         if num_headers > 0:
             columns = ["" for _ in range(self.data.num_cols)]
             for i in range(num_headers):
-                for j, cell in enumerate(self.data.grid[i]):
-                    col_name = cell._get_text(doc=doc)
+                for j, cell in enumerate(grid[i]):
+                    col_name = cell._get_text(doc=doc, doc_serializer=rich_cell_ser)
                     if columns[j] != "":
                         col_name = f".{col_name}"
                     columns[j] += col_name
 
         # Create table data
         table_data = [
-            [cell._get_text(doc=doc) for cell in row]
-            for row in self.data.grid[num_headers:]
+            [cell._get_text(doc=doc, doc_serializer=rich_cell_ser) for cell in row]
+            for row in grid[num_headers:]
         ]
 
         # Create DataFrame
@@ -1678,9 +1922,14 @@ class TableItem(FloatingItem):
         add_cell_text: bool = True,
         xsize: int = 500,
         ysize: int = 500,
+        doc_serializer: Optional["BaseDocSerializer"] = None,
         **kwargs: Any,
     ) -> str:
-        """Export the table as OTSL."""
+        """Export the table as OTSL.
+
+        The text of rich cells is serialized with `doc_serializer` if passed, else
+        with a Markdown serializer shared by all the rich cells of the table.
+        """
         # Possible OTSL tokens...
         #
         # Empty and full cells:
@@ -1705,10 +1954,16 @@ class TableItem(FloatingItem):
         if len(self.prov) > 0:
             page_no = self.prov[0].page_no
 
+        if doc_serializer is None:
+            doc_serializer = self._get_rich_cell_serializer(doc=doc)
+
+        grid = self.data.grid
         for i in range(nrows):
             for j in range(ncols):
-                cell: TableCell = self.data.grid[i][j]
-                content = cell._get_text(doc=doc, **kwargs).strip()
+                cell: TableCell = grid[i][j]
+                content = cell._get_text(
+                    doc=doc, doc_serializer=doc_serializer, **kwargs
+                ).strip()
                 rowspan, rowstart = (
                     cell.row_span,
                     cell.start_row_offset_idx,
@@ -1951,6 +2206,14 @@ class PageItem(BaseModel):
     page_no: int
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
+
+def _is_trusted(info: ValidationInfo) -> bool:
+    """Whether the validation context marks the input as trusted."""
+    return isinstance(info.context, dict) and bool(
+        info.context.get(PydanticValCtxKey.TRUSTED.value)
+    )
+
+
 class DoclingDocument(BaseModel):
     """DoclingDocument."""
 
@@ -1984,6 +2247,10 @@ class DoclingDocument(BaseModel):
 
     pages: Dict[int, PageItem] = {}  # empty as default
 
+    _cache: _ModelCache = PrivateAttr(default_factory=_ModelCache)
+    # crefs of the items deleted within a batch edit, None outside of a batch edit
+    _batch_deletions: Optional[list[str]] = PrivateAttr(default=None)
+
     @model_validator(mode="before")
     @classmethod
     def transform_to_content_layer(cls, data: dict) -> dict:
@@ -2024,12 +2291,10 @@ class DoclingDocument(BaseModel):
         self._append_item(item=child, parent_ref=parent.get_ref())
 
         # Update the tree of the doc
-        success = self.body._add_child(doc=self, new_ref=child.get_ref(), stack=stack)
-
-        # Clean the attribute (orphan) if not successful
-        if not success:
-            self._pop_item(item=child)
-            raise ValueError(f"Could not append child: {child} to parent: {parent}")
+        tree_parent = parent.get_ref().resolve(doc=self)
+        self._insert_children_at(
+            parent=tree_parent, slot=len(tree_parent.children), refs=[child.get_ref()]
+        )
 
     def insert_item_after_sibling(
         self, *, new_item: NodeItem, sibling: NodeItem
@@ -2056,49 +2321,223 @@ class DoclingDocument(BaseModel):
         self.insert_item_after_sibling(new_item=new_item, sibling=old_item)
         self.delete_items(node_items=[old_item])
 
+    @contextmanager
+    def batch_edit(self) -> Iterator["DoclingDocument"]:
+        """Group several manipulations into a single transaction.
+
+        Within the context, deletions (including the ones of `replace_item`,
+        `delete_items_range`, etc.) only detach the items from the tree; the removal
+        of the items and the renumbering of the references run once, when the
+        context exits, and the tree is validated afterwards. The resulting document
+        is the same as when applying the manipulations one at a time.
+
+        Only deletions are deferred: additions and insertions (e.g. through `add_*`
+        and `insert_*`) apply immediately, as outside of a batch.
+
+        If any manipulation (or any other code in the context) raises, the document
+        is rolled back to its state at entry, additions included, and the exception
+        is re-raised. The item (and page) instances of the document at entry are
+        restored in place, hence references to them held by the caller remain
+        valid; instances created within the context do not belong to the rolled
+        back document.
+
+        To this end, the outermost context takes a deep copy of the document at
+        entry, which costs time and memory proportional to the size of the
+        document, whatever the edits. The images of the items and pages (which no
+        manipulation edits) are not copied but shared with the snapshot, hence
+        in-place edits of an `ImageRef` within the context are not rolled back.
+
+        References to the items are renumbered only at exit, hence crefs taken
+        within the context must not be resolved after it. Nested contexts are merged
+        into the outermost one.
+
+        Example:
+            with doc.batch_edit():
+                doc.delete_items(node_items=[header, footer])
+                doc.replace_item(new_item=new_text, old_item=old_text)
+        """
+        if self._batch_deletions is not None:  # nested: part of the outer batch
+            yield self
+            return
+
+        # the images are shared with the snapshot, rather than copied
+        memo: dict[int, Any] = {}
+        for item in itertools.chain(
+            self.texts,
+            self.pictures,
+            self.tables,
+            self.key_value_items,
+            self.form_items,
+            self.pages.values(),
+        ):
+            if (image := getattr(item, "image", None)) is not None:
+                memo[id(image)] = image
+        snapshot = copy.deepcopy(self, memo)
+        # the containers are edited in place, hence their contents are kept too
+        entry_fields = {
+            name: (
+                value,
+                (value.copy() if isinstance(value, (list, dict)) else None),
+            )
+            for name, value in self.__dict__.items()
+        }
+        self._batch_deletions = []
+        try:
+            yield self
+            self._commit_batch_deletions()
+            if not self.validate_tree(self.body):
+                raise ValueError("Document hierachy is inconsistent.")
+        except BaseException:
+            self._batch_deletions = None
+            self._rollback(snapshot=snapshot, entry_fields=entry_fields)
+            self._cache.clear()
+            raise
+        finally:
+            self._batch_deletions = None
+
     # ----------------------------
     # Private Manipulation methods
     # ----------------------------
 
+    def _rollback(
+        self,
+        snapshot: "DoclingDocument",
+        entry_fields: dict[str, tuple[Any, Any]],
+    ) -> None:
+        """Roll back to a deep copy of the document, keeping the entry instances.
+
+        The models held by the document at entry (directly, or in its lists and
+        dicts, e.g. the items and the pages) get back their state from the
+        snapshot, and the containers get back their entry contents.
+        """
+
+        def restore(model: BaseModel, copied: BaseModel) -> None:
+            model.__dict__.update(copied.__dict__)
+            for attr in (
+                "__pydantic_fields_set__",
+                "__pydantic_extra__",
+                "__pydantic_private__",
+            ):
+                object.__setattr__(model, attr, getattr(copied, attr))
+
+        for name, copied in snapshot.__dict__.items():
+            value, contents = entry_fields[name]
+            if isinstance(value, BaseModel) and type(copied) is type(value):
+                restore(value, copied)
+            elif isinstance(value, list) and isinstance(copied, list):
+                value[:] = contents
+                for model, copied_model in zip(value, copied):
+                    if isinstance(model, BaseModel):
+                        restore(model, copied_model)
+            elif isinstance(value, dict) and isinstance(copied, dict):
+                value.clear()
+                value.update(contents)
+                for key, model in value.items():
+                    if isinstance(model, BaseModel):
+                        restore(model, copied[key])
+            else:
+                value = copied
+            self.__dict__[name] = value
+
     def _get_stack_of_item(self, item: NodeItem) -> tuple[bool, list[int]]:
         """Find the stack indices of the item."""
         return self._get_stack_of_refitem(ref=item.get_ref())
 
     def _get_stack_of_refitem(self, ref: RefItem) -> tuple[bool, list[int]]:
         """Find the stack indices of the reference."""
-        if ref == self.body.get_ref():
+        if ref.cref == self.body.self_ref:
             return (True, [])
 
-        node = ref.resolve(doc=self)
-        parent_ref = node._get_parent_ref(doc=self, stack=[])
+        position = self._get_position_of_item(node=ref.resolve(doc=self))
 
-        if parent_ref is None:
+        if position is None:
             return (False, [])
 
         stack: list[int] = []
-        while parent_ref is not None:
-            parent = parent_ref.resolve(doc=self)
-
-            index = parent.children.index(node.get_ref())
-            stack.insert(0, index)  # prepend the index
+        while position is not None:
+            parent, index = position
+            stack.append(index)
 
-            node = parent
-            parent_ref = node._get_parent_ref(doc=self, stack=[])
+            position = self._get_position_of_item(node=parent)
 
+        stack.reverse()
         return (True, stack)
 
+    def _get_position_of_item(self, node: NodeItem) -> Optional[tuple[NodeItem, int]]:
+        """Find the parent and the index among the parent's children of the node.
+
+        The lookup goes through a position index mapping crefs to their parent cref
+        and child index. The index is populated lazily, one parent at a time, and is
+        kept current by the manipulation methods; entries found to be stale (e.g. after
+        a direct edit of some children list) are repaired on lookup.
+
+        :returns: None if the node has no parent.
+        """
+        if node.parent is None:
+            return None
+
+        cref = node.self_ref
+        parent_cref = node.parent.cref
+        parent = node.parent.resolve(doc=self)
+        children = parent.children
+        positions: dict[str, tuple[str, int]] = self._cache.setdefault("positions", {})
+
+        entry = positions.get(cref)
+        if entry is None or not (
+            entry[0] == parent_cref
+            and entry[1] < len(children)
+            and children[entry[1]].cref == cref
+        ):
+            if children and children[-1].cref == cref:  # e.g. freshly appended
+                positions[cref] = (parent_cref, len(children) - 1)
+            else:
+                for index, child_ref in enumerate(children):
+                    positions[child_ref.cref] = (parent_cref, index)
+                if cref not in positions or positions[cref][0] != parent_cref:
+                    raise ValueError(f"{cref} is not a child of {parent_cref}")
+            entry = positions[cref]
+
+        return (parent, entry[1])
+
+    def _get_child_index(self, parent: NodeItem, ref: RefItem) -> int:
+        """Find the index of the reference among the children of the parent."""
+        position = self._get_position_of_item(node=ref.resolve(doc=self))
+        if position is None or position[0].self_ref != parent.self_ref:
+            raise ValueError(f"{ref.cref} is not a child of {parent.self_ref}")
+        return position[1]
+
+    def _insert_children_at(
+        self, parent: NodeItem, slot: int, refs: list[RefItem]
+    ) -> None:
+        """Insert child references at the slot, keeping the position index current."""
+        for ref in refs:
+            # ensure the parent is correct
+            ref.resolve(doc=self).parent = parent.get_ref()
+
+        parent.children[slot:slot] = refs
+        self._cache.pop("item_indexes", None)
+
+        positions: Optional[dict[str, tuple[str, int]]] = self._cache.get("positions")
+        if positions is not None:
+            for index in range(slot, len(parent.children)):
+                positions[parent.children[index].cref] = (parent.self_ref, index)
+
     def _insert_item_at_refitem(
         self, item: NodeItem, ref: RefItem, after: bool
     ) -> RefItem:
         """Insert node-item using the self-reference."""
-        success, stack = self._get_stack_of_refitem(ref=ref)
+        position = self._get_position_of_item(node=ref.resolve(doc=self))
 
-        if not success:
-            raise ValueError(
-                f"Could not insert at {ref.cref}: could not find the stack"
-            )
+        if position is None:
+            raise ValueError(f"Could not find a parent of {ref.cref}")
+
+        parent, index = position
+        new_ref = self._append_item(item=item, parent_ref=parent.get_ref())
+        self._insert_children_at(
+            parent=parent, slot=index + 1 if after else index, refs=[new_ref]
+        )
 
-        return self._insert_item_at_stack(item=item, stack=stack, after=after)
+        return item.get_ref()
 
     def _append_item(self, *, item: NodeItem, parent_ref: RefItem) -> RefItem:
         """Append item of its type."""
@@ -2228,177 +2667,235 @@ class DoclingDocument(BaseModel):
         return item.get_ref()
 
     def _delete_items(self, refs: list[RefItem]):
-        """Delete document item using the self-reference."""
-        to_be_deleted_items: dict[tuple[int, ...], str] = {}  # stack to cref
+        """Delete document items, along with their children, using the self-reference.
 
+        The deletion runs in a single pass over the tree to collect the deleted
+        crefs, followed by a single pass over all remaining items, in which the
+        references (self, parent, children, captions, references, footnotes and rich
+        table cells) are renumbered through per-list lookup tables.
+        """
         if not refs:
             return
 
-        # Identify the to_be_deleted_items
-        for item, stack in self._iterate_items_with_stack(
-            with_groups=True,
-            traverse_pictures=True,
-            included_content_layers={c for c in ContentLayer},
-        ):
-            ref = item.get_ref()
-
-            if ref in refs:
-                to_be_deleted_items[tuple(stack)] = ref.cref
+        if any(ref.cref == self.body.self_ref for ref in refs):
+            raise ValueError(f"Cannot delete the document body: {self.body.self_ref}")
 
-            substacks = [stack[0 : i + 1] for i in range(len(stack) - 1)]
-            for substack in substacks:
-                if tuple(substack) in to_be_deleted_items:
-                    to_be_deleted_items[tuple(stack)] = ref.cref
+        if self._batch_deletions is not None:
+            self._detach_items(refs=refs)
+            return
 
-        if len(to_be_deleted_items) < len(refs):
+        requested: set[str] = {ref.cref for ref in refs}
+
+        # Identify the deleted items, i.e. the requested ones and their descendants
+        found: set[str] = set()
+        deleted: set[str] = set()
+        stack: list[tuple[NodeItem, bool]] = [(self.body, False)]
+        while stack:
+            node, parent_deleted = stack.pop()
+            is_deleted = parent_deleted
+            if node.self_ref in requested:
+                found.add(node.self_ref)
+                is_deleted = True
+            if is_deleted:
+                deleted.add(node.self_ref)
+            for child_ref in node.children:
+                stack.append((child_ref.resolve(doc=self), is_deleted))
+
+        if len(found) < len(requested):
             raise ValueError(
                 f"Cannot find all provided RefItems in doc: {[r.cref for r in refs]}"
             )
 
-        # Clean the tree, reverse the order to not have to update
-        for stack_, ref_ in reversed(sorted(to_be_deleted_items.items())):
-            success = self.body._delete_child(doc=self, stack=list(stack_))
-
-            if not success:
-                del to_be_deleted_items[stack_]
-            else:
-                _logger.info(f"deleted item in tree at stack: {stack_} => {ref_}")
+        self._remove_items(deleted=deleted)
+
+    def _remove_items(self, deleted: set[str]) -> None:
+        """Remove the items from their lists and renumber all remaining references."""
+        # Remove the deleted items from their lists, building the lookup tables
+        # from old to new index (-1 for deleted items)
+        lookup: dict[str, list[int]] = {}
+        deleted_indices: dict[str, set[int]] = {}
+        for cref in deleted:
+            path = cref.split("/")
+            if len(path) != 3:  # e.g. the body, which has no parent
+                raise ValueError(f"Cannot delete an item without parent: {cref}")
+            _, item_label, index_str = path
+            deleted_indices.setdefault(item_label, set()).add(int(index_str))
+
+        for item_label, indices in deleted_indices.items():
+            items: list[NodeItem] = self.__getattribute__(item_label)
+            new_index = 0
+            new_indices: list[int] = []
+            for index in range(len(items)):
+                if index in indices:
+                    new_indices.append(-1)
+                else:
+                    new_indices.append(new_index)
+                    new_index += 1
+            items[:] = [it for index, it in enumerate(items) if index not in indices]
+            lookup[item_label] = new_indices
 
-        # Create a new lookup of the orphans:
-        # dict of item_label (`texts`, `tables`, ...) to a
-        # dict of item_label with delta (default = -1).
-        lookup: dict[str, dict[int, int]] = {}
+        _logger.debug(f"deleted {len(deleted)} items from doc")
 
-        for stack_, ref_ in to_be_deleted_items.items():
-            path = ref_.split("/")
-            if len(path) == 3:
+        # Update the references of all remaining items
+        with warnings.catch_warnings():
+            # ignore warning from deprecated furniture
+            warnings.filterwarnings("ignore", category=DeprecationWarning)
+            roots = [self.body, self.furniture]
+        for node in itertools.chain(
+            roots,
+            self.groups,
+            self.texts,
+            self.pictures,
+            self.tables,
+            self.key_value_items,
+            self.form_items,
+        ):
+            self._update_refs_with_lookup(node=node, lookup=lookup)
 
-                item_label = path[1]
-                item_index = int(path[2])
+        # references have been renumbered, hence most positions are stale
+        self._cache.pop("positions", None)
+        self._cache.pop("item_indexes", None)
 
-                if item_label not in lookup:
-                    lookup[item_label] = {}
+    def _detach_items(self, refs: list[RefItem]) -> None:
+        """Detach items from the tree, deferring their deletion to the batch commit."""
+        assert self._batch_deletions is not None
 
-                lookup[item_label][item_index] = -1
+        nodes: dict[str, NodeItem] = {}
+        for ref in refs:
+            if ref.cref in nodes:
+                continue
+            # the item must be attached to the body (in particular, not detached)
+            node = ref.resolve(doc=self)
+            ancestor = node
+            try:
+                while (
+                    position := self._get_position_of_item(node=ancestor)
+                ) is not None:
+                    ancestor = position[0]
+            except ValueError:
+                ancestor = node
+            if ancestor is not self.body:
+                raise ValueError(
+                    f"Cannot find all provided RefItems in doc: {[r.cref for r in refs]}"
+                )
+            nodes[ref.cref] = node
 
-        # Remove the orphans in reverse order
-        for item_label, item_inds in lookup.items():
-            for item_index, val in reversed(
-                sorted(item_inds.items())
-            ):  # make sure you delete the last in the list first!
-                _logger.debug(f"deleting item in doc for {item_label} for {item_index}")
-                del self.__getattribute__(item_label)[item_index]
+        positions: dict[str, tuple[str, int]] = self._cache.setdefault("positions", {})
+        for cref, node in nodes.items():
+            parent, index = typing.cast(
+                tuple[NodeItem, int], self._get_position_of_item(node=node)
+            )
+            del parent.children[index]
+            self._cache.pop("item_indexes", None)
+            positions.pop(cref, None)
+            for i in range(index, len(parent.children)):
+                positions[parent.children[i].cref] = (parent.self_ref, i)
+            self._batch_deletions.append(cref)
+
+    def _commit_batch_deletions(self) -> None:
+        """Delete the items detached within the batch edit, along with their children."""
+        assert self._batch_deletions is not None
+
+        deleted: set[str] = set()
+        stack: list[NodeItem] = [
+            RefItem(cref=cref).resolve(doc=self) for cref in self._batch_deletions
+        ]
+        while stack:
+            node = stack.pop()
+            if node.self_ref not in deleted:
+                deleted.add(node.self_ref)
+                stack.extend(ref.resolve(doc=self) for ref in node.children)
+        self._batch_deletions = []
 
-        self._update_breadth_first_with_lookup(
-            node=self.body, refs_to_be_deleted=refs, lookup=lookup
-        )
+        if deleted:
+            self._remove_items(deleted=deleted)
 
-    # Update the references
-    def _update_ref_with_lookup(
-        self, item_label: str, item_index: int, lookup: dict[str, dict[int, int]]
-    ) -> RefItem:
-        """Update ref with lookup."""
-        if item_label not in lookup:  # Nothing to be done
-            return RefItem(cref=f"#/{item_label}/{item_index}")
+    @staticmethod
+    def _update_cref_with_lookup(
+        cref: str, lookup: dict[str, list[int]]
+    ) -> Optional[str]:
+        """Get the renumbered cref, or None if it points to a deleted item."""
+        path = cref.split("/")
+        if len(path) != 3 or path[1] not in lookup:  # Nothing to be done
+            return cref
 
-        # Count how many items have been deleted in front of you
-        delta = sum(
-            val if item_index >= key else 0 for key, val in lookup[item_label].items()
-        )
-        new_index = item_index + delta
+        item_label = path[1]
+        item_index = int(path[2])
+        new_indices = lookup[item_label]
+        if item_index >= len(new_indices):  # dangling already, leave untouched
+            return cref
 
-        return RefItem(cref=f"#/{item_label}/{new_index}")
+        new_index = new_indices[item_index]
+        if new_index < 0:
+            return None
+        elif new_index == item_index:
+            return cref
+        return f"#/{item_label}/{new_index}"
 
     def _update_refitems_with_lookup(
-        self,
-        ref_items: list[RefItem],
-        refs_to_be_deleted: list[RefItem],
-        lookup: dict[str, dict[int, int]],
+        self, ref_items: list[RefItem], lookup: dict[str, list[int]]
     ) -> list[RefItem]:
-        """Update refitems with lookup."""
+        """Update refitems with lookup, dropping the ones of deleted items."""
         new_refitems = []
         for ref_item in ref_items:
-
-            if (
-                ref_item not in refs_to_be_deleted
-            ):  # if ref_item is in ref, then delete/skip them
-                path = ref_item._split_ref_to_path()
-                if len(path) == 3:
-                    new_refitems.append(
-                        self._update_ref_with_lookup(
-                            item_label=path[1],
-                            item_index=int(path[2]),
-                            lookup=lookup,
-                        )
-                    )
-                else:
-                    new_refitems.append(ref_item)
+            new_cref = self._update_cref_with_lookup(cref=ref_item.cref, lookup=lookup)
+            if new_cref == ref_item.cref:
+                new_refitems.append(ref_item)
+            elif new_cref is not None:
+                new_refitems.append(RefItem(cref=new_cref))
 
         return new_refitems
 
-    def _update_breadth_first_with_lookup(
-        self,
-        node: NodeItem,
-        refs_to_be_deleted: list[RefItem],
-        lookup: dict[str, dict[int, int]],
-    ):
-        """Update breadth first with lookup."""
+    def _update_refs_with_lookup(
+        self, node: NodeItem, lookup: dict[str, list[int]]
+    ) -> None:
+        """Update all references held by the node with lookup."""
+        # Update the self_ref reference
+        new_self_ref = self._update_cref_with_lookup(cref=node.self_ref, lookup=lookup)
+        if new_self_ref is not None:
+            node.self_ref = new_self_ref
+
+        # Update the parent reference
+        if node.parent is not None:
+            new_cref = self._update_cref_with_lookup(
+                cref=node.parent.cref, lookup=lookup
+            )
+            if new_cref is None:
+                node.parent = None
+            elif new_cref != node.parent.cref:
+                node.parent = RefItem(cref=new_cref)
+
+        # Update the child references
+        node.children = self._update_refitems_with_lookup(
+            ref_items=node.children, lookup=lookup
+        )
+
         # Update the captions, references and footnote references
         if isinstance(node, FloatingItem):
             node.captions = self._update_refitems_with_lookup(
-                ref_items=node.captions,
-                refs_to_be_deleted=refs_to_be_deleted,
-                lookup=lookup,
+                ref_items=node.captions, lookup=lookup
             )
             node.references = self._update_refitems_with_lookup(
-                ref_items=node.references,
-                refs_to_be_deleted=refs_to_be_deleted,
-                lookup=lookup,
+                ref_items=node.references, lookup=lookup
             )
             node.footnotes = self._update_refitems_with_lookup(
-                ref_items=node.footnotes,
-                refs_to_be_deleted=refs_to_be_deleted,
-                lookup=lookup,
+                ref_items=node.footnotes, lookup=lookup
             )
             if isinstance(node, TableItem):
-                for cell in node.data.table_cells:
+                cells = node.data.table_cells
+                for cell_index, cell in enumerate(cells):
                     if isinstance(cell, RichTableCell):
-                        path = cell.ref._split_ref_to_path()
-                        cell.ref = self._update_ref_with_lookup(
-                            item_label=path[1],
-                            item_index=int(path[2]),
-                            lookup=lookup,
+                        new_cref = self._update_cref_with_lookup(
+                            cref=cell.ref.cref, lookup=lookup
                         )
-
-        # Update the self_ref reference
-        if node.parent is not None:
-            path = node.parent._split_ref_to_path()
-            if len(path) == 3:
-                node.parent = self._update_ref_with_lookup(
-                    item_label=path[1], item_index=int(path[2]), lookup=lookup
-                )
-
-        # Update the parent reference
-        if node.self_ref is not None:
-            path = node.self_ref.split("/")
-            if len(path) == 3:
-                _ref = self._update_ref_with_lookup(
-                    item_label=path[1], item_index=int(path[2]), lookup=lookup
-                )
-                node.self_ref = _ref.cref
-
-        # Update the child references
-        node.children = self._update_refitems_with_lookup(
-            ref_items=node.children,
-            refs_to_be_deleted=refs_to_be_deleted,
-            lookup=lookup,
-        )
-
-        for i, child_ref in enumerate(node.children):
-            node = child_ref.resolve(self)
-            self._update_breadth_first_with_lookup(
-                node=node, refs_to_be_deleted=refs_to_be_deleted, lookup=lookup
-            )
+                        if new_cref is None:
+                            # the rich content is gone, keep the cell as a plain one
+                            cells[cell_index] = TableCell(
+                                **cell.model_dump(exclude={"ref"})
+                            )
+                            node.data._invalidate_grid()
+                        elif new_cref != cell.ref.cref:
+                            cell.ref = RefItem(cref=new_cref)
 
     ###################################
     # TODO: refactor add* methods below
@@ -3063,7 +3560,7 @@ class DoclingDocument(BaseModel):
             )
 
         # Get the parent RefItem
-        parent_ref = self.body._get_parent_ref(doc=self, stack=stack)
+        parent_ref = sibling_ref.resolve(doc=self).parent if stack else None
 
         if parent_ref is None:
             raise ValueError(f"Could not find a parent at stack: {stack}")
@@ -3086,9 +3583,11 @@ class DoclingDocument(BaseModel):
 
         new_ref = item.get_ref()
 
-        success = self.body._add_sibling(
-            doc=self, stack=stack, new_ref=new_ref, after=after
-        )
+        parent = item.parent.resolve(doc=self)
+        slot = (stack[-1] + 1 if after else stack[-1]) if stack else -1
+        success = 0 <= slot <= len(parent.children)
+        if success:
+            self._insert_children_at(parent=parent, slot=slot, refs=[new_ref])
 
         # Error handling can be determined here
         if not success:
@@ -3794,8 +4293,8 @@ class DoclingDocument(BaseModel):
         start_parent = start_parent_ref.resolve(doc=self)
         end_parent = end_parent_ref.resolve(doc=self)
 
-        start_index = start_parent.children.index(start_ref)
-        end_index = end_parent.children.index(end_ref)
+        start_index = self._get_child_index(parent=start_parent, ref=start_ref)
+        end_index = self._get_child_index(parent=end_parent, ref=end_ref)
 
         if start_index > end_index:
             raise ValueError(
@@ -3846,10 +4345,12 @@ class DoclingDocument(BaseModel):
         start_parent = start_parent_ref.resolve(doc=self)
         end_parent = end_parent_ref.resolve(doc=self)
 
-        start_index = start_parent.children.index(start_ref) + (
+        start_index = self._get_child_index(parent=start_parent, ref=start_ref) + (
             0 if start_inclusive else 1
         )
-        end_index = end_parent.children.index(end_ref) + (1 if end_inclusive else 0)
+        end_index = self._get_child_index(parent=end_parent, ref=end_ref) + (
+            1 if end_inclusive else 0
+        )
 
         if start_index > end_index:
             raise ValueError(
@@ -3978,30 +4479,23 @@ class DoclingDocument(BaseModel):
             node_items=node_items, parent_ref=parent_ref, doc=doc
         )
 
-        # Get the stack of the sibling
+        # Get the position of the sibling
 
         sibling_ref = sibling.get_ref()
 
-        success, stack = self._get_stack_of_refitem(ref=sibling_ref)
+        position = self._get_position_of_item(node=sibling_ref.resolve(doc=self))
 
-        if not success:
+        if position is None:
             raise ValueError(
                 f"Could not insert at {sibling_ref.cref}: could not find the stack"
             )
 
         # Insert the new item refs in the document structure
 
-        reversed_new_refs = new_refs[::-1]
-
-        for ref in reversed_new_refs:
-            success = self.body._add_sibling(
-                doc=self, stack=stack, new_ref=ref, after=after
-            )
-
-            if not success:
-                raise ValueError(
-                    f"Could not insert item {ref.cref} at {sibling.get_ref().cref}"
-                )
+        sibling_parent, index = position
+        self._insert_children_at(
+            parent=sibling_parent, slot=index + 1 if after else index, refs=new_refs
+        )
 
     def _append_item_copies(
         self,
@@ -4043,19 +4537,32 @@ class DoclingDocument(BaseModel):
         return len(self.pages.values())
 
     def validate_tree(self, root: NodeItem) -> bool:
-        """validate_tree."""
-        for child_ref in root.children:
-            child = child_ref.resolve(self)
-            if child.parent.resolve(self) != root or not self.validate_tree(child):
-                return False
+        """validate_tree.
 
-        if isinstance(root, TableItem):
-            for cell in root.data.table_cells:
-                if isinstance(cell, RichTableCell) and (
-                    (par_ref := cell.ref.resolve(self).parent) is None
-                    or par_ref.resolve(self) != root
-                ):
+        Check in a single pass that all items under the root point back to their
+        parent, comparing the items by identity.
+        """
+        visited: set[int] = set()
+        stack: list[NodeItem] = [root]
+        while stack:
+            node = stack.pop()
+            if id(node) in visited:
+                continue
+            visited.add(id(node))
+
+            for child_ref in node.children:
+                child = child_ref.resolve(self)
+                if child.parent is None or child.parent.resolve(self) is not node:
                     return False
+                stack.append(child)
+
+            if isinstance(node, TableItem):
+                for cell in node.data.table_cells:
+                    if isinstance(cell, RichTableCell) and (
+                        (par_ref := cell.ref.resolve(self).parent) is None
+                        or par_ref.resolve(self) is not node
+                    ):
+                        return False
 
         return True
 
@@ -4069,7 +4576,7 @@ class DoclingDocument(BaseModel):
         _level: int = 0,  # deprecated
     ) -> typing.Iterable[Tuple[NodeItem, int]]:  # tuple of node and level
         """Iterate elements with level."""
-        for item, stack in self._iterate_items_with_stack(
+        for item, stack in self._iterate_tree_entries(
             root=root,
             with_groups=with_groups,
             traverse_pictures=traverse_pictures,
@@ -4088,65 +4595,343 @@ class DoclingDocument(BaseModel):
         _stack: Optional[list[int]] = None,
     ) -> typing.Iterable[Tuple[NodeItem, list[int]]]:  # tuple of node and level
         """Iterate elements with stack."""
+        for item, stack in self._iterate_tree_entries(
+            root=root,
+            with_groups=with_groups,
+            traverse_pictures=traverse_pictures,
+            page_no=page_no,
+            included_content_layers=included_content_layers,
+            stack=tuple(_stack) if _stack is not None else (),
+        ):
+            yield item, list(stack)
+
+    def _iterate_tree_entries(
+        self,
+        root: Optional[NodeItem],
+        with_groups: bool,
+        traverse_pictures: bool,
+        page_no: Optional[int],
+        included_content_layers: Optional[set[ContentLayer]],
+        stack: tuple[int, ...] = (),
+    ) -> Iterator[tuple[NodeItem, tuple[int, ...]]]:
+        """Iterate elements with stack, filtering the pre-order walk of the tree.
+
+        Walks from the body (without a stack prefix) scan the cached pre-order array
+        of the body; other walks run over the live tree.
+        """
         my_layers = (
             included_content_layers
             if included_content_layers is not None
             else DEFAULT_CONTENT_LAYERS
         )
-        my_stack: list[int] = _stack if _stack is not None else []
-
         if not root:
             root = self.body
 
-        # Yield non-group items or group items when with_groups=True
+        entries: typing.Iterable[tuple]
+        if root is self.body and not stack:
+            entries = self._get_preorder_entries()
+        else:
+            entries = self._walk_tree(root=root, stack=stack)
+
+        skip_depth = -1  # skip the entries deeper than this, when non-negative
+        for entry in entries:
+            node: NodeItem = entry[0]
+            node_stack: tuple[int, ...] = entry[1]
+            if skip_depth >= 0:
+                if len(node_stack) > skip_depth:
+                    continue
+                skip_depth = -1
+
+            picture_parent: Optional[PictureItem] = entry[2]
+            if (
+                picture_parent is not None
+                and not traverse_pictures
+                and all(ref.cref != node.self_ref for ref in picture_parent.captions)
+            ):
+                # children of pictures other than captions are skipped, with subtree
+                skip_depth = len(node_stack)
+                continue
 
-        # Combine conditions to have a single yield point
-        should_yield = (
-            (not isinstance(root, GroupItem) or with_groups)
-            and (
-                not isinstance(root, DocItem)
-                or (
+            if (
+                (with_groups or not entry[3])  # i.e. not a GroupItem
+                and (
                     page_no is None
-                    or any(prov.page_no == page_no for prov in root.prov)
+                    or not entry[4]  # i.e. not a DocItem
+                    or any(
+                        prov.page_no == page_no
+                        for prov in typing.cast(DocItem, node).prov
+                    )
                 )
+                and node.content_layer in my_layers
+            ):
+                yield node, node_stack
+
+    def _walk_tree(
+        self, root: NodeItem, stack: tuple[int, ...] = ()
+    ) -> Iterator[
+        tuple[NodeItem, tuple[int, ...], Optional[PictureItem], bool, bool, RefItem]
+    ]:
+        """Walk the tree under the root in pre-order, without recursion.
+
+        :returns: tuples of node, stack, parent if it is a picture, whether the node
+            is a group, whether the node is a doc-item and reference of the node.
+        """
+        yield (
+            root,
+            stack,
+            None,
+            isinstance(root, GroupItem),
+            isinstance(root, DocItem),
+            root.get_ref(),
+        )
+
+        pending: list[tuple[NodeItem, tuple[int, ...], Iterator[tuple[int, RefItem]]]]
+        pending = [(root, stack, enumerate(root.children))]
+        while pending:
+            parent, parent_stack, children = pending[-1]
+            for child_ind, child_ref in children:
+                child = child_ref.resolve(doc=self)
+                if isinstance(child, NodeItem):
+                    child_stack = parent_stack + (child_ind,)
+                    yield (
+                        child,
+                        child_stack,
+                        parent if isinstance(parent, PictureItem) else None,
+                        isinstance(child, GroupItem),
+                        isinstance(child, DocItem),
+                        child_ref,
+                    )
+                    pending.append((child, child_stack, enumerate(child.children)))
+                    break
+            else:
+                pending.pop()
+
+    def _get_preorder_entries(self) -> list[tuple]:
+        """Get the pre-order array of the body tree, from the cache if still valid.
+
+        Each entry extends the one of `_walk_tree` with what is needed to check that
+        the tree did not change: the cref, the item list and index the reference
+        resolves to, and the children list and its length. Checking the whole array
+        is much cheaper than walking the tree, and catches any edit of the structure,
+        including direct edits of the children lists.
+        """
+        cached = self._cache.get("preorder")
+        if cached is not None and self._is_preorder_valid(*cached):
+            return cached[1]
+
+        item_lists: dict[str, list] = {}
+        entries: list[tuple] = []
+        for entry in self._walk_tree(root=self.body):
+            node = entry[0]
+            path = entry[5].cref.split("/")
+            items = None
+            index = -1
+            if len(path) == 3:
+                items = item_lists.setdefault(path[1], self.__getattribute__(path[1]))
+                index = int(path[2])
+            entries.append(
+                entry + (entry[5].cref, items, index, node.children, len(node.children))
+            )
+
+        self._cache["preorder"] = (item_lists, entries)
+        return entries
+
+    def _is_preorder_valid(
+        self, item_lists: dict[str, list], entries: list[tuple]
+    ) -> bool:
+        """Check that the pre-order array matches the current tree."""
+        for item_label, items in item_lists.items():
+            if self.__getattribute__(item_label) is not items:
+                return False
+
+        body_entry = entries[0]
+        if (
+            body_entry[0] is not self.body
+            or self.body.children is not body_entry[9]
+            or len(body_entry[9]) != body_entry[10]
+        ):
+            return False
+
+        parent_children: list[list[RefItem]] = [body_entry[9]]
+        try:
+            for node, stack, _, _, _, ref, cref, items, index, children, num in entries[
+                1:
+            ]:
+                # the parent entry precedes (and has been checked) in pre-order
+                del parent_children[len(stack) :]
+                if (
+                    parent_children[-1][stack[-1]] is not ref
+                    or ref.cref != cref
+                    or items[index] is not node
+                    or node.children is not children
+                    or len(children) != num
+                ):
+                    return False
+                parent_children.append(children)
+        except IndexError:
+            return False
+
+        return True
+
+    def items_on_page(
+        self,
+        page_no: int,
+        traverse_pictures: bool = False,
+        included_content_layers: Optional[set[ContentLayer]] = None,
+    ) -> list[DocItem]:
+        """Get the items with a provenance on the page, in reading order.
+
+        Same items as `iterate_items(page_no=page_no, ...)`, looked up in a page
+        index built once for all pages (see `invalidate_indexes()` about editing the
+        items directly).
+        """
+        indexes = self._get_item_indexes()
+        return self._select_indexed_items(
+            indexes=indexes,
+            positions=indexes["pages"].get(page_no, []),
+            traverse_pictures=traverse_pictures,
+            included_content_layers=included_content_layers,
+        )
+
+    def items_with_label(
+        self,
+        *labels: DocItemLabel,
+        traverse_pictures: bool = False,
+        included_content_layers: Optional[set[ContentLayer]] = None,
+    ) -> list[DocItem]:
+        """Get the items with any of the labels, in reading order."""
+        indexes = self._get_item_indexes()
+        positions = sorted(
+            itertools.chain.from_iterable(
+                indexes["labels"].get(label, []) for label in set(labels)
             )
-            and root.content_layer in my_layers
+        )
+        return self._select_indexed_items(
+            indexes=indexes,
+            positions=positions,
+            traverse_pictures=traverse_pictures,
+            included_content_layers=included_content_layers,
+        )
+
+    def items_in_content_layer(
+        self,
+        content_layer: ContentLayer,
+        with_groups: bool = False,
+        traverse_pictures: bool = False,
+    ) -> list[NodeItem]:
+        """Get the items of the content layer, in reading order."""
+        indexes = self._get_item_indexes()
+        return self._select_indexed_items(
+            indexes=indexes,
+            positions=indexes["layers"].get(content_layer, []),
+            with_groups=with_groups,
+            traverse_pictures=traverse_pictures,
+            included_content_layers={content_layer},
         )
 
-        if should_yield:
-            yield root, my_stack
+    def invalidate_indexes(self) -> None:
+        """Drop the page, label and content-layer indexes of the items.
 
-        my_stack.append(-1)
+        Needed after editing the document other than through its methods, e.g.
+        after replacing an item in its list, or editing the provenance, label or
+        content layer of an item in place, for `items_on_page()`,
+        `items_with_label()` and `items_in_content_layer()` to reflect the edits.
+        """
+        self._cache.pop("item_indexes", None)
+        self._cache.pop("preorder", None)
 
-        allowed_pic_refs: set[str] = (
-            {r.cref for r in root.captions}
-            if (root_is_picture := isinstance(root, PictureItem))
-            else set()
+    def _select_indexed_items(
+        self,
+        indexes: dict[str, Any],
+        positions: list[int],
+        with_groups: bool = False,
+        traverse_pictures: bool = False,
+        included_content_layers: Optional[set[ContentLayer]] = None,
+    ) -> list:
+        """Get the items at the positions of the pre-order array, filtered."""
+        my_layers = (
+            included_content_layers
+            if included_content_layers is not None
+            else DEFAULT_CONTENT_LAYERS
         )
+        entries = indexes["entries"]
+        in_pictures = indexes["in_pictures"]
+        return [
+            entries[pos][0]
+            for pos in positions
+            if (traverse_pictures or not in_pictures[pos])
+            and (with_groups or not entries[pos][3])
+            and entries[pos][0].content_layer in my_layers
+        ]
 
-        # Traverse children
-        for child_ind, child_ref in enumerate(root.children):
-            child = child_ref.resolve(self)
+    def _get_item_indexes(self) -> dict[str, Any]:
+        """Get the page, label and content-layer indexes of the body tree.
+
+        The indexes map to positions in the pre-order array of the body tree, which
+        gives the reading order. They are built lazily, and dropped by any
+        manipulation through the document methods. As a safeguard against direct
+        edits, they are rebuilt as well if the length of any item list (or of the
+        children of the body) changed, or if a traversal found the tree changed.
+        Checking this takes constant time, so that a lookup only costs the size of its
+        result. Other direct edits, e.g. replacing an item in its list, or editing
+        the provenance, label or content layer of an item in place, require calling
+        `invalidate_indexes()`.
+        """
+        fingerprint = (
+            len(self.body.children),
+            len(self.groups),
+            len(self.texts),
+            len(self.pictures),
+            len(self.tables),
+            len(self.key_value_items),
+            len(self.form_items),
+        )
+        cached = self._cache.get("item_indexes")
+        preorder = self._cache.get("preorder")
+        if (
+            cached is not None
+            and cached[0] == fingerprint
+            and preorder is not None
+            and cached[1]["entries"] is preorder[1]
+        ):
+            return cached[1]
+
+        entries = self._get_preorder_entries()
+        pages: dict[int, list[int]] = {}
+        labels: dict[DocItemLabel, list[int]] = {}
+        layers: dict[ContentLayer, list[int]] = {}
+        in_pictures: list[bool] = []
+
+        skip_depth = -1  # inside the non-caption children of a picture, if >= 0
+        for pos, entry in enumerate(entries):
+            node: NodeItem = entry[0]
+            depth = len(entry[1])
+            if skip_depth >= 0 and depth <= skip_depth:
+                skip_depth = -1
             if (
-                root_is_picture
-                and not traverse_pictures
-                and isinstance(child, NodeItem)
-                and child.self_ref not in allowed_pic_refs
+                skip_depth < 0
+                and entry[2] is not None
+                and all(ref.cref != node.self_ref for ref in entry[2].captions)
             ):
-                continue
-            my_stack[-1] = child_ind
-
-            if isinstance(child, NodeItem):
-                yield from self._iterate_items_with_stack(
-                    child,
-                    with_groups=with_groups,
-                    traverse_pictures=traverse_pictures,
-                    page_no=page_no,
-                    _stack=my_stack,
-                    included_content_layers=my_layers,
-                )
-
-        my_stack.pop()
+                skip_depth = depth
+            in_pictures.append(skip_depth >= 0)
+
+            layers.setdefault(node.content_layer, []).append(pos)
+            if entry[4]:  # i.e. a DocItem
+                doc_item = typing.cast(DocItem, node)
+                labels.setdefault(doc_item.label, []).append(pos)
+                for page_no in dict.fromkeys(prov.page_no for prov in doc_item.prov):
+                    pages.setdefault(page_no, []).append(pos)
+
+        indexes = {
+            "entries": entries,
+            "in_pictures": in_pictures,
+            "pages": pages,
+            "labels": labels,
+            "layers": layers,
+        }
+        self._cache["item_indexes"] = (fingerprint, indexes)
+        return indexes
 
     def _clear_picture_pil_cache(self):
         """Clear cache storage of all images."""
@@ -4184,21 +4969,26 @@ class DoclingDocument(BaseModel):
 
         for ix, (item, level) in enumerate(result.iterate_items(with_groups=True)):
             if isinstance(item, PictureItem):
+                embedded_image = self._get_embedded_image(item)
+                if embedded_image is not None:
+                    item.image = embedded_image
 
-                if item.image is not None:
-                    if (
-                        isinstance(item.image.uri, AnyUrl)
-                        and item.image.uri.scheme == "file"
-                    ):
-                        assert isinstance(item.image.uri.path, str)
-                        tmp_image = PILImage.open(str(unquote(item.image.uri.path)))
-                        item.image = ImageRef.from_pil(tmp_image, dpi=item.image.dpi)
+        return result
 
-                    elif isinstance(item.image.uri, Path):
-                        tmp_image = PILImage.open(str(item.image.uri))
-                        item.image = ImageRef.from_pil(tmp_image, dpi=item.image.dpi)
+    @staticmethod
+    def _get_embedded_image(item: PictureItem) -> Optional[ImageRef]:
+        """Get the embedded form of the picture image, if referenced through a file."""
+        if item.image is not None:
+            if isinstance(item.image.uri, AnyUrl) and item.image.uri.scheme == "file":
+                assert isinstance(item.image.uri.path, str)
+                tmp_image = PILImage.open(str(unquote(item.image.uri.path)))
+                return ImageRef.from_pil(tmp_image, dpi=item.image.dpi)
+
+            elif isinstance(item.image.uri, Path):
+                tmp_image = PILImage.open(str(item.image.uri))
+                return ImageRef.from_pil(tmp_image, dpi=item.image.dpi)
 
-        return result
+        return None
 
     def _with_pictures_refs(
         self,
@@ -4303,11 +5093,19 @@ class DoclingDocument(BaseModel):
         filename: Union[str, Path],
         artifacts_dir: Optional[Path] = None,
         image_mode: ImageRefMode = ImageRefMode.EMBEDDED,
-        indent: int = 2,
+        indent: Optional[int] = 2,
         coord_precision: Optional[int] = None,
         confid_precision: Optional[int] = None,
+        compress: bool = False,
     ):
-        """Save as json."""
+        """Save as json.
+
+        The document is written item by item, without building the dict of the
+        whole document, with the same output as `json.dump(doc.export_to_dict())`.
+
+        :param compress: Whether to write the file gzip-compressed (Default value =
+            False). `load_from_json` reads both forms.
+        """
         if isinstance(filename, str):
             filename = Path(filename)
         artifacts_dir, reference_path = self._get_output_paths(filename, artifacts_dir)
@@ -4315,22 +5113,147 @@ class DoclingDocument(BaseModel):
         if image_mode == ImageRefMode.REFERENCED:
             os.makedirs(artifacts_dir, exist_ok=True)
 
-        new_doc = self._make_copy_with_refmode(
-            artifacts_dir, image_mode, page_no=None, reference_path=reference_path
-        )
+        embedded_picture_refs: set[str] = set()
+        if image_mode == ImageRefMode.EMBEDDED:
+            # embed the pictures while writing instead of copying the document
+            new_doc = self
+            embedded_picture_refs = {
+                item.self_ref
+                for item, _ in self.iterate_items(with_groups=True)
+                if isinstance(item, PictureItem)
+            }
+        else:
+            new_doc = self._make_copy_with_refmode(
+                artifacts_dir, image_mode, page_no=None, reference_path=reference_path
+            )
 
-        out = new_doc.export_to_dict(
-            coord_precision=coord_precision, confid_precision=confid_precision
+        with (
+            gzip.open(filename, "wt", encoding="utf-8")
+            if compress
+            else open(filename, "w", encoding="utf-8")
+        ) as fw:
+            new_doc._write_json(
+                fw=fw,
+                indent=indent,
+                coord_precision=coord_precision,
+                confid_precision=confid_precision,
+                embedded_picture_refs=embedded_picture_refs,
+            )
+
+    def _write_json(
+        self,
+        fw: TextIO,
+        indent: Optional[int],
+        coord_precision: Optional[int] = None,
+        confid_precision: Optional[int] = None,
+        embedded_picture_refs: Optional[set[str]] = None,
+    ) -> None:
+        """Write the document as JSON, one item at a time.
+
+        The item lists and the pages are dumped item by item, and the JSON of each
+        item is indented to its nesting level, which is safe as JSON strings never
+        contain raw newlines.
+        """
+        context = {}
+        if coord_precision is not None:
+            context[PydanticSerCtxKey.COORD_PREC.value] = coord_precision
+        if confid_precision is not None:
+            context[PydanticSerCtxKey.CONFID_PREC.value] = confid_precision
+
+        def dump_model(model: BaseModel) -> Any:
+            return model.model_dump(
+                mode="json", by_alias=True, exclude_none=True, context=context
+            )
+
+        def dumps(obj: Any, level: int) -> str:
+            return json.dumps(obj, indent=indent).replace("\n", newline(level))
+
+        def newline(level: int) -> str:
+            return "" if indent is None else "\n" + " " * indent * level
+
+        separator = ", " if indent is None else ","
+
+        def write_entries(
+            entries: typing.Iterable[tuple[Optional[str], Any]], brackets: str
+        ) -> None:
+            # write entries (with key for objects) of a container at the first level
+            fw.write(brackets[0])
+            count = 0
+            for key, value in entries:
+                fw.write((separator if count else "") + newline(2))
+                if key is not None:
+                    fw.write(json.dumps(key) + ": ")
+                fw.write(dumps(value, 2))
+                count += 1
+            fw.write((newline(1) if count else "") + brackets[1])
+
+        def dump_item(item: NodeItem) -> Any:
+            if embedded_picture_refs and item.self_ref in embedded_picture_refs:
+                embedded_image = self._get_embedded_image(
+                    typing.cast(PictureItem, item)
+                )
+                if embedded_image is not None:
+                    item = item.model_copy(update={"image": embedded_image})
+            return dump_model(item)
+
+        item_lists = {
+            "groups",
+            "texts",
+            "pictures",
+            "tables",
+            "key_value_items",
+            "form_items",
+        }
+        small_fields = self.model_dump(
+            mode="json",
+            by_alias=True,
+            exclude_none=True,
+            context=context,
+            exclude=item_lists | {"pages"},
         )
-        with open(filename, "w", encoding="utf-8") as fw:
-            json.dump(out, fw, indent=indent)
+
+        fw.write("{")
+        count = 0
+        for name, field in type(self).model_fields.items():
+            key = field.alias or name
+            if name not in item_lists and name != "pages" and key not in small_fields:
+                continue
+            fw.write((separator if count else "") + newline(1) + json.dumps(key) + ": ")
+            if name in item_lists:
+                write_entries(
+                    ((None, dump_item(item)) for item in getattr(self, name)), "[]"
+                )
+            elif name == "pages":
+                write_entries(
+                    ((str(k), dump_model(page)) for k, page in self.pages.items()),
+                    "{}",
+                )
+            else:
+                fw.write(dumps(small_fields[key], 1))
+            count += 1
+        fw.write(newline(0) + "}")
 
     @classmethod
-    def load_from_json(cls, filename: Union[str, Path]) -> "DoclingDocument":
+    def load_from_json(
+        cls,
+        filename: Union[str, Path],
+        trusted: bool = False,
+        lazy_images: bool = False,
+    ) -> "DoclingDocument":
         """load_from_json.
 
         :param filename: The filename to load a saved DoclingDocument from a .json.
         :type filename: Path
+        :param trusted: Whether the file is known to hold a consistent document,
+            e.g. written by `save_as_json`, in which case the document consistency
+            checks are skipped; they can be run later with `check_consistency()`.
+        :type trusted: bool
+        :param lazy_images: Whether to leave the embedded images in the file, and
+            read them only when accessed, e.g. through `ImageRef.pil_image` or by
+            the serializers. The file must then not change while the document is
+            in use. For compressed files, the images are kept in memory, but still
+            only parsed when accessed.
+        :type lazy_images: bool
 
         :returns: The loaded DoclingDocument.
         :rtype: DoclingDocument
@@ -4338,8 +5261,35 @@ class DoclingDocument(BaseModel):
         """
         if isinstance(filename, str):
             filename = Path(filename)
-        with open(filename, "r", encoding="utf-8") as f:
-            return cls.model_validate_json(f.read())
+        with open(filename, "rb") as f:
+            json_data = f.read()
+        compressed = json_data[:2] == b"\x1f\x8b"  # gzip magic number
+        if compressed:
+            json_data = gzip.decompress(json_data)
+        context: dict[str, Any] = {PydanticValCtxKey.TRUSTED.value: trusted}
+        if lazy_images and _LAZY_DATA_URL_SUPPORTED:
+            lazy_data, lazy_urls = _extract_data_uris(
+                json_data, source=None if compressed else filename
+            )
+            if lazy_urls:
+                context[PydanticValCtxKey.LAZY_IMAGES.value] = lazy_urls
+                doc = cls.model_validate_json(lazy_data, context=context)
+                if not lazy_urls:
+                    return doc
+                # some data URIs were not image URIs: load them all eagerly
+                del context[PydanticValCtxKey.LAZY_IMAGES.value]
+        return cls.model_validate_json(json_data, context=context)
+
+    def check_consistency(self) -> Self:
+        """Run the document consistency checks skipped by a trusted load.
+
+        Raises a ValueError if the hierarchy is inconsistent, and moves list items
+        without a list group parent into new list groups, as done at load time.
+
+        :returns: The document itself.
+        """
+        self.validate_document(self)
+        return self.validate_misplaced_list_items()
 
     def save_as_yaml(
         self,
@@ -4423,7 +5373,11 @@ class DoclingDocument(BaseModel):
         page_break_placeholder: Optional[str] = None,
         include_annotations: bool = True,
     ):
-        """Save to markdown."""
+        """Save to markdown.
+
+        The output is written while the document is serialized, with the same content
+        as `export_to_markdown()`.
+        """
         if isinstance(filename, str):
             filename = Path(filename)
         artifacts_dir, reference_path = self._get_output_paths(filename, artifacts_dir)
@@ -4435,7 +5389,7 @@ class DoclingDocument(BaseModel):
             artifacts_dir, image_mode, page_no, reference_path=reference_path
         )
 
-        md_out = new_doc.export_to_markdown(
+        serializer = new_doc._get_markdown_serializer(
             delim=delim,
             from_element=from_element,
             to_element=to_element,
@@ -4453,7 +5407,7 @@ class DoclingDocument(BaseModel):
         )
 
         with open(filename, "w", encoding="utf-8") as fw:
-            fw.write(md_out)
+            serializer.serialize_to_stream(fw)
 
     def export_to_markdown(  # noqa: C901
         self,
@@ -4519,6 +5473,46 @@ class DoclingDocument(BaseModel):
         :returns: The exported Markdown representation.
         :rtype: str
         """
+        serializer = self._get_markdown_serializer(
+            delim=delim,
+            from_element=from_element,
+            to_element=to_element,
+            labels=labels,
+            strict_text=strict_text,
+            escape_underscores=escape_underscores,
+            image_placeholder=image_placeholder,
+            enable_chart_tables=enable_chart_tables,
+            image_mode=image_mode,
+            indent=indent,
+            text_width=text_width,
+            page_no=page_no,
+            included_content_layers=included_content_layers,
+            page_break_placeholder=page_break_placeholder,
+            include_annotations=include_annotations,
+            mark_annotations=mark_annotations,
+        )
+        return serializer.serialize().text
+
+    def _get_markdown_serializer(
+        self,
+        delim: str = "\n\n",
+        from_element: int = 0,
+        to_element: int = sys.maxsize,
+        labels: Optional[set[DocItemLabel]] = None,
+        strict_text: bool = False,
+        escape_underscores: bool = True,
+        image_placeholder: str = "<!-- image -->",
+        enable_chart_tables: bool = True,
+        image_mode: ImageRefMode = ImageRefMode.PLACEHOLDER,
+        indent: int = 4,
+        text_width: int = -1,
+        page_no: Optional[int] = None,
+        included_content_layers: Optional[set[ContentLayer]] = None,
+        page_break_placeholder: Optional[str] = None,
+        include_annotations: bool = True,
+        mark_annotations: bool = False,
+    ) -> "MarkdownDocSerializer":
+        # the serializer behind export_to_markdown() and save_as_markdown()
         from docling_core.transforms.serializer.markdown import (
             MarkdownDocSerializer,
             MarkdownParams,
@@ -4549,8 +5543,6 @@ class DoclingDocument(BaseModel):
                 mark_annotations=mark_annotations,
             ),
         )
-        ser_res = serializer.serialize()
-
         if delim != "\n\n":
             _logger.warning(
                 "Parameter `delim` has been deprecated and will be ignored.",
@@ -4560,7 +5552,7 @@ class DoclingDocument(BaseModel):
                 "Parameter `strict_text` has been deprecated and will be ignored.",
             )
 
-        return ser_res.text
+        return serializer
 
     def export_to_text(  # noqa: C901
         self,
@@ -4598,7 +5590,11 @@ class DoclingDocument(BaseModel):
         split_page_view: bool = False,
         include_annotations: bool = True,
     ):
-        """Save to HTML."""
+        """Save to HTML.
+
+        The output is written while the document is serialized, with the same content
+        as `export_to_html()`.
+        """
         if isinstance(filename, str):
             filename = Path(filename)
 
@@ -4611,7 +5607,7 @@ class DoclingDocument(BaseModel):
             artifacts_dir, image_mode, page_no, reference_path=reference_path
         )
 
-        html_out = new_doc.export_to_html(
+        serializer = new_doc._get_html_serializer(
             from_element=from_element,
             to_element=to_element,
             labels=labels,
@@ -4626,7 +5622,7 @@ class DoclingDocument(BaseModel):
         )
 
         with open(filename, "w", encoding="utf-8") as fw:
-            fw.write(html_out)
+            serializer.serialize_to_stream(fw)
 
     def _get_output_paths(
         self, filename: Union[str, Path], artifacts_dir: Optional[Path] = None
@@ -4681,6 +5677,38 @@ class DoclingDocument(BaseModel):
         include_annotations: bool = True,
     ) -> str:
         r"""Serialize to HTML."""
+        serializer = self._get_html_serializer(
+            from_element=from_element,
+            to_element=to_element,
+            labels=labels,
+            enable_chart_tables=enable_chart_tables,
+            image_mode=image_mode,
+            formula_to_mathml=formula_to_mathml,
+            page_no=page_no,
+            html_lang=html_lang,
+            html_head=html_head,
+            included_content_layers=included_content_layers,
+            split_page_view=split_page_view,
+            include_annotations=include_annotations,
+        )
+        return serializer.serialize().text
+
+    def _get_html_serializer(
+        self,
+        from_element: int = 0,
+        to_element: int = sys.maxsize,
+        labels: Optional[set[DocItemLabel]] = None,
+        enable_chart_tables: bool = True,
+        image_mode: ImageRefMode = ImageRefMode.PLACEHOLDER,
+        formula_to_mathml: bool = True,
+        page_no: Optional[int] = None,
+        html_lang: str = "en",
+        html_head: str = "null",
+        included_content_layers: Optional[set[ContentLayer]] = None,
+        split_page_view: bool = False,
+        include_annotations: bool = True,
+    ) -> "HTMLDocSerializer":
+        # the serializer behind export_to_html() and save_as_html()
         from docling_core.transforms.serializer.html import (
             HTMLDocSerializer,
             HTMLOutputStyle,
@@ -4720,9 +5748,7 @@ class DoclingDocument(BaseModel):
             doc=self,
             params=params,
         )
-        ser_res = serializer.serialize()
-
-        return ser_res.text
+        return serializer
 
     @staticmethod
     def load_from_doctags(  # noqa: C901
@@ -5243,11 +6269,14 @@ class DoclingDocument(BaseModel):
         add_table_cell_text: bool = True,
         minified: bool = False,
     ):
-        r"""Save the document content to DocTags format."""
+        r"""Save the document content to DocTags format.
+
+        The output is written while the document is serialized, with the same content
+        as `export_to_doctags()`.
+        """
         if isinstance(filename, str):
             filename = Path(filename)
-        out = self.export_to_doctags(
-            delim=delim,
+        serializer = self._get_doctags_serializer(
             from_element=from_element,
             to_element=to_element,
             labels=labels,
@@ -5263,7 +6292,7 @@ class DoclingDocument(BaseModel):
         )
 
         with open(filename, "w", encoding="utf-8") as fw:
-            fw.write(out)
+            serializer.serialize_to_stream(fw)
 
     @deprecated("Use export_to_doctags() instead.")
     def export_to_document_tokens(self, *args, **kwargs):
@@ -5308,6 +6337,38 @@ class DoclingDocument(BaseModel):
         :returns: The content of the document formatted as a DocTags string.
         :rtype: str
         """
+        serializer = self._get_doctags_serializer(
+            from_element=from_element,
+            to_element=to_element,
+            labels=labels,
+            xsize=xsize,
+            ysize=ysize,
+            add_location=add_location,
+            add_content=add_content,
+            add_page_index=add_page_index,
+            add_table_cell_location=add_table_cell_location,
+            add_table_cell_text=add_table_cell_text,
+            minified=minified,
+            pages=pages,
+        )
+        return serializer.serialize().text
+
+    def _get_doctags_serializer(
+        self,
+        from_element: int = 0,
+        to_element: int = sys.maxsize,
+        labels: Optional[set[DocItemLabel]] = None,
+        xsize: int = 500,
+        ysize: int = 500,
+        add_location: bool = True,
+        add_content: bool = True,
+        add_page_index: bool = True,
+        add_table_cell_location: bool = False,
+        add_table_cell_text: bool = True,
+        minified: bool = False,
+        pages: Optional[set[int]] = None,
+    ) -> "DocTagsDocSerializer":
+        # the serializer behind export_to_doctags() and save_as_doctags()
         from docling_core.transforms.serializer.doctags import (
             DocTagsDocSerializer,
             DocTagsParams,
@@ -5337,8 +6398,7 @@ class DoclingDocument(BaseModel):
                 ),
             ),
         )
-        ser_res = serializer.serialize()
-        return ser_res.text
+        return serializer
 
     def _export_to_indented_text(
         self,
@@ -5363,6 +6423,7 @@ class DoclingDocument(BaseModel):
 
                 return text[0:tbeg] + middle + text[-tend:]
 
+        rich_cell_ser: Optional["BaseDocSerializer"] = None
         for i, (item, level) in enumerate(self.iterate_items(with_groups=True)):
             if isinstance(item, GroupItem):
                 result.append(
@@ -5422,13 +6483,18 @@ class DoclingDocument(BaseModel):
                     )
 
                 if explicit_tables:
+                    if rich_cell_ser is None:
+                        rich_cell_ser = item._get_rich_cell_serializer(doc=self)
                     grid: list[list[str]] = []
                     for i, row in enumerate(item.data.grid):
                         grid.append([])
                         for j, cell in enumerate(row):
                             if j < 10:
                                 text = get_text(
-                                    cell._get_text(doc=self), max_text_len=16
+                                    cell._get_text(
+                                        doc=self, doc_serializer=rich_cell_ser
+                                    ),
+                                    max_text_len=16,
                                 )
                                 grid[-1].append(text)
 
@@ -5556,7 +6622,13 @@ class DoclingDocument(BaseModel):
         else:
             return CURRENT_VERSION
 
-    @model_validator(mode="after")  # type: ignore
+    @model_validator(mode="after")
+    def validate_consistency(self, info: ValidationInfo) -> Self:
+        """Run the document consistency checks, unless the input is trusted."""
+        if _is_trusted(info):
+            return self
+        return self.check_consistency()
+
     @classmethod
     def validate_document(cls, d: "DoclingDocument"):
         """validate_document."""
@@ -5568,7 +6640,6 @@ class DoclingDocument(BaseModel):
 
         return d
 
-    @model_validator(mode="after")
     def validate_misplaced_list_items(self):
         """validate_misplaced_list_items."""
         # find list items without list parent, putting succesive ones together
@@ -5584,7 +6655,7 @@ class DoclingDocument(BaseModel):
                 or not isinstance(item.parent.resolve(doc=self), ListGroup)
             ):
                 if isinstance(prev, ListItem) and (
-                    prev.parent is None or prev.parent.resolve(self) == self.body
+                    prev.parent is None or prev.parent.cref == self.body.self_ref
                 ):  # case of continuing list
                     misplaced_list_items[-1].append(item)
                 else:  # case of new list
@@ -5733,6 +6804,7 @@ class DoclingDocument(BaseModel):
             return " + ".join(self._names)
 
     def _update_from_index(self, doc_index: "_DocIndex") -> None:
+        self._cache.clear()
         if doc_index._body is not None:
             self.body = doc_index._body
         self.groups = doc_index.groups
@@ -5808,6 +6880,7 @@ class DoclingDocument(BaseModel):
                     f"Trying to add cell with another parent {item.parent} to {table_item.self_ref}"
                 )
         table_item.data.table_cells.append(cell)
+        table_item.data._invalidate_grid()
 
 
 # deprecated aliases (kept for backwards compatibility):
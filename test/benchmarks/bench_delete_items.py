@@ -0,0 +1,251 @@
+"""Benchmark of the batch deletion of document items.
+
+Compares `DoclingDocument.delete_items()` with the previous implementation (kept
+below as reference), which checked list membership of RefItems and summed over all
+deleted indices to renumber each reference. Both implementations are checked to
+produce the same document.
+
+Run with: `python -m test.benchmarks.bench_delete_items`
+"""
+
+import argparse
+import copy
+import time
+
+from docling_core.types.doc.document import (
+    BoundingBox,
+    ContentLayer,
+    DoclingDocument,
+    FloatingItem,
+    NodeItem,
+    ProvenanceItem,
+    RefItem,
+    RichTableCell,
+    TableCell,
+    TableData,
+    TableItem,
+)
+from docling_core.types.doc.labels import DocItemLabel, GroupLabel
+
+
+def _make_doc(num_pages: int, items_per_page: int) -> DoclingDocument:
+    doc = DoclingDocument(name="bench")
+    for page_no in range(1, num_pages + 1):
+        prov = ProvenanceItem(
+            page_no=page_no,
+            bbox=BoundingBox(l=0, t=0, r=1, b=1),
+            charspan=(0, 1),
+        )
+        doc.add_text(
+            label=DocItemLabel.PAGE_HEADER,
+            text=f"Header {page_no}",
+            prov=prov,
+            content_layer=ContentLayer.FURNITURE,
+        )
+        group = doc.add_group(label=GroupLabel.SECTION, name=f"page {page_no}")
+        for i in range(items_per_page):
+            doc.add_text(label=DocItemLabel.TEXT, text=f"Text {page_no}.{i}", prov=prov)
+        caption = doc.add_text(
+            label=DocItemLabel.CAPTION, text=f"Table {page_no}", prov=prov
+        )
+        table = doc.add_table(
+            data=TableData(num_rows=1, num_cols=2),
+            caption=caption,
+            prov=prov,
+            parent=group,
+        )
+        rich_item = doc.add_text(
+            label=DocItemLabel.TEXT, text="rich", prov=prov, parent=table
+        )
+        doc.add_table_cell(
+            table_item=table,
+            cell=TableCell(
+                text="plain",
+                start_row_offset_idx=0,
+                end_row_offset_idx=1,
+                start_col_offset_idx=0,
+                end_col_offset_idx=1,
+            ),
+        )
+        doc.add_table_cell(
+            table_item=table,
+            cell=RichTableCell(
+                text="rich",
+                ref=rich_item.get_ref(),
+                start_row_offset_idx=0,
+                end_row_offset_idx=1,
+                start_col_offset_idx=1,
+                end_col_offset_idx=2,
+            ),
+        )
+        doc.add_text(
+            label=DocItemLabel.PAGE_FOOTER,
+            text=f"Footer {page_no}",
+            prov=prov,
+            content_layer=ContentLayer.FURNITURE,
+        )
+    return doc
+
+
+# --- previous implementation, kept as reference ---
+
+
+def _legacy_update_ref_with_lookup(
+    item_label: str, item_index: int, lookup: dict[str, dict[int, int]]
+) -> RefItem:
+    if item_label not in lookup:
+        return RefItem(cref=f"#/{item_label}/{item_index}")
+    delta = sum(
+        val if item_index >= key else 0 for key, val in lookup[item_label].items()
+    )
+    return RefItem(cref=f"#/{item_label}/{item_index + delta}")
+
+
+def _legacy_update_refitems_with_lookup(
+    ref_items: list[RefItem],
+    refs_to_be_deleted: list[RefItem],
+    lookup: dict[str, dict[int, int]],
+) -> list[RefItem]:
+    new_refitems = []
+    for ref_item in ref_items:
+        if ref_item not in refs_to_be_deleted:
+            path = ref_item._split_ref_to_path()
+            if len(path) == 3:
+                new_refitems.append(
+                    _legacy_update_ref_with_lookup(
+                        item_label=path[1], item_index=int(path[2]), lookup=lookup
+                    )
+                )
+            else:
+                new_refitems.append(ref_item)
+    return new_refitems
+
+
+def _legacy_update_breadth_first_with_lookup(
+    doc: DoclingDocument,
+    node: NodeItem,
+    refs_to_be_deleted: list[RefItem],
+    lookup: dict[str, dict[int, int]],
+) -> None:
+    if isinstance(node, FloatingItem):
+        node.captions = _legacy_update_refitems_with_lookup(
+            node.captions, refs_to_be_deleted, lookup
+        )
+        node.references = _legacy_update_refitems_with_lookup(
+            node.references, refs_to_be_deleted, lookup
+        )
+        node.footnotes = _legacy_update_refitems_with_lookup(
+            node.footnotes, refs_to_be_deleted, lookup
+        )
+        if isinstance(node, TableItem):
+            for cell in node.data.table_cells:
+                if isinstance(cell, RichTableCell):
+                    path = cell.ref._split_ref_to_path()
+                    cell.ref = _legacy_update_ref_with_lookup(
+                        item_label=path[1], item_index=int(path[2]), lookup=lookup
+                    )
+    if node.parent is not None:
+        path = node.parent._split_ref_to_path()
+        if len(path) == 3:
+            node.parent = _legacy_update_ref_with_lookup(
+                item_label=path[1], item_index=int(path[2]), lookup=lookup
+            )
+    path = node.self_ref.split("/")
+    if len(path) == 3:
+        node.self_ref = _legacy_update_ref_with_lookup(
+            item_label=path[1], item_index=int(path[2]), lookup=lookup
+        ).cref
+    node.children = _legacy_update_refitems_with_lookup(
+        node.children, refs_to_be_deleted, lookup
+    )
+    for child_ref in node.children:
+        _legacy_update_breadth_first_with_lookup(
+            doc, child_ref.resolve(doc), refs_to_be_deleted, lookup
+        )
+
+
+def _legacy_delete_items(doc: DoclingDocument, refs: list[RefItem]) -> None:
+    to_be_deleted_items: dict[tuple[int, ...], str] = {}
+    for item, stack in doc._iterate_items_with_stack(
+        with_groups=True,
+        traverse_pictures=True,
+        included_content_layers={c for c in ContentLayer},
+    ):
+        ref = item.get_ref()
+        if ref in refs:
+            to_be_deleted_items[tuple(stack)] = ref.cref
+        substacks = [stack[0 : i + 1] for i in range(len(stack) - 1)]
+        for substack in substacks:
+            if tuple(substack) in to_be_deleted_items:
+                to_be_deleted_items[tuple(stack)] = ref.cref
+
+    for stack_, _ in reversed(sorted(to_be_deleted_items.items())):
+        if not doc.body._delete_child(doc=doc, stack=list(stack_)):
+            del to_be_deleted_items[stack_]
+
+    lookup: dict[str, dict[int, int]] = {}
+    for ref_ in to_be_deleted_items.values():
+        path = ref_.split("/")
+        if len(path) == 3:
+            lookup.setdefault(path[1], {})[int(path[2])] = -1
+
+    for item_label, item_inds in lookup.items():
+        for item_index in reversed(sorted(item_inds)):
+            del doc.__getattribute__(item_label)[item_index]
+
+    _legacy_update_breadth_first_with_lookup(doc, doc.body, refs, lookup)
+
+
+# --- benchmark ---
+
+
+def _furniture_refs(doc: DoclingDocument) -> list[RefItem]:
+    return [
+        item.get_ref()
+        for item, _ in doc.iterate_items(
+            included_content_layers={ContentLayer.FURNITURE}
+        )
+    ]
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, nargs="+", default=[50, 100, 200])
+    parser.add_argument("--items-per-page", type=int, default=20)
+    parser.add_argument(
+        "--skip-legacy",
+        action="store_true",
+        help="only time the current implementation, e.g. for large documents",
+    )
+    args = parser.parse_args()
+
+    print(f"{'pages':>6} {'items':>8} {'deleted':>8} {'legacy [s]':>11} {'new [s]':>8}")
+    for num_pages in args.pages:
+        doc = _make_doc(num_pages=num_pages, items_per_page=args.items_per_page)
+        refs = _furniture_refs(doc)
+        num_items = len(doc.texts) + len(doc.tables) + len(doc.groups)
+
+        legacy_time = float("nan")
+        if not args.skip_legacy:
+            legacy_doc = copy.deepcopy(doc)
+            start = time.perf_counter()
+            _legacy_delete_items(legacy_doc, refs=refs)
+            legacy_time = time.perf_counter() - start
+
+        new_doc = copy.deepcopy(doc)
+        start = time.perf_counter()
+        new_doc.delete_items(node_items=[r.resolve(new_doc) for r in refs])
+        new_time = time.perf_counter() - start
+
+        if not args.skip_legacy:
+            assert new_doc.export_to_dict() == legacy_doc.export_to_dict()
+
+        print(
+            f"{num_pages:>6} {num_items:>8} {len(refs):>8} "
+            f"{legacy_time:>11.3f} {new_time:>8.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""Benchmark of the doc-items windowing of the hybrid chunker.
+
+Compares `HybridChunker._split_by_doc_items()` with the previous implementation
+(kept below as reference), which grew the window one item at a time and serialized
+and tokenized the whole window at each step, on synthetic sections of increasing
+size. The tokenizer work is measured as the number of tokens passed through a
+whitespace tokenizer, and both implementations are checked to produce the same
+chunks.
+
+Run with: `python -m test.benchmarks.bench_hybrid_chunker`
+"""
+
+import argparse
+import time
+from typing import Any
+
+from docling_core.transforms.chunker import DocChunk
+from docling_core.transforms.chunker.hybrid_chunker import HybridChunker
+from docling_core.transforms.chunker.tokenizer.base import BaseTokenizer
+from docling_core.transforms.serializer.base import BaseDocSerializer
+from docling_core.types.doc.document import DoclingDocument
+from docling_core.types.doc.labels import GroupLabel
+
+
+class _CountingTokenizer(BaseTokenizer):
+    max_tokens: int
+    num_tokens: int = 0
+
+    def count_tokens(self, text: str) -> int:
+        count = len(text.split())
+        self.num_tokens += count
+        return count
+
+    def get_max_tokens(self) -> int:
+        return self.max_tokens
+
+    def get_tokenizer(self) -> Any:
+        return lambda text: len(text.split())
+
+
+class _LegacyHybridChunker(HybridChunker):
+    def _split_by_doc_items(
+        self, doc_chunk: DocChunk, doc_serializer: BaseDocSerializer
+    ) -> list[DocChunk]:
+        chunks = []
+        window_start = 0
+        window_end = 0  # an inclusive index
+        num_items = len(doc_chunk.meta.doc_items)
+        while window_end < num_items:
+            new_chunk = self._make_chunk_from_doc_items(
+                doc_chunk=doc_chunk,
+                window_start=window_start,
+                window_end=window_end,
+                doc_serializer=doc_serializer,
+            )
+            if self._count_chunk_tokens(doc_chunk=new_chunk) <= self.max_tokens:
+                if window_end < num_items - 1:
+                    window_end += 1
+                    continue
+                else:
+                    window_end = num_items
+            elif window_start == window_end:
+                window_end += 1
+                window_start = window_end
+            else:
+                new_chunk = self._make_chunk_from_doc_items(
+                    doc_chunk=doc_chunk,
+                    window_start=window_start,
+                    window_end=window_end - 1,
+                    doc_serializer=doc_serializer,
+                )
+                window_start = window_end
+            chunks.append(new_chunk)
+        return chunks
+
+
+def _make_doc(num_items: int) -> DoclingDocument:
+    doc = DoclingDocument(name="bench")
+    doc.add_heading(text="A long section")
+    group = doc.add_group(label=GroupLabel.LIST)
+    for i in range(num_items):
+        doc.add_list_item(
+            text=f"Item {i} of a long list, made of about a dozen words each.",
+            parent=group,
+        )
+    return doc
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 400, 1600])
+    parser.add_argument("--max-tokens", type=int, default=512)
+    args = parser.parse_args()
+
+    print(
+        f"{'items':>6} {'legacy tokens':>14} {'legacy [ms]':>12} "
+        f"{'tokens':>10} {'time [ms]':>10}"
+    )
+    for size in args.sizes:
+        doc = _make_doc(size)
+        results = []
+        for chunker_cls in (_LegacyHybridChunker, HybridChunker):
+            tokenizer = _CountingTokenizer(max_tokens=args.max_tokens)
+            chunker = chunker_cls(tokenizer=tokenizer, merge_peers=False)
+            start = time.perf_counter()
+            chunks = [c.export_json_dict() for c in chunker.chunk(dl_doc=doc)]
+            results.append((chunks, tokenizer.num_tokens, time.perf_counter() - start))
+        assert results[0][0] == results[1][0]
+        print(
+            f"{size:>6} {results[0][1]:>14} {results[0][2] * 1e3:>12.1f} "
+            f"{results[1][1]:>10} {results[1][2] * 1e3:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
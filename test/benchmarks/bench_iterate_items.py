@@ -0,0 +1,150 @@
+"""Benchmark of the document tree traversal.
+
+Compares `DoclingDocument.iterate_items()` with the previous recursive generator
+(kept below as reference), for a first (cold) traversal and for repeated traversals
+of an unchanged document, which scan the cached pre-order array. Both
+implementations are checked to yield the same items and levels.
+
+Run with: `python -m test.benchmarks.bench_iterate_items`
+"""
+
+import argparse
+import glob
+import time
+import typing
+from typing import Optional
+
+from docling_core.types.doc.document import (
+    DEFAULT_CONTENT_LAYERS,
+    ContentLayer,
+    DocItem,
+    DoclingDocument,
+    GroupItem,
+    NodeItem,
+    PictureItem,
+)
+
+
+def _legacy_iterate_items(
+    doc: DoclingDocument,
+    root: Optional[NodeItem] = None,
+    with_groups: bool = False,
+    traverse_pictures: bool = False,
+    page_no: Optional[int] = None,
+    included_content_layers: Optional[set[ContentLayer]] = None,
+    _stack: Optional[list[int]] = None,
+) -> typing.Iterable[tuple[NodeItem, int]]:
+    my_layers = (
+        included_content_layers
+        if included_content_layers is not None
+        else DEFAULT_CONTENT_LAYERS
+    )
+    my_stack: list[int] = _stack if _stack is not None else []
+
+    if not root:
+        root = doc.body
+
+    should_yield = (
+        (not isinstance(root, GroupItem) or with_groups)
+        and (
+            not isinstance(root, DocItem)
+            or (page_no is None or any(prov.page_no == page_no for prov in root.prov))
+        )
+        and root.content_layer in my_layers
+    )
+
+    if should_yield:
+        yield root, len(my_stack)
+
+    my_stack.append(-1)
+
+    allowed_pic_refs: set[str] = (
+        {r.cref for r in root.captions}
+        if (root_is_picture := isinstance(root, PictureItem))
+        else set()
+    )
+
+    for child_ind, child_ref in enumerate(root.children):
+        child = child_ref.resolve(doc)
+        if (
+            root_is_picture
+            and not traverse_pictures
+            and isinstance(child, NodeItem)
+            and child.self_ref not in allowed_pic_refs
+        ):
+            continue
+        my_stack[-1] = child_ind
+
+        if isinstance(child, NodeItem):
+            yield from _legacy_iterate_items(
+                doc,
+                child,
+                with_groups=with_groups,
+                traverse_pictures=traverse_pictures,
+                page_no=page_no,
+                _stack=my_stack,
+                included_content_layers=my_layers,
+            )
+
+    my_stack.pop()
+
+
+_CONFIGS: list[dict] = [
+    {},
+    {"with_groups": True, "traverse_pictures": True},
+    {"included_content_layers": set(ContentLayer), "with_groups": True},
+    {"page_no": 1},
+]
+
+
+def _time(func: typing.Callable[[], list], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pattern", default="test/data/doc/*.json")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print(
+        f"{'document':<36} {'items':>6} {'legacy [ms]':>12} "
+        f"{'cold [ms]':>10} {'cached [ms]':>12}"
+    )
+    for filename in sorted(glob.glob(args.pattern)):
+        try:
+            doc = DoclingDocument.load_from_json(filename)
+        except Exception:
+            continue
+
+        legacy_time = cold_time = cached_time = 0.0
+        for config in _CONFIGS:
+            expected = list(_legacy_iterate_items(doc, **config))
+            assert [
+                (it.self_ref, level) for it, level in doc.iterate_items(**config)
+            ] == [(it.self_ref, level) for it, level in expected]
+
+            legacy_time += _time(
+                lambda: list(_legacy_iterate_items(doc, **config)), args.repeat
+            )
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                doc._cache.clear()
+                list(doc.iterate_items(**config))
+            cold_time += (time.perf_counter() - start) / args.repeat
+            cached_time += _time(lambda: list(doc.iterate_items(**config)), args.repeat)
+
+        num_items = sum(1 for _ in doc.iterate_items(**_CONFIGS[2]))
+        print(
+            f"{filename.split('/')[-1][:36]:<36} {num_items:>6} "
+            f"{legacy_time * 1e3:>12.2f} {cold_time * 1e3:>10.2f} "
+            f"{cached_time * 1e3:>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
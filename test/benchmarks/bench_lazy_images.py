@@ -0,0 +1,106 @@
+"""Benchmark of the loading of documents with embedded images.
+
+Compares the time and the memory held after `DoclingDocument.load_from_json()` of a
+document with embedded page and picture images, when the images are loaded eagerly
+and when they are left in the file with `lazy_images=True`. Each load runs in its
+own process, and the memory is the growth of its resident set size (Linux only).
+Both loads are checked to give the same document.
+
+Run with: `python -m test.benchmarks.bench_lazy_images`
+"""
+
+import argparse
+import gc
+import multiprocessing
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from PIL import Image as PILImage
+
+from docling_core.types.doc.document import (
+    BoundingBox,
+    DoclingDocument,
+    ImageRef,
+    ProvenanceItem,
+    Size,
+)
+from docling_core.types.doc.labels import DocItemLabel
+
+
+def _make_doc(num_pages: int, image_size: int) -> DoclingDocument:
+    doc = DoclingDocument(name="bench")
+    for page_no in range(1, num_pages + 1):
+        image = PILImage.effect_noise((image_size, image_size), 64).convert("RGB")
+        doc.add_page(
+            page_no=page_no,
+            size=Size(width=image_size, height=image_size),
+            image=ImageRef.from_pil(image, dpi=72),
+            metadata={},
+        )
+        prov = ProvenanceItem(
+            page_no=page_no,
+            bbox=BoundingBox(l=0, t=0, r=image_size, b=image_size),
+            charspan=(0, 1),
+        )
+        for i in range(20):
+            doc.add_text(label=DocItemLabel.TEXT, text=f"Text {page_no}.{i}", prov=prov)
+        doc.add_picture(image=ImageRef.from_pil(image, dpi=72), prov=prov)
+    return doc
+
+
+def _rss() -> int:
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def _load(filename: Path, lazy_images: bool, queue: multiprocessing.Queue) -> None:
+    gc.collect()
+    rss = _rss()
+    start = time.perf_counter()
+    doc = DoclingDocument.load_from_json(filename, lazy_images=lazy_images)
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    queue.put((elapsed, (_rss() - rss) / 2**20, doc.export_to_dict()))
+
+
+def _measure(filename: Path, lazy_images: bool) -> tuple[float, float, dict]:
+    queue: multiprocessing.Queue = multiprocessing.Queue()
+    process = multiprocessing.Process(target=_load, args=(filename, lazy_images, queue))
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, nargs="+", default=[10, 20, 40])
+    parser.add_argument("--image-size", type=int, default=400)
+    args = parser.parse_args()
+
+    print(
+        f"{'pages':>6} {'file [MB]':>10} {'eager [s]':>10} {'eager mem [MB]':>15} "
+        f"{'lazy [s]':>9} {'lazy mem [MB]':>14}"
+    )
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        filename = Path(tmp_dir) / "doc.json"
+        for num_pages in args.pages:
+            _make_doc(num_pages=num_pages, image_size=args.image_size).save_as_json(
+                filename
+            )
+            eager_time, eager_mem, eager_dict = _measure(filename, lazy_images=False)
+            lazy_time, lazy_mem, lazy_dict = _measure(filename, lazy_images=True)
+            assert lazy_dict == eager_dict
+
+            print(
+                f"{num_pages:>6} {filename.stat().st_size / 2**20:>10.1f} "
+                f"{eager_time:>10.2f} {eager_mem:>15.1f} "
+                f"{lazy_time:>9.2f} {lazy_mem:>14.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
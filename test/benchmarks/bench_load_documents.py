@@ -0,0 +1,155 @@
+"""Benchmark of the loading of documents, with focus on the tree validation.
+
+Times `DoclingDocument.model_validate_json()` on the test/data/doc corpus, and the
+tree validation run at load time, i.e. `validate_tree()` on body and furniture plus
+the scan of `validate_misplaced_list_items()`, against the previous implementation
+(kept below as reference), which recursed over the tree and compared the items
+with pydantic equality.
+
+Run with: `python -m test.benchmarks.bench_load_documents`
+"""
+
+import argparse
+import glob
+import time
+import typing
+import warnings
+from typing import Optional
+
+from docling_core.types.doc.document import (
+    ContentLayer,
+    DoclingDocument,
+    ListGroup,
+    ListItem,
+    NodeItem,
+    RichTableCell,
+    TableItem,
+)
+
+
+def _legacy_validate_tree(doc: DoclingDocument, root: NodeItem) -> bool:
+    for child_ref in root.children:
+        child = child_ref.resolve(doc)
+        if child.parent.resolve(doc) != root or not _legacy_validate_tree(doc, child):
+            return False
+
+    if isinstance(root, TableItem):
+        for cell in root.data.table_cells:
+            if isinstance(cell, RichTableCell) and (
+                (par_ref := cell.ref.resolve(doc).parent) is None
+                or par_ref.resolve(doc) != root
+            ):
+                return False
+
+    return True
+
+
+def _legacy_find_misplaced_list_items(doc: DoclingDocument) -> list[list[ListItem]]:
+    misplaced_list_items: list[list[ListItem]] = []
+    prev: Optional[NodeItem] = None
+    for item, _ in doc.iterate_items(
+        traverse_pictures=True,
+        included_content_layers={c for c in ContentLayer},
+        with_groups=True,
+    ):
+        if isinstance(item, ListItem) and (
+            item.parent is None
+            or not isinstance(item.parent.resolve(doc=doc), ListGroup)
+        ):
+            if isinstance(prev, ListItem) and (
+                prev.parent is None or prev.parent.resolve(doc) == doc.body
+            ):
+                misplaced_list_items[-1].append(item)
+            else:
+                misplaced_list_items.append([item])
+        prev = item
+    return misplaced_list_items
+
+
+def _find_misplaced_list_items(doc: DoclingDocument) -> list[list[ListItem]]:
+    # same scan as in validate_misplaced_list_items(), which also fixes the items
+    misplaced_list_items: list[list[ListItem]] = []
+    prev: Optional[NodeItem] = None
+    for item, _ in doc.iterate_items(
+        traverse_pictures=True,
+        included_content_layers={c for c in ContentLayer},
+        with_groups=True,
+    ):
+        if isinstance(item, ListItem) and (
+            item.parent is None
+            or not isinstance(item.parent.resolve(doc=doc), ListGroup)
+        ):
+            if isinstance(prev, ListItem) and (
+                prev.parent is None or prev.parent.cref == doc.body.self_ref
+            ):
+                misplaced_list_items[-1].append(item)
+            else:
+                misplaced_list_items.append([item])
+        prev = item
+    return misplaced_list_items
+
+
+def _time(func: typing.Callable[[], typing.Any], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pattern", default="test/data/doc/*.json")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+    warnings.filterwarnings("ignore", category=DeprecationWarning)
+
+    print(
+        f"{'document':<36} {'items':>6} {'load [ms]':>10} "
+        f"{'legacy validation [ms]':>23} {'validation [ms]':>16}"
+    )
+    total_load = total_legacy = total_new = 0.0
+    for filename in sorted(glob.glob(args.pattern)):
+        with open(filename) as fr:
+            json_str = fr.read()
+        try:
+            doc = DoclingDocument.model_validate_json(json_str)
+        except Exception:
+            continue
+
+        def _legacy() -> None:
+            doc._cache.clear()
+            assert _legacy_validate_tree(doc, doc.body)
+            assert _legacy_validate_tree(doc, doc.furniture)
+            _legacy_find_misplaced_list_items(doc)
+
+        def _new() -> None:
+            doc._cache.clear()
+            assert doc.validate_tree(doc.body)
+            assert doc.validate_tree(doc.furniture)
+            _find_misplaced_list_items(doc)
+
+        load_time = _time(
+            lambda: DoclingDocument.model_validate_json(json_str), args.repeat
+        )
+        legacy_time = _time(_legacy, args.repeat)
+        new_time = _time(_new, args.repeat)
+        total_load += load_time
+        total_legacy += legacy_time
+        total_new += new_time
+
+        num_items = len(doc.groups) + len(doc.texts) + len(doc.pictures)
+        num_items += len(doc.tables) + len(doc.key_value_items) + len(doc.form_items)
+        print(
+            f"{filename.split('/')[-1][:36]:<36} {num_items:>6} "
+            f"{load_time * 1e3:>10.2f} {legacy_time * 1e3:>23.2f} "
+            f"{new_time * 1e3:>16.2f}"
+        )
+    print(
+        f"{'total':<36} {'':>6} {total_load * 1e3:>10.2f} "
+        f"{total_legacy * 1e3:>23.2f} {total_new * 1e3:>16.2f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Benchmark of the page-aware document assembly on a synthetic long document.
+
+Compares the assembly of the Markdown output with page-break placeholders and of
+the pages of the split-page HTML view out of the serialized parts, which locate the
+page breaks from the parts themselves, with the previous behavior (emulated below
+as reference), which searched the joined text for page-break markers. Both are
+checked to produce the same output.
+
+Run with: `python -m test.benchmarks.bench_page_breaks`
+"""
+
+import argparse
+import re
+import time
+
+from docling_core.transforms.serializer.html import (
+    HTMLDocSerializer,
+    HTMLOutputStyle,
+    HTMLParams,
+)
+from docling_core.transforms.serializer.markdown import (
+    MarkdownDocSerializer,
+    MarkdownParams,
+)
+from docling_core.types.doc.base import BoundingBox, Size
+from docling_core.types.doc.document import DoclingDocument, ProvenanceItem
+from docling_core.types.doc.labels import DocItemLabel
+
+_PATTERN = r"#_#_DOCLING_DOC_PAGE_BREAK_(\d+)_(\d+)_#_#"
+
+
+def _legacy_join(texts: list[str], delim: str, page_sep: str) -> str:
+    text_res = delim.join(texts)
+    for match in re.finditer(_PATTERN, text_res):
+        text_res = text_res.replace(match.group(0), page_sep)
+    return text_res
+
+
+def _legacy_pages(texts: list[str]) -> dict[int, str]:
+    html_content = "\n".join(texts)
+    next_page = None
+    prev_full_match_end = 0
+    pages = {}
+    for match in re.finditer(_PATTERN, html_content):
+        full_match = match.group(0)
+        prev_page, next_page = int(match.group(1)), int(match.group(2))
+        this_match_start = html_content.find(full_match)
+        pages[prev_page] = html_content[prev_full_match_end:this_match_start]
+        prev_full_match_end = this_match_start + len(full_match)
+    if next_page is not None:
+        pages[next_page] = html_content[prev_full_match_end:]
+    return pages
+
+
+def _make_doc(num_pages: int) -> DoclingDocument:
+    doc = DoclingDocument(name="bench")
+    bbox = BoundingBox(l=0, t=0, r=1, b=1)
+    for page_no in range(1, num_pages + 1):
+        doc.add_page(page_no=page_no, size=Size(width=100, height=100), metadata={})
+        prov = ProvenanceItem(page_no=page_no, bbox=bbox, charspan=(0, 1))
+        doc.add_heading(text=f"Section {page_no}", prov=prov)
+        for i in range(10):
+            doc.add_text(
+                label=DocItemLabel.TEXT,
+                text=f"Paragraph {i} of page {page_no}, with some text. " * 5,
+                prov=prov,
+            )
+        group = doc.add_list_group()
+        for i in range(3):
+            doc.add_list_item(text=f"Item {i}", parent=group, prov=prov)
+    return doc
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, nargs="+", default=[100, 300, 1000])
+    args = parser.parse_args()
+
+    print(f"{'pages':>6} {'output':>8} {'legacy [s]':>11} {'new [s]':>8}")
+    for num_pages in args.pages:
+        doc = _make_doc(num_pages)
+
+        md_ser = MarkdownDocSerializer(
+            doc=doc, params=MarkdownParams(page_break_placeholder="<!-- pb -->")
+        )
+        parts = md_ser.get_parts()
+        start = time.perf_counter()
+        expected = _legacy_join([p.text for p in parts], "\n\n", "<!-- pb -->")
+        legacy_time = time.perf_counter() - start
+        start = time.perf_counter()
+        actual = md_ser.serialize_doc(parts=parts).text
+        new_time = time.perf_counter() - start
+        assert actual == expected
+        print(f"{num_pages:>6} {'md':>8} {legacy_time:>11.3f} {new_time:>8.3f}")
+
+        html_ser = HTMLDocSerializer(
+            doc=doc, params=HTMLParams(output_style=HTMLOutputStyle.SPLIT_PAGE)
+        )
+        parts = html_ser.get_parts()
+        start = time.perf_counter()
+        expected_pages = _legacy_pages([p.text for p in parts])
+        legacy_time = time.perf_counter() - start
+        start = time.perf_counter()
+        actual_pages = html_ser._split_pages(parts=parts, applicable_pages=None)
+        new_time = time.perf_counter() - start
+        assert actual_pages == expected_pages
+        print(f"{num_pages:>6} {'html':>8} {legacy_time:>11.3f} {new_time:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
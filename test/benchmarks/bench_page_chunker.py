@@ -0,0 +1,97 @@
+"""Benchmark of the page chunker on a synthetic long document.
+
+Compares `PageChunker.chunk()`, which buckets the nodes by page in a single
+traversal and serializes each page out of its bucket, with the previous
+implementation (kept below as reference), which serialized the whole document
+restricted to each page in turn. Both implementations are checked to produce the
+same chunks.
+
+Run with: `python -m test.benchmarks.bench_page_chunker`
+"""
+
+import argparse
+import time
+from typing import Optional
+
+from docling_core.transforms.chunker.page_chunker import PageChunker
+from docling_core.transforms.serializer.base import BaseDocSerializer
+from docling_core.types.doc.document import (
+    BoundingBox,
+    DoclingDocument,
+    NodeItem,
+    ProvenanceItem,
+    Size,
+    TableCell,
+    TableData,
+)
+from docling_core.types.doc.labels import DocItemLabel, GroupLabel
+
+
+class _LegacyPageChunker(PageChunker):
+    @staticmethod
+    def _get_page_buckets(
+        doc_ser: BaseDocSerializer,
+    ) -> Optional[dict[int, list[NodeItem]]]:
+        return None
+
+
+def _make_doc(num_pages: int) -> DoclingDocument:
+    doc = DoclingDocument(name="bench")
+    for page_no in range(1, num_pages + 1):
+        doc.add_page(page_no=page_no, size=Size(width=100, height=100), metadata={})
+        prov = ProvenanceItem(
+            page_no=page_no,
+            bbox=BoundingBox(l=0, t=0, r=100, b=100),
+            charspan=(0, 1),
+        )
+        doc.add_heading(text=f"Section {page_no}", prov=prov)
+        for i in range(5):
+            doc.add_text(
+                label=DocItemLabel.TEXT,
+                text=f"Paragraph {i} of page {page_no}.",
+                prov=prov,
+            )
+        group = doc.add_group(label=GroupLabel.LIST)
+        for i in range(3):
+            doc.add_list_item(text=f"Item {i}", parent=group, prov=prov)
+        table_data = TableData(num_rows=2, num_cols=2)
+        for row in range(2):
+            for col in range(2):
+                table_data.table_cells.append(
+                    TableCell(
+                        text=f"{row}.{col}",
+                        start_row_offset_idx=row,
+                        end_row_offset_idx=row + 1,
+                        start_col_offset_idx=col,
+                        end_col_offset_idx=col + 1,
+                        column_header=row == 0,
+                    )
+                )
+        doc.add_table(data=table_data, prov=prov)
+    return doc
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, nargs="+", default=[100, 300, 1000])
+    args = parser.parse_args()
+
+    print(f"{'pages':>6} {'items':>7} {'legacy [s]':>11} {'time [s]':>9}")
+    for num_pages in args.pages:
+        doc = _make_doc(num_pages)
+        results = []
+        for chunker in (_LegacyPageChunker(), PageChunker()):
+            start = time.perf_counter()
+            chunks = [c.export_json_dict() for c in chunker.chunk(dl_doc=doc)]
+            results.append((chunks, time.perf_counter() - start))
+        assert results[0][0] == results[1][0]
+        num_items = sum(1 for _ in doc.iterate_items(with_groups=True))
+        print(
+            f"{num_pages:>6} {num_items:>7} {results[0][1]:>11.2f} "
+            f"{results[1][1]:>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Benchmark of table exports with rich cells on a synthetic document.
+
+Compares the exports of a table with rich cells, which serialize all the rich cells
+with a shared serializer, with the previous behavior (emulated below as reference),
+which created a new serializer, hence traversed the whole document, for every rich
+cell. Both are checked to produce the same output.
+
+Run with: `python -m test.benchmarks.bench_rich_tables`
+"""
+
+import argparse
+import time
+
+from docling_core.transforms.serializer.doctags import DocTagsDocSerializer
+from docling_core.types.doc.document import (
+    DoclingDocument,
+    Formatting,
+    RichTableCell,
+    TableCell,
+    TableData,
+    TableItem,
+)
+from docling_core.types.doc.labels import DocItemLabel
+
+
+def _legacy_cell_texts(table: TableItem, doc: DoclingDocument) -> list[list[str]]:
+    return [[cell._get_text(doc=doc) for cell in row] for row in table.data.grid]
+
+
+def _make_doc(num_texts: int, num_rows: int, num_cols: int) -> DoclingDocument:
+    doc = DoclingDocument(name="bench")
+    for i in range(num_texts):
+        doc.add_text(label=DocItemLabel.TEXT, text=f"Paragraph {i}.")
+    table = doc.add_table(data=TableData(num_rows=num_rows, num_cols=num_cols))
+    for row in range(num_rows):
+        for col in range(num_cols):
+            cell_kwargs = dict(
+                start_row_offset_idx=row,
+                end_row_offset_idx=row + 1,
+                start_col_offset_idx=col,
+                end_col_offset_idx=col + 1,
+            )
+            cell: TableCell
+            if (row + col) % 2:
+                rich_item = doc.add_text(
+                    label=DocItemLabel.TEXT,
+                    text=f"Rich cell {row}.{col}",
+                    formatting=Formatting(bold=True),
+                    parent=table,
+                )
+                cell = RichTableCell(ref=rich_item.get_ref(), **cell_kwargs)
+            else:
+                cell = TableCell(text=f"{row}.{col}", **cell_kwargs)
+            doc.add_table_cell(table_item=table, cell=cell)
+    return doc
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--texts", type=int, nargs="+", default=[1000, 3000])
+    parser.add_argument("--rows", type=int, default=20)
+    parser.add_argument("--cols", type=int, default=10)
+    args = parser.parse_args()
+
+    print(
+        f"{'texts':>6} {'rich cells':>10} {'legacy [s]':>11} {'dataframe [s]':>14} "
+        f"{'doctags [s]':>12}"
+    )
+    for num_texts in args.texts:
+        doc = _make_doc(num_texts, args.rows, args.cols)
+        table = doc.tables[0]
+        num_rich_cells = sum(
+            isinstance(cell, RichTableCell) for cell in table.data.table_cells
+        )
+
+        start = time.perf_counter()
+        expected = _legacy_cell_texts(table=table, doc=doc)
+        legacy_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        df = table.export_to_dataframe(doc=doc)
+        df_time = time.perf_counter() - start
+        assert df.values.tolist() == expected
+
+        start = time.perf_counter()
+        DocTagsDocSerializer(doc=doc).serialize()
+        doctags_time = time.perf_counter() - start
+
+        print(
+            f"{num_texts:>6} {num_rich_cells:>10} {legacy_time:>11.2f} "
+            f"{df_time:>14.2f} {doctags_time:>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
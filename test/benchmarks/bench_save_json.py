@@ -0,0 +1,102 @@
+"""Benchmark of the JSON export of documents with embedded images.
+
+Compares the peak memory and time of `DoclingDocument.save_as_json()`, which writes
+the document item by item, with the previous implementation (kept below as
+reference), which copied the document, built the dict of the whole document and
+dumped it. Both implementations are checked to write the same file.
+
+Run with: `python -m test.benchmarks.bench_save_json`
+"""
+
+import argparse
+import json
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+
+from PIL import Image as PILImage
+
+from docling_core.types.doc.document import (
+    BoundingBox,
+    DoclingDocument,
+    ImageRef,
+    ImageRefMode,
+    ProvenanceItem,
+    Size,
+)
+from docling_core.types.doc.labels import DocItemLabel
+
+
+def _legacy_save_as_json(doc: DoclingDocument, filename: Path) -> None:
+    new_doc = doc._make_copy_with_refmode(
+        filename.parent, ImageRefMode.EMBEDDED, page_no=None
+    )
+    out = new_doc.export_to_dict()
+    with open(filename, "w", encoding="utf-8") as fw:
+        json.dump(out, fw, indent=2)
+
+
+def _make_doc(num_pages: int, image_size: int) -> DoclingDocument:
+    doc = DoclingDocument(name="bench")
+    for page_no in range(1, num_pages + 1):
+        image = PILImage.effect_noise((image_size, image_size), 64).convert("RGB")
+        doc.add_page(
+            page_no=page_no,
+            size=Size(width=image_size, height=image_size),
+            image=ImageRef.from_pil(image, dpi=72),
+            metadata={},
+        )
+        prov = ProvenanceItem(
+            page_no=page_no,
+            bbox=BoundingBox(l=0, t=0, r=image_size, b=image_size),
+            charspan=(0, 1),
+        )
+        for i in range(20):
+            doc.add_text(label=DocItemLabel.TEXT, text=f"Text {page_no}.{i}", prov=prov)
+        doc.add_picture(image=ImageRef.from_pil(image, dpi=72), prov=prov)
+    return doc
+
+
+def _measure(func: Callable[[], None]) -> tuple[float, float]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 2**20
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, nargs="+", default=[10, 20, 40])
+    parser.add_argument("--image-size", type=int, default=400)
+    args = parser.parse_args()
+
+    print(
+        f"{'pages':>6} {'file [MB]':>10} {'legacy [s]':>11} {'legacy peak [MB]':>17} "
+        f"{'new [s]':>8} {'new peak [MB]':>14}"
+    )
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        legacy_file = Path(tmp_dir) / "legacy.json"
+        new_file = Path(tmp_dir) / "new.json"
+        for num_pages in args.pages:
+            doc = _make_doc(num_pages=num_pages, image_size=args.image_size)
+            legacy_time, legacy_peak = _measure(
+                lambda: _legacy_save_as_json(doc, legacy_file)
+            )
+            new_time, new_peak = _measure(lambda: doc.save_as_json(new_file))
+            assert new_file.read_text() == legacy_file.read_text()
+
+            print(
+                f"{num_pages:>6} {new_file.stat().st_size / 2**20:>10.1f} "
+                f"{legacy_time:>11.2f} {legacy_peak:>17.1f} "
+                f"{new_time:>8.2f} {new_peak:>14.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Benchmark of the doc serializers on a synthetic long document.
+
+Times the Markdown, HTML and DocTags serializations, which resolve their params once
+per serialization run instead of re-validating them for every item, also counting
+the params instances validated during each run.
+
+Run with: `python -m test.benchmarks.bench_serialize_params`
+"""
+
+import argparse
+import time
+from typing import Any
+
+from docling_core.transforms.serializer.common import CommonParams
+from docling_core.transforms.serializer.doctags import DocTagsDocSerializer
+from docling_core.transforms.serializer.html import HTMLDocSerializer
+from docling_core.transforms.serializer.markdown import MarkdownDocSerializer
+from docling_core.types.doc.document import DoclingDocument, TableCell, TableData
+from docling_core.types.doc.labels import DocItemLabel, GroupLabel
+
+
+def _make_doc(num_sections: int) -> DoclingDocument:
+    doc = DoclingDocument(name="bench")
+    for sec_no in range(num_sections):
+        doc.add_heading(text=f"Section {sec_no}")
+        for i in range(5):
+            doc.add_text(
+                label=DocItemLabel.TEXT,
+                text=f"Paragraph {i} of section_{sec_no}, with *some* text.",
+            )
+        group = doc.add_group(label=GroupLabel.LIST)
+        for i in range(3):
+            doc.add_list_item(text=f"Item {i}", parent=group)
+        table_data = TableData(num_rows=2, num_cols=2)
+        for row in range(2):
+            for col in range(2):
+                table_data.table_cells.append(
+                    TableCell(
+                        text=f"{row}.{col}",
+                        start_row_offset_idx=row,
+                        end_row_offset_idx=row + 1,
+                        start_col_offset_idx=col,
+                        end_col_offset_idx=col + 1,
+                        column_header=row == 0,
+                    )
+                )
+        doc.add_table(data=table_data)
+    return doc
+
+
+def _count_params_inits() -> list[int]:
+    counter = [0]
+    orig_init = CommonParams.__init__
+
+    def counting_init(self: CommonParams, **data: Any) -> None:
+        counter[0] += 1
+        orig_init(self, **data)
+
+    setattr(CommonParams, "__init__", counting_init)
+    return counter
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sections", type=int, nargs="+", default=[100, 300, 1000])
+    args = parser.parse_args()
+
+    counter = _count_params_inits()
+    print(f"{'sections':>8} {'serializer':>22} {'params':>7} {'time [s]':>9}")
+    for num_sections in args.sections:
+        doc = _make_doc(num_sections)
+        for ser_cls in (
+            MarkdownDocSerializer,
+            HTMLDocSerializer,
+            DocTagsDocSerializer,
+        ):
+            ser = ser_cls(doc=doc)
+            counter[0] = 0
+            start = time.perf_counter()
+            ser.serialize()
+            elapsed = time.perf_counter() - start
+            print(
+                f"{num_sections:>8} {ser_cls.__name__:>22} {counter[0]:>7} "
+                f"{elapsed:>9.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
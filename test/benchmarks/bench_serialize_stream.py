@@ -0,0 +1,82 @@
+"""Benchmark of the memory needed for saving a synthetic long document.
+
+Compares the peak memory allocated while saving a document to Markdown, HTML and
+DocTags, whose output is written part by part as the document is serialized, with
+the previous behavior (emulated below as reference), which built the whole output
+string before writing it. Both are checked to produce the same output.
+
+Run with: `python -m test.benchmarks.bench_serialize_stream`
+"""
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+
+from docling_core.types.doc.document import DoclingDocument
+from docling_core.types.doc.labels import DocItemLabel, GroupLabel
+
+
+def _make_doc(num_sections: int) -> DoclingDocument:
+    doc = DoclingDocument(name="bench")
+    for sec_no in range(num_sections):
+        doc.add_heading(text=f"Section {sec_no}")
+        for i in range(5):
+            doc.add_text(
+                label=DocItemLabel.TEXT,
+                text=f"Paragraph {i} of section {sec_no}, with some text. " * 10,
+            )
+        group = doc.add_group(label=GroupLabel.LIST)
+        for i in range(3):
+            doc.add_list_item(text=f"Item {i}", parent=group)
+    return doc
+
+
+def _measure(func: Callable[[], None]) -> tuple[float, float]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 2**20
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sections", type=int, nargs="+", default=[300, 1000])
+    args = parser.parse_args()
+
+    print(
+        f"{'sections':>8} {'format':>8} {'legacy [MiB]':>13} {'stream [MiB]':>13} "
+        f"{'legacy [s]':>11} {'stream [s]':>11}"
+    )
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for num_sections in args.sections:
+            doc = _make_doc(num_sections)
+            for fmt, save, export in (
+                ("md", doc.save_as_markdown, doc.export_to_markdown),
+                ("html", doc.save_as_html, doc.export_to_html),
+                ("dt", doc.save_as_doctags, doc.export_to_doctags),
+            ):
+                legacy_path = Path(tmp_dir) / f"legacy.{fmt}"
+                stream_path = Path(tmp_dir) / f"stream.{fmt}"
+
+                def save_legacy() -> None:
+                    with open(legacy_path, "w", encoding="utf-8") as fw:
+                        fw.write(export())
+
+                legacy_time, legacy_peak = _measure(save_legacy)
+                stream_time, stream_peak = _measure(lambda: save(stream_path))
+                assert stream_path.read_text() == legacy_path.read_text()
+                print(
+                    f"{num_sections:>8} {fmt:>8} {legacy_peak:>13.1f} "
+                    f"{stream_peak:>13.1f} {legacy_time:>11.2f} {stream_time:>11.2f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
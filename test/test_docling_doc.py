@@ -1,3 +1,5 @@
+import gzip
+import json
 import os
 from collections import deque
 from copy import deepcopy
@@ -11,6 +13,8 @@ from PIL import Image as PILImage
 from PIL import ImageDraw
 from pydantic import AnyUrl, ValidationError
 
+import docling_core.transforms.serializer.doctags as doctags_module
+import docling_core.types.doc.document as document_module
 from docling_core.types.doc.base import BoundingBox, CoordOrigin, ImageRefMode, Size
 from docling_core.types.doc.document import (  # BoundingBox,
     CURRENT_VERSION,
@@ -26,6 +30,7 @@ from docling_core.types.doc.document import (  # BoundingBox,
     GraphCell,
     GraphData,
     GraphLink,
+    GroupItem,
     ImageRef,
     KeyValueItem,
     ListItem,
@@ -661,6 +666,23 @@ def test_construct_bad_doc():
         _test_serialize_and_reload(doc)
 
 
+def test_validate_tree_parents():
+    doc = DoclingDocument(name="")
+    first = doc.add_group(name="group")
+    second = doc.add_group(name="group")
+    text = doc.add_text(label=DocItemLabel.TEXT, text="text", parent=first)
+    doc.add_text(label=DocItemLabel.TEXT, text="text", parent=second)
+    assert doc.validate_tree(doc.body)
+
+    text.parent = second.get_ref()
+    assert not doc.validate_tree(doc.body)
+    with pytest.raises(ValueError):
+        DoclingDocument.model_validate(doc.export_to_dict())
+
+    text.parent = None
+    assert not doc.validate_tree(doc.body)
+
+
 def _test_serialize_and_reload(doc):
     ### Serialize and deserialize stuff
     yaml_dump = yaml.safe_dump(doc.model_dump(mode="json", by_alias=True))
@@ -1567,6 +1589,52 @@ def test_document_stack_operations():
     ], f"stack==[2, 2, 2, 0, 2, 0, 0] for stack: {stack}"
 
 
+def test_document_position_index():
+
+    def _check_stacks(doc: DoclingDocument):
+        for item, stack in doc._iterate_items_with_stack(
+            with_groups=True,
+            traverse_pictures=True,
+            included_content_layers={c for c in ContentLayer},
+        ):
+            if item is doc.body:
+                continue
+            success, found = doc._get_stack_of_item(item=item)
+            assert success
+            assert found == stack, f"{item.self_ref}: {found} != {stack}"
+
+    doc: DoclingDocument = _construct_doc()
+    _check_stacks(doc)
+
+    # mutations through the API keep the index current
+    sibling = RefItem(cref="#/texts/12").resolve(doc=doc)
+    for i in range(3):
+        doc.insert_text(
+            sibling=sibling, label=DocItemLabel.TEXT, text=f"before {i}", after=False
+        )
+    doc.insert_item_after_sibling(
+        new_item=TextItem(self_ref="#", text="after", orig="after", label="text"),
+        sibling=sibling,
+    )
+    doc.append_child_item(
+        child=TextItem(self_ref="#", text="last", orig="last", label="text")
+    )
+    _check_stacks(doc)
+
+    doc.delete_items(node_items=[sibling])
+    _check_stacks(doc)
+
+    # direct edits of the tree are detected on lookup
+    doc.body.children.reverse()
+    _check_stacks(doc)
+
+    # items missing from their parent's children are reported
+    orphan = doc.add_text(label=DocItemLabel.TEXT, text="orphan")
+    doc.body.children.pop()
+    with pytest.raises(ValueError):
+        doc._get_stack_of_item(item=orphan)
+
+
 def test_document_manipulation():
 
     def _resolve(doc: DoclingDocument, cref: str) -> NodeItem:
@@ -1941,6 +2009,38 @@ def test_document_manipulation():
     _verify(filename=filename, document=doc, generate=GEN_TEST_DATA)
 
 
+def test_load_trusted(tmp_path):
+    filename = Path("test/data/doc/misplaced_list_items.yaml")
+    json_file = tmp_path / "misplaced_list_items.json"
+    with open(filename, encoding="utf-8") as fr, open(json_file, "w") as fw:
+        json.dump(yaml.safe_load(fr), fw)
+
+    exp_doc = DoclingDocument.load_from_yaml(
+        filename.parent / f"{filename.stem}.out.yaml"
+    )
+    assert DoclingDocument.load_from_json(json_file) == exp_doc
+
+    # the consistency checks are skipped, and can be run later on
+    doc = DoclingDocument.load_from_json(json_file, trusted=True)
+    assert doc != exp_doc
+    assert doc.check_consistency() is doc
+    assert doc == exp_doc
+
+    # the pydantic validation classmethod is not shadowed
+    with pytest.warns(DeprecationWarning):
+        assert DoclingDocument.validate(exp_doc.export_to_dict()) == exp_doc
+
+    bad_doc = _construct_bad_doc()
+    json_file = tmp_path / "bad_doc.json"
+    with open(json_file, "w") as fw:
+        json.dump(bad_doc.export_to_dict(), fw)
+    with pytest.raises(ValueError):
+        DoclingDocument.load_from_json(json_file)
+    doc = DoclingDocument.load_from_json(json_file, trusted=True)
+    with pytest.raises(ValueError):
+        doc.check_consistency()
+
+
 def test_misplaced_list_items():
     filename = Path("test/data/doc/misplaced_list_items.yaml")
     doc = DoclingDocument.load_from_yaml(filename)
@@ -2195,6 +2295,39 @@ def test_doc_manipulation_with_rich_tables():
     assert doc == exp_doc
 
 
+def test_rich_table_cells_share_serializer(monkeypatch):
+    doc = _construct_rich_table_doc()
+    table = doc.tables[0]
+    exp_texts = [[cell._get_text(doc=doc) for cell in row] for row in table.data.grid]
+    exp_otsl = table.export_to_otsl(doc=doc)
+    exp_doctags = doc.export_to_doctags()
+
+    created: list[DoclingDocument] = []
+    create_serializer = document_module._create_rich_cell_serializer
+
+    def _create_counted(doc: DoclingDocument):
+        created.append(doc)
+        return create_serializer(doc=doc)
+
+    monkeypatch.setattr(
+        document_module, "_create_rich_cell_serializer", _create_counted
+    )
+
+    df = table.export_to_dataframe(doc=doc)
+    assert df.values.tolist() == exp_texts
+    assert table.export_to_otsl(doc=doc) == exp_otsl
+    assert len(created) == 2
+
+    # a rich-cell-free table needs no serializer
+    assert doc.tables[1].export_to_otsl(doc=doc)
+    assert len(created) == 2
+
+    # a doc serializer shares its rich-cell serializer across tables
+    monkeypatch.setattr(doctags_module, "_create_rich_cell_serializer", _create_counted)
+    assert doc.export_to_doctags() == exp_doctags
+    assert len(created) == 3
+
+
 def test_invalid_rich_table_doc():
     doc = DoclingDocument(name="")
     table_item = doc.add_table(data=TableData(num_rows=2, num_cols=2))
@@ -2305,3 +2438,553 @@ def test_rich_table_item_insertion_normalization():
         doc.save_as_yaml(exp_file)
     exp_doc = DoclingDocument.load_from_yaml(exp_file)
     assert doc == exp_doc
+
+
+def test_table_grid_cache():
+    doc = DoclingDocument(name="")
+    table_item = doc.add_table(data=TableData(num_rows=2, num_cols=2))
+    for i in range(2):
+        for j in range(2):
+            doc.add_table_cell(
+                table_item=table_item,
+                cell=TableCell(
+                    text=f"cell {i},{j}",
+                    start_row_offset_idx=i,
+                    end_row_offset_idx=i + 1,
+                    start_col_offset_idx=j,
+                    end_col_offset_idx=j + 1,
+                ),
+            )
+    data = table_item.data
+
+    # grid is reused across reads
+    grid = data.grid
+    assert data.grid is grid
+    assert [[c.text for c in row] for row in grid] == [
+        ["cell 0,0", "cell 0,1"],
+        ["cell 1,0", "cell 1,1"],
+    ]
+    assert data.get_cell_index(1, 0) == 2
+    with pytest.raises(IndexError):
+        data.get_cell_index(2, 0)
+
+    # equality and copies are not affected by the cache
+    assert data == TableData(**data.model_dump(exclude={"grid"}))
+    assert deepcopy(data).grid is not grid
+
+    # structural changes invalidate the grid
+    data.insert_row(row_index=0, row=["a", "b"])
+    assert [c.text for c in data.grid[0]] == ["a", "b"]
+    assert data.get_cell_index(2, 1) == 5
+
+    data.add_row(["c", "d"])
+    assert [c.text for c in data.grid[-1]] == ["c", "d"]
+
+    data.remove_rows([0, 1])
+    assert [[c.text for c in row] for row in data.grid] == [
+        ["cell 1,0", "cell 1,1"],
+        ["c", "d"],
+    ]
+
+    # spans and uncovered positions
+    data = TableData(
+        num_rows=2,
+        num_cols=3,
+        table_cells=[
+            TableCell(
+                text="span",
+                row_span=2,
+                start_row_offset_idx=0,
+                end_row_offset_idx=2,
+                start_col_offset_idx=0,
+                end_col_offset_idx=1,
+            )
+        ],
+    )
+    assert data.grid[1][0].text == "span"
+    assert data.get_cell_index(1, 0) == 0
+    assert data.get_cell_index(0, 2) is None
+
+    # discouraged direct edits are detected as well
+    data.num_cols = 2
+    assert len(data.grid[0]) == 2
+
+    # including in-place edits of the cell list
+    grid = data.grid
+    cell = TableCell(
+        text="replaced",
+        start_row_offset_idx=0,
+        end_row_offset_idx=1,
+        start_col_offset_idx=0,
+        end_col_offset_idx=1,
+    )
+    data.table_cells[0] = cell
+    assert data.grid is not grid
+    assert data.grid[0][0] is cell
+    assert data.grid[1][0].text == ""
+    data.table_cells.append(
+        TableCell(
+            text="appended",
+            start_row_offset_idx=1,
+            end_row_offset_idx=2,
+            start_col_offset_idx=1,
+            end_col_offset_idx=2,
+        )
+    )
+    assert data.get_cell_index(1, 1) == 1
+    assert data.grid[1][1].text == "appended"
+    data.table_cells.reverse()
+    assert data.get_cell_index(1, 1) == 0
+
+
+def test_delete_items_batch():
+    doc = DoclingDocument(name="")
+    for page_no in range(1, 4):
+        doc.add_text(
+            label=DocItemLabel.PAGE_HEADER,
+            text=f"header {page_no}",
+            content_layer=ContentLayer.FURNITURE,
+        )
+        caption = doc.add_text(label=DocItemLabel.CAPTION, text=f"caption {page_no}")
+        table = doc.add_table(data=TableData(num_rows=1, num_cols=1), caption=caption)
+        rich_item = doc.add_text(
+            label=DocItemLabel.TEXT, text=f"rich {page_no}", parent=table
+        )
+        doc.add_table_cell(
+            table_item=table,
+            cell=RichTableCell(
+                text=f"rich {page_no}",
+                ref=rich_item.get_ref(),
+                start_row_offset_idx=0,
+                end_row_offset_idx=1,
+                start_col_offset_idx=0,
+                end_col_offset_idx=1,
+            ),
+        )
+        doc.add_text(label=DocItemLabel.TEXT, text=f"text {page_no}")
+
+    headers = [
+        item
+        for item, _ in doc.iterate_items(
+            included_content_layers={ContentLayer.FURNITURE}
+        )
+    ]
+    first_caption = doc.tables[0].captions[0].resolve(doc)
+    last_rich_item = doc.tables[2].data.table_cells[0].ref.resolve(doc)
+    doc.delete_items(node_items=headers + [first_caption, last_rich_item])
+
+    assert [it.text for it in doc.texts] == [
+        "rich 1",
+        "text 1",
+        "caption 2",
+        "rich 2",
+        "text 2",
+        "caption 3",
+        "text 3",
+    ]
+    assert doc.tables[0].captions == []
+    assert [c.cref for c in doc.tables[1].captions] == ["#/texts/2"]
+    assert doc.tables[1].data.table_cells[0].ref.cref == "#/texts/3"
+    assert doc.tables[1].children[0].resolve(doc).text == "rich 2"
+
+    # rich cells whose content got deleted are kept as plain cells
+    cell = doc.tables[2].data.table_cells[0]
+    assert not isinstance(cell, RichTableCell)
+    assert cell.text == "rich 3"
+    assert doc.tables[2].children == []
+
+    for item in doc.texts + doc.tables:
+        assert item.parent is not None
+        assert item.get_ref() in item.parent.resolve(doc).children
+    DoclingDocument.model_validate(doc.export_to_dict())
+
+    with pytest.raises(ValueError):
+        doc._delete_items(refs=[RefItem(cref="#/texts/100")])
+
+    # the body has no parent to be deleted from
+    expected = doc.export_to_dict()
+    with pytest.raises(ValueError):
+        doc.delete_items(node_items=[doc.body])
+    with pytest.raises(ValueError):
+        doc.delete_items(node_items=[doc.texts[0], doc.body])
+    with pytest.raises(ValueError):
+        with doc.batch_edit():
+            doc.delete_items(node_items=[doc.body])
+    with pytest.raises(ValueError):
+        doc._remove_items(deleted={doc.body.self_ref})
+    assert doc.export_to_dict() == expected
+
+
+def test_batch_edit():
+    def _make_doc() -> DoclingDocument:
+        doc = DoclingDocument(name="")
+        for page_no in range(1, 4):
+            doc.add_text(
+                label=DocItemLabel.PAGE_HEADER,
+                text=f"header {page_no}",
+                content_layer=ContentLayer.FURNITURE,
+            )
+            doc.add_heading(text=f"heading {page_no}")
+            group = doc.add_list_group()
+            for i in range(3):
+                doc.add_list_item(text=f"item {page_no}.{i}", parent=group)
+            doc.add_text(label=DocItemLabel.TEXT, text=f"text {page_no}")
+        return doc
+
+    def _edit(doc: DoclingDocument) -> None:
+        items = {item.text: item for item in doc.texts}
+        doc.delete_items(node_items=[items["header 1"], items["header 2"]])
+        doc.insert_item_after_sibling(
+            new_item=TextItem(
+                label=DocItemLabel.TEXT, text="inserted", orig="inserted", self_ref="#"
+            ),
+            sibling=items["heading 2"],
+        )
+        doc.replace_item(
+            new_item=TextItem(
+                label=DocItemLabel.TEXT, text="replaced", orig="replaced", self_ref="#"
+            ),
+            old_item=items["text 1"],
+        )
+        doc.delete_items_range(start=items["item 2.0"], end=items["item 2.1"])
+        doc.add_text(label=DocItemLabel.TEXT, text="appended")
+        list_3 = items["item 3.1"].parent
+        list_1 = items["item 1.0"].parent
+        assert list_3 is not None and list_1 is not None
+        doc.delete_items(node_items=[list_3.resolve(doc)])
+        doc.add_list_item(text="item 1.3", parent=list_1.resolve(doc))
+
+    expected = _make_doc()
+    _edit(expected)
+
+    doc = _make_doc()
+    with doc.batch_edit():
+        _edit(doc)
+        # deletions are deferred to the end of the batch
+        assert len(doc.texts) == 22
+    assert doc.export_to_dict() == expected.export_to_dict()
+    assert doc == expected
+
+    # failed edits roll back the whole batch
+    doc = _make_doc()
+    original = doc.export_to_dict()
+    header = doc.texts[0]
+    with pytest.raises(ValueError):
+        with doc.batch_edit():
+            doc.delete_items(node_items=[header])
+            doc.add_text(label=DocItemLabel.TEXT, text="appended")
+            doc.delete_items(node_items=[header])
+    assert doc.export_to_dict() == original
+
+    with pytest.raises(RuntimeError):
+        with doc.batch_edit():
+            doc.delete_items(node_items=[doc.texts[1]])
+            raise RuntimeError("failure")
+    assert doc.export_to_dict() == original
+
+    # the instances held before the batch remain those of the rolled back document
+    texts = list(doc.texts)
+    body = doc.body
+    with pytest.raises(RuntimeError):
+        with doc.batch_edit():
+            _edit(doc)
+            texts[-1].text = "edited"
+            raise RuntimeError("failure")
+    assert doc.export_to_dict() == original
+    assert doc.body is body
+    assert all(a is b for a, b in zip(doc.texts, texts, strict=True))
+    assert texts[-1].text == "text 3"
+    for item in texts:
+        assert item.get_ref().resolve(doc) is item
+        assert item.parent is not None
+        assert item.get_ref() in item.parent.resolve(doc).children
+
+    # additions within the batch are rolled back as well, while the images are kept
+    doc.add_page(page_no=1, size=Size(width=10, height=10), metadata={})
+    image = ImageRef.from_pil(PILImage.new("RGB", (10, 10)), dpi=72)
+    picture = doc.add_picture(image=image)
+    original = doc.export_to_dict()
+    expected = deepcopy(doc)
+    with pytest.raises(RuntimeError):
+        with doc.batch_edit():
+            group = doc.add_group(label=GroupLabel.SECTION)
+            doc.add_text(label=DocItemLabel.TEXT, text="added", parent=group)
+            doc.add_heading(text="added heading")
+            doc.add_picture(image=image)
+            doc.add_page(page_no=2, size=Size(width=10, height=10), metadata={})
+            doc.insert_text(
+                sibling=doc.texts[0], label=DocItemLabel.TEXT, text="inserted"
+            )
+            raise RuntimeError("failure")
+    assert doc.export_to_dict() == original
+    assert doc == expected
+    assert list(doc.pages) == [1]
+    assert doc.pictures == [picture]
+    assert picture.image is image
+
+
+def test_iterate_items_preorder_cache():
+    def _iterate_recursively(doc, root, with_groups, traverse_pictures, page_no):
+        if (
+            (with_groups or not isinstance(root, GroupItem))
+            and (
+                page_no is None
+                or not isinstance(root, DocItem)
+                or any(prov.page_no == page_no for prov in root.prov)
+            )
+            and root.content_layer == ContentLayer.BODY
+        ):
+            yield root
+        for child_ref in root.children:
+            child = child_ref.resolve(doc)
+            if (
+                isinstance(root, PictureItem)
+                and not traverse_pictures
+                and child_ref not in root.captions
+            ):
+                continue
+            yield from _iterate_recursively(
+                doc, child, with_groups, traverse_pictures, page_no
+            )
+
+    doc = DoclingDocument.load_from_json("test/data/doc/2206.01062-1.0.0.json")
+    assert sum(len(pic.children) for pic in doc.pictures) > 0
+
+    for with_groups in [False, True]:
+        for traverse_pictures in [False, True]:
+            for page_no in [None, 1, 5]:
+                kwargs = dict(
+                    with_groups=with_groups,
+                    traverse_pictures=traverse_pictures,
+                    page_no=page_no,
+                )
+                expected = [
+                    it.self_ref for it in _iterate_recursively(doc, doc.body, **kwargs)
+                ]
+                for _ in range(2):  # cold and cached
+                    assert [
+                        it.self_ref for it, _ in doc.iterate_items(**kwargs)
+                    ] == expected
+
+    # stacks are the ones of the tree and can be modified by the caller
+    for item, stack in doc._iterate_items_with_stack(with_groups=True):
+        stack.append(-1)
+    for item, stack in doc._iterate_items_with_stack(with_groups=True):
+        if item is not doc.body:
+            assert item.parent.resolve(doc).children[stack[-1]].cref == item.self_ref
+
+    # the cached traversal follows any edit of the tree, even direct ones
+    def _crefs():
+        return [it.self_ref for it, _ in doc.iterate_items(with_groups=True)]
+
+    num_items = len(_crefs())
+    last = doc.body.children.pop()
+    assert len(_crefs()) < num_items
+    doc.body.children.append(last)
+    assert len(_crefs()) == num_items
+    doc.body.children[0], doc.body.children[1] = (
+        doc.body.children[1],
+        doc.body.children[0],
+    )
+    assert _crefs()[1] == doc.body.children[0].cref
+    doc.texts[-1] = doc.texts[-1].model_copy()
+    assert doc.texts[-1].content_layer == ContentLayer.BODY
+    assert any(it is doc.texts[-1] for it, _ in doc.iterate_items())
+
+
+def test_item_indexes():
+    doc = DoclingDocument.load_from_json("test/data/doc/2206.01062-1.0.0.json")
+
+    for traverse_pictures in [False, True]:
+        for layers in [None, set(ContentLayer)]:
+            kwargs = dict(
+                traverse_pictures=traverse_pictures, included_content_layers=layers
+            )
+            for page_no in list(doc.pages) + [len(doc.pages) + 1]:
+                assert doc.items_on_page(page_no, **kwargs) == [
+                    it
+                    for it, _ in doc.iterate_items(page_no=page_no, **kwargs)
+                    if isinstance(it, DocItem)
+                ]
+            labels = [DocItemLabel.TEXT, DocItemLabel.CAPTION]
+            assert doc.items_with_label(*labels, **kwargs) == [
+                it
+                for it, _ in doc.iterate_items(**kwargs)
+                if isinstance(it, DocItem) and it.label in labels
+            ]
+        for layer in ContentLayer:
+            assert doc.items_in_content_layer(
+                layer, with_groups=True, traverse_pictures=traverse_pictures
+            ) == [
+                it
+                for it, _ in doc.iterate_items(
+                    with_groups=True,
+                    traverse_pictures=traverse_pictures,
+                    included_content_layers={layer},
+                )
+            ]
+
+    # the indexes follow the manipulations of the document
+    first, second = doc.items_on_page(1)[:2]
+    prov = ProvenanceItem(
+        page_no=1, bbox=BoundingBox(l=0, t=0, r=1, b=1), charspan=(0, 1)
+    )
+    appended = doc.add_text(label=DocItemLabel.TEXT, text="appended", prov=prov)
+    inserted = TextItem(
+        label=DocItemLabel.TEXT, text="inserted", orig="inserted", self_ref="#"
+    )
+    inserted.prov.append(prov)
+    doc.insert_item_after_sibling(new_item=inserted, sibling=first)
+    doc.delete_items(node_items=[second])
+    on_page = doc.items_on_page(1)
+    assert on_page[:2] == [first, inserted]
+    assert on_page[-1] is appended
+    assert second not in on_page
+    assert on_page == [it for it, _ in doc.iterate_items(page_no=1)]
+
+    # as well as the direct edits of the items, once the indexes are invalidated
+    def _check_indexes():
+        for page_no in [1, 2]:
+            assert doc.items_on_page(page_no) == [
+                it for it, _ in doc.iterate_items(page_no=page_no)
+            ]
+        assert doc.items_with_label(DocItemLabel.FOOTNOTE) == [
+            it
+            for it, _ in doc.iterate_items()
+            if isinstance(it, DocItem) and it.label == DocItemLabel.FOOTNOTE
+        ]
+        assert doc.items_in_content_layer(ContentLayer.FURNITURE) == [
+            it
+            for it, _ in doc.iterate_items(
+                included_content_layers={ContentLayer.FURNITURE}
+            )
+        ]
+
+    _check_indexes()
+    appended.label = DocItemLabel.FOOTNOTE
+    assert appended not in doc.items_with_label(DocItemLabel.FOOTNOTE)
+    doc.invalidate_indexes()
+    _check_indexes()
+    appended.prov[0].page_no = 2
+    inserted.prov = []
+    first.content_layer = ContentLayer.FURNITURE
+    doc.invalidate_indexes()
+    _check_indexes()
+    replacement = appended.model_copy(update={"label": DocItemLabel.TEXT})
+    doc.texts[doc.texts.index(appended)] = replacement
+    doc.invalidate_indexes()
+    assert replacement in doc.items_on_page(2)
+    assert appended not in doc.items_with_label(DocItemLabel.FOOTNOTE)
+    _check_indexes()
+    doc.replace_item(new_item=appended, old_item=replacement)
+    assert appended in doc.items_with_label(DocItemLabel.FOOTNOTE)
+    _check_indexes()
+
+
+class _NonIterableList(list):
+    def __iter__(self):
+        raise AssertionError("lookup iterating over all the items")
+
+
+def test_item_indexes_lookup_cost(monkeypatch):
+    doc = DoclingDocument(name="pages")
+    bbox = BoundingBox(l=0, t=0, r=1, b=1)
+    for page_no in range(1, 101):
+        doc.add_page(page_no=page_no, size=Size(width=1, height=1), metadata={})
+        doc.add_text(
+            label=DocItemLabel.TEXT,
+            text=f"page {page_no}",
+            prov=ProvenanceItem(page_no=page_no, bbox=bbox, charspan=(0, 1)),
+        )
+    on_page = doc.items_on_page(50)
+    assert [it.text for it in on_page] == ["page 50"]
+
+    # once built, a lookup neither walks the tree nor goes over all the items
+    def _fail(*args, **kwargs):
+        raise AssertionError("lookup walking the tree")
+
+    monkeypatch.setattr(DoclingDocument, "_walk_tree", _fail)
+    monkeypatch.setattr(DoclingDocument, "_get_preorder_entries", _fail)
+    item_lists, entries = doc._cache["preorder"]
+    entries = _NonIterableList(entries)
+    doc._cache["preorder"] = (item_lists, entries)
+    doc._cache["item_indexes"][1]["entries"] = entries
+    for page_no in range(1, 101):
+        assert [it.text for it in doc.items_on_page(page_no)] == [f"page {page_no}"]
+    assert len(doc.items_with_label(DocItemLabel.TEXT)) == 100
+    assert len(doc.items_in_content_layer(ContentLayer.BODY)) == 100
+
+
+def test_save_as_json_streaming(tmp_path):
+    doc = DoclingDocument.load_from_json("test/data/doc/2206.01062-1.0.0.json")
+    filename = tmp_path / "doc.json"
+
+    for kwargs in [
+        {},
+        {"indent": None},
+        {"indent": 4, "coord_precision": 1, "confid_precision": 2},
+    ]:
+        doc.save_as_json(filename, image_mode=ImageRefMode.PLACEHOLDER, **kwargs)
+        expected = json.dumps(
+            doc.export_to_dict(
+                coord_precision=kwargs.get("coord_precision"),
+                confid_precision=kwargs.get("confid_precision"),
+            ),
+            indent=kwargs.get("indent", 2),
+        )
+        assert filename.read_text(encoding="utf-8") == expected
+
+    filename = tmp_path / "doc.json.gz"
+    doc.save_as_json(filename, compress=True)
+    with gzip.open(filename, "rt", encoding="utf-8") as fr:
+        assert json.load(fr) == doc.export_to_dict()
+    assert DoclingDocument.load_from_json(filename) == doc
+
+
+def test_load_lazy_images(tmp_path):
+    filename = Path("test/data/doc/2408.09869_p1.json")
+    exp_doc = DoclingDocument.load_from_json(filename)
+
+    doc = DoclingDocument.load_from_json(filename, lazy_images=True)
+    assert doc == exp_doc
+    assert doc.export_to_dict() == exp_doc.export_to_dict()
+    assert doc.export_to_html(image_mode=ImageRefMode.EMBEDDED) == (
+        exp_doc.export_to_html(image_mode=ImageRefMode.EMBEDDED)
+    )
+    for item, exp_item in zip(doc.pictures, exp_doc.pictures):
+        assert item.image is not None and exp_item.image is not None
+        assert item.image.uri.scheme == "data"
+        assert item.get_image(doc).tobytes() == exp_item.get_image(exp_doc).tobytes()
+
+    # the images are kept in memory for compressed files
+    gz_file = tmp_path / "doc.json.gz"
+    exp_doc.save_as_json(gz_file, compress=True)
+    doc = DoclingDocument.load_from_json(gz_file, lazy_images=True)
+    assert doc.export_to_dict() == exp_doc.export_to_dict()
+
+    # the images cannot be read once the file changed
+    json_file = tmp_path / "doc.json"
+    exp_doc.save_as_json(json_file)
+    doc = DoclingDocument.load_from_json(json_file, lazy_images=True)
+    exp_doc.save_as_json(json_file, indent=None)
+    with pytest.raises(RuntimeError):
+        doc.pictures[0].get_image(doc)
+
+    # the images are read once, and deep copies do not depend on the file
+    exp_doc = DoclingDocument.load_from_json(filename)
+    exp_doc.save_as_json(json_file)
+    doc = DoclingDocument.load_from_json(json_file, lazy_images=True)
+    copied = deepcopy(doc)
+    assert doc == exp_doc
+    exp_doc.save_as_json(json_file, indent=None)
+    assert doc == exp_doc
+    assert hash(doc.pictures[0].image.uri) == hash(exp_doc.pictures[0].image.uri)
+    assert copied == exp_doc
+    assert all(type(item.image.uri) is AnyUrl for item in copied.pictures)
+    assert doc.pictures[0].get_image(doc) is not None
+
+    # data URIs outside of images are loaded as is
+    exp_doc.origin.uri = AnyUrl("data:,origin")
+    exp_doc.save_as_json(json_file)
+    doc = DoclingDocument.load_from_json(json_file, lazy_images=True)
+    assert doc.export_to_dict() == exp_doc.export_to_dict()
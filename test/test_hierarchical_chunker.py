@@ -3,17 +3,25 @@
 # SPDX-License-Identifier: MIT
 #
 
+import itertools
 import json
 
+import pytest
+
 from docling_core.transforms.chunker import HierarchicalChunker
 from docling_core.transforms.chunker.hierarchical_chunker import (
     ChunkingDocSerializer,
     ChunkingSerializerProvider,
+    ChunkingState,
     DocChunk,
+    DocItemRef,
+    DocRefChunk,
+    get_item_fingerprints,
 )
 from docling_core.transforms.serializer.markdown import MarkdownTableSerializer
 from docling_core.types.doc import DoclingDocument as DLDocument
 from docling_core.types.doc.document import DoclingDocument
+from docling_core.types.doc.labels import DocItemLabel
 
 from .test_data_gen_flag import GEN_TEST_DATA
 
@@ -71,3 +79,140 @@ def test_chunk_custom_serializer():
         act_data=act_data,
         exp_path_str="test/data/chunker/0b_out_chunks.json",
     )
+
+
+def test_export_json_dict_excluded():
+    with open("test/data/chunker/0_inp_dl_doc.json", encoding="utf-8") as f:
+        data_json = f.read()
+    dl_doc = DLDocument.model_validate_json(data_json)
+    chunker = HierarchicalChunker()
+
+    for chunk in chunker.chunk(dl_doc=dl_doc):
+        meta = chunk.meta
+        full = meta.export_json_dict()
+        for excluded in [meta.excluded_embed, meta.excluded_llm]:
+            assert meta.export_json_dict(excluded=excluded) == {
+                k: v for k, v in full.items() if k not in excluded
+            }
+        assert chunker.contextualize(chunk=chunk) == chunker.delim.join(
+            [*(meta.headings or []), chunk.text]
+        )
+
+
+@pytest.mark.parametrize("executor", ["process", "thread"])
+@pytest.mark.parametrize("ordered", [True, False])
+def test_chunk_many(executor, ordered):
+    dl_docs = []
+    for filename in [
+        "test/data/chunker/0_inp_dl_doc.json",
+        "test/data/chunker/2_inp_dl_doc.json",
+    ]:
+        with open(filename, encoding="utf-8") as f:
+            dl_docs.append(DLDocument.model_validate_json(f.read()))
+    dl_docs *= 3
+    chunker = HierarchicalChunker()
+
+    results = list(
+        chunker.chunk_many(
+            docs=iter(dl_docs),
+            workers=2,
+            executor=executor,
+            ordered=ordered,
+            max_pending=2,
+        )
+    )
+
+    exp_data = [
+        (i, c.export_json_dict())
+        for i, dl_doc in enumerate(dl_docs)
+        for c in chunker.chunk(dl_doc=dl_doc)
+    ]
+    act_data = [(i, c.export_json_dict()) for i, c in results]
+    if ordered:
+        assert act_data == exp_data
+    else:
+        # the chunks of each document are consecutive and in order
+        doc_indexes = [i for i, _ in itertools.groupby(i for i, _ in act_data)]
+        assert sorted(doc_indexes) == list(range(len(dl_docs)))
+        assert sorted(act_data, key=lambda r: r[0]) == exp_data
+
+
+def test_chunk_many_unsupported_executor():
+    with pytest.raises(ValueError):
+        list(HierarchicalChunker().chunk_many(docs=[], executor="fiber"))
+
+
+def test_ref_chunks():
+    with open("test/data/chunker/0_inp_dl_doc.json", encoding="utf-8") as f:
+        data_json = f.read()
+    dl_doc = DLDocument.model_validate_json(data_json)
+    chunker = HierarchicalChunker()
+
+    for chunk in chunker.chunk(dl_doc=dl_doc):
+        for include_prov in [True, False]:
+            ref_chunk = chunk.to_ref_chunk(include_prov=include_prov)
+            ref_data = ref_chunk.export_json_dict()
+            assert len(json.dumps(ref_data)) < len(json.dumps(chunk.export_json_dict()))
+            for item, item_ref in zip(chunk.meta.doc_items, ref_chunk.meta.doc_items):
+                assert item_ref.self_ref == item.self_ref
+                assert item_ref.prov == (item.prov if include_prov else None)
+
+            ref_chunk = DocRefChunk.model_validate(ref_data)
+            assert chunker.contextualize(chunk=ref_chunk) == chunker.contextualize(
+                chunk=chunk
+            )
+            assert (
+                ref_chunk.resolve(doc=dl_doc).export_json_dict()
+                == chunk.export_json_dict()
+            )
+
+    for item_ref in [
+        DocItemRef(self_ref="#/texts/0", label=DocItemLabel.TABLE),
+        DocItemRef(self_ref="#/texts/100000", label=DocItemLabel.TEXT),
+    ]:
+        with pytest.raises(ValueError):
+            item_ref.resolve(doc=dl_doc)
+
+
+def test_rechunk():
+    with open("test/data/chunker/0_inp_dl_doc.json", encoding="utf-8") as f:
+        data_json = f.read()
+    dl_doc = DLDocument.model_validate_json(data_json)
+    chunker = HierarchicalChunker()
+    exp_data = [c.export_json_dict() for c in chunker.chunk(dl_doc=dl_doc)]
+
+    res = chunker.rechunk(dl_doc=dl_doc)
+    assert [c.export_json_dict() for c in res.chunks] == exp_data
+    assert res.added == res.chunk_ids
+    assert len(set(res.chunk_ids)) == len(res.chunk_ids)
+    assert res.num_reused_units == 0
+
+    # the state can be stored, and nothing changes for the same document
+    state = ChunkingState.model_validate_json(res.state.model_dump_json())
+    same_res = chunker.rechunk(
+        dl_doc=dl_doc, previous=state, fingerprints=get_item_fingerprints(dl_doc)
+    )
+    assert [c.export_json_dict() for c in same_res.chunks] == exp_data
+    assert same_res.kept == res.chunk_ids
+    assert same_res.added == same_res.removed == []
+    assert same_res.num_reused_units == len(res.state.units)
+
+    # editing an item and deleting another one renumbers the following items, but
+    # only changes their own chunks
+    new_doc = dl_doc.model_copy(deep=True)
+    texts = [
+        it
+        for it in new_doc.texts
+        if it.label == DocItemLabel.TEXT and it.parent == new_doc.body.get_ref()
+    ]
+    texts[-1].text = texts[-1].orig = "An edited paragraph."
+    new_doc.delete_items(node_items=[texts[1]])
+    new_res = chunker.rechunk(dl_doc=new_doc, previous=res.state)
+    assert [c.export_json_dict() for c in new_res.chunks] == [
+        c.export_json_dict() for c in chunker.chunk(dl_doc=new_doc)
+    ]
+    assert new_res.chunk_ids == chunker.rechunk(dl_doc=new_doc).chunk_ids
+    assert len(new_res.added) == 1
+    assert len(new_res.removed) == 2
+    assert len(new_res.kept) == len(res.chunk_ids) - 2
+    assert new_res.num_reused_units == len(new_res.state.units) - 1
@@ -6,6 +6,7 @@
 import json
 
 import pytest
+import semchunk
 import tiktoken
 from transformers import AutoTokenizer
 
@@ -15,11 +16,13 @@ from docling_core.transforms.chunker.hierarchical_chunker import (
     DocChunk,
 )
 from docling_core.transforms.chunker.hybrid_chunker import HybridChunker
+from docling_core.transforms.chunker.tokenizer.cached import CachedTokenizer
 from docling_core.transforms.chunker.tokenizer.huggingface import HuggingFaceTokenizer
 from docling_core.transforms.chunker.tokenizer.openai import OpenAITokenizer
 from docling_core.transforms.serializer.markdown import MarkdownTableSerializer
 from docling_core.types.doc import DoclingDocument as DLDocument
 from docling_core.types.doc.document import DoclingDocument
+from docling_core.types.doc.labels import DocItemLabel, GroupLabel
 
 from .test_data_gen_flag import GEN_TEST_DATA
 
@@ -382,3 +385,248 @@ def test_chunk_explicit():
         act_data=act_data,
         exp_path_str=EXPECTED_OUT_FILE,
     )
+
+
+def test_chunk_long_list():
+    dl_doc = DoclingDocument(name="long_list")
+    dl_doc.add_heading(text="A long section")
+    group = dl_doc.add_group(label=GroupLabel.LIST)
+    for i in range(200):
+        dl_doc.add_list_item(
+            text=f"Item {i} of a long list, with {'some ' * (i % 7)}words.",
+            parent=group,
+        )
+
+    chunker = HybridChunker(
+        tokenizer=HuggingFaceTokenizer(
+            tokenizer=INNER_TOKENIZER,
+            max_tokens=MAX_TOKENS,
+        ),
+        merge_peers=False,
+    )
+    chunks = list(chunker.chunk(dl_doc=dl_doc))
+
+    assert len(chunks) > 1
+    assert [it.self_ref for c in chunks for it in c.meta.doc_items] == [
+        ref.cref for ref in group.children
+    ]
+    for i, chunk in enumerate(chunks):
+        assert chunker._count_chunk_tokens(doc_chunk=chunk) <= MAX_TOKENS
+        if i + 1 < len(chunks):
+            # each window is the largest one fitting
+            next_text = chunks[i + 1].text.split(chunker.delim)[0]
+            extended = DocChunk(
+                text=chunker.delim.join([chunk.text, next_text]), meta=chunk.meta
+            )
+            assert chunker._count_chunk_tokens(doc_chunk=extended) > MAX_TOKENS
+
+
+@pytest.mark.parametrize(
+    "tokenizer",
+    [
+        HuggingFaceTokenizer(tokenizer=INNER_TOKENIZER, max_tokens=MAX_TOKENS),
+        OpenAITokenizer(
+            tokenizer=tiktoken.encoding_for_model("gpt-4o"),
+            max_tokens=MAX_TOKENS,
+        ),
+    ],
+)
+def test_count_tokens_batch(tokenizer):
+    with open(INPUT_FILE, encoding="utf-8") as f:
+        data_json = f.read()
+    dl_doc = DLDocument.model_validate_json(data_json)
+    texts = [item.text for item in dl_doc.texts] + ["", "\n"]
+
+    assert tokenizer.count_tokens_batch(texts=texts) == [
+        tokenizer.count_tokens(text=text) for text in texts
+    ]
+    assert tokenizer.count_tokens_batch(texts=[]) == []
+
+
+def test_chunk_cached_tokenizer():
+    EXPECTED_OUT_FILE = "test/data/chunker/2a_out_chunks.json"
+
+    with open(INPUT_FILE, encoding="utf-8") as f:
+        data_json = f.read()
+    dl_doc = DLDocument.model_validate_json(data_json)
+
+    tokenizer = CachedTokenizer(
+        tokenizer=HuggingFaceTokenizer(
+            tokenizer=INNER_TOKENIZER,
+            max_tokens=MAX_TOKENS,
+        )
+    )
+    chunker = HybridChunker(tokenizer=tokenizer, merge_peers=True)
+
+    chunks = list(chunker.chunk(dl_doc=dl_doc))
+    act_data = dict(
+        root=[DocChunk.model_validate(n).export_json_dict() for n in chunks]
+    )
+    _process(
+        act_data=act_data,
+        exp_path_str=EXPECTED_OUT_FILE,
+    )
+
+    # a second document sharing the tokenizer is served from the cache
+    misses = tokenizer.cache_info().misses
+    assert len(list(chunker.chunk(dl_doc=dl_doc))) == len(chunks)
+    assert tokenizer.cache_info().misses == misses
+
+
+def test_cached_tokenizer_eviction():
+    tokenizer = CachedTokenizer(
+        tokenizer=HuggingFaceTokenizer(
+            tokenizer=INNER_TOKENIZER,
+            max_tokens=MAX_TOKENS,
+        ),
+        max_entries=2,
+    )
+    assert tokenizer.count_tokens_batch(texts=["a", "b c", "a"]) == [1, 2, 1]
+    assert tokenizer.count_tokens(text="b c") == 2
+    assert tokenizer.count_tokens(text="d e f") == 3  # evicts "a"
+    assert tokenizer.count_tokens(text="a") == 1
+
+    info = tokenizer.cache_info()
+    assert (info.hits, info.misses, info.num_entries) == (1, 5, 2)
+
+    tokenizer.cache_clear()
+    info = tokenizer.cache_info()
+    assert (info.hits, info.misses, info.num_entries) == (0, 0, 0)
+
+
+def test_chunk_streaming():
+    with open(INPUT_FILE, encoding="utf-8") as f:
+        data_json = f.read()
+    dl_doc = DLDocument.model_validate_json(data_json)
+
+    serialized_refs: list[str] = []
+
+    class MyDocSerializer(ChunkingDocSerializer):
+        def serialize(self, *, item=None, **kwargs):
+            if item is not None:
+                serialized_refs.append(item.self_ref)
+            return super().serialize(item=item, **kwargs)
+
+    class MySerializerProvider(ChunkingSerializerProvider):
+        def get_serializer(self, doc: DoclingDocument):
+            return MyDocSerializer(doc=doc)
+
+    chunker = HybridChunker(
+        tokenizer=HuggingFaceTokenizer(
+            tokenizer=INNER_TOKENIZER,
+            max_tokens=MAX_TOKENS,
+        ),
+        merge_peers=True,
+        serializer_provider=MySerializerProvider(),
+    )
+
+    chunk_iter = chunker.chunk(dl_doc=dl_doc)
+    first_chunk = next(chunk_iter)
+    num_serialized = len(set(serialized_refs))
+    chunks = [first_chunk, *chunk_iter]
+
+    # the first chunk is yielded before the last items have been serialized
+    assert num_serialized < len(set(serialized_refs))
+    assert [c.export_json_dict() for c in chunks] == [
+        c.export_json_dict() for c in chunker.chunk(dl_doc=dl_doc)
+    ]
+
+
+def test_chunk_many():
+    with open(INPUT_FILE, encoding="utf-8") as f:
+        data_json = f.read()
+    dl_docs = [DLDocument.model_validate_json(data_json)] * 3
+
+    chunker = HybridChunker(
+        tokenizer=CachedTokenizer(
+            tokenizer=HuggingFaceTokenizer(
+                tokenizer=INNER_TOKENIZER,
+                max_tokens=MAX_TOKENS,
+            )
+        ),
+    )
+    results = list(chunker.chunk_many(docs=dl_docs, workers=2, executor="process"))
+
+    exp_data = [c.export_json_dict() for c in chunker.chunk(dl_doc=dl_docs[0])]
+    assert [i for i, _ in results] == [i for i in range(len(dl_docs)) for _ in exp_data]
+    assert [c.export_json_dict() for _, c in results] == exp_data * len(dl_docs)
+
+
+def test_chunk_reuses_sem_chunkers(monkeypatch):
+    EXPECTED_OUT_FILE = "test/data/chunker/2a_out_chunks.json"
+
+    with open(INPUT_FILE, encoding="utf-8") as f:
+        data_json = f.read()
+    dl_doc = DLDocument.model_validate_json(data_json)
+
+    chunk_sizes: list[int] = []
+    chunkerify = semchunk.chunkerify
+
+    def _chunkerify(*args, **kwargs):
+        chunk_sizes.append(kwargs["chunk_size"])
+        return chunkerify(*args, **kwargs)
+
+    monkeypatch.setattr(semchunk, "chunkerify", _chunkerify)
+
+    chunker = HybridChunker(
+        tokenizer=HuggingFaceTokenizer(
+            tokenizer=INNER_TOKENIZER,
+            max_tokens=MAX_TOKENS,
+        ),
+        merge_peers=True,
+    )
+    chunks = list(chunker.chunk(dl_doc=dl_doc))
+    act_data = dict(
+        root=[DocChunk.model_validate(n).export_json_dict() for n in chunks]
+    )
+    _process(
+        act_data=act_data,
+        exp_path_str=EXPECTED_OUT_FILE,
+    )
+
+    # one splitter per token budget, also across documents
+    assert chunk_sizes
+    assert len(chunk_sizes) == len(set(chunk_sizes))
+    list(chunker.chunk(dl_doc=dl_doc))
+    assert len(chunk_sizes) == len(set(chunk_sizes))
+
+
+def test_rechunk():
+    with open(INPUT_FILE, encoding="utf-8") as f:
+        data_json = f.read()
+    dl_doc = DLDocument.model_validate_json(data_json)
+
+    tokenizer = CachedTokenizer(
+        tokenizer=HuggingFaceTokenizer(
+            tokenizer=INNER_TOKENIZER,
+            max_tokens=MAX_TOKENS,
+        )
+    )
+    chunker = HybridChunker(tokenizer=tokenizer, merge_peers=True)
+    res = chunker.rechunk(dl_doc=dl_doc)
+    assert [c.export_json_dict() for c in res.chunks] == [
+        c.export_json_dict() for c in chunker.chunk(dl_doc=dl_doc)
+    ]
+
+    new_doc = dl_doc.model_copy(deep=True)
+    texts = [
+        it
+        for it in new_doc.texts
+        if it.label == DocItemLabel.TEXT and it.parent == new_doc.body.get_ref()
+    ]
+    texts[-1].text = texts[-1].orig = "An edited paragraph."
+    new_doc.delete_items(node_items=[texts[0]])
+
+    # only the changed units are serialized, split and counted again
+    tokenizer.cache_clear()
+    new_res = chunker.rechunk(dl_doc=new_doc, previous=res.state)
+    num_misses = tokenizer.cache_info().misses
+    assert [c.export_json_dict() for c in new_res.chunks] == [
+        c.export_json_dict() for c in chunker.chunk(dl_doc=new_doc)
+    ]
+    assert num_misses < tokenizer.cache_info().misses / 4
+    assert new_res.chunk_ids == chunker.rechunk(dl_doc=new_doc).chunk_ids
+    assert new_res.added
+    assert new_res.removed
+    assert set(new_res.kept) == set(new_res.chunk_ids) - set(new_res.added)
+    assert new_res.num_reused_units == len(new_res.state.units) - 1
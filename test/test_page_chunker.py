@@ -1,7 +1,9 @@
 import json
 from pathlib import Path
 
-from docling_core.transforms.chunker.hierarchical_chunker import DocChunk
+import pytest
+
+from docling_core.transforms.chunker.hierarchical_chunker import DocChunk, DocMeta
 from docling_core.transforms.chunker.page_chunker import PageChunker
 from docling_core.types.doc.document import DoclingDocument
 
@@ -34,3 +36,49 @@ def test_page_chunks():
         act_data=act_data,
         exp_path_str=src.parent / f"{src.stem}_chunks.json",
     )
+
+
+def test_page_chunks_many():
+    src = Path("./test/data/doc/cross_page_lists.json")
+    docs = [DoclingDocument.load_from_json(src)] * 2
+
+    chunker = PageChunker()
+
+    results = list(chunker.chunk_many(docs=docs, workers=2))
+    exp_chunks = [c.export_json_dict() for c in chunker.chunk(dl_doc=docs[0])]
+    assert [i for i, _ in results] == [0] * len(exp_chunks) + [1] * len(exp_chunks)
+    assert [c.export_json_dict() for _, c in results] == exp_chunks * 2
+
+
+@pytest.mark.parametrize(
+    "src",
+    [
+        "./test/data/doc/2206.01062-1.0.0.json",
+        "./test/data/doc/2311.18481v1.json",
+        "./test/data/doc/activities.json",
+        "./test/data/doc/cross_page_lists.json",
+        "./test/data/doc/doc_with_kv.dt.json",
+    ],
+)
+def test_page_chunks_single_pass(src):
+    doc = DoclingDocument.load_from_json(Path(src))
+    chunker = PageChunker()
+
+    # reference: the document serialized as restricted to each page in turn
+    doc_ser = chunker.serializer_provider.get_serializer(doc=doc)
+    exp_data = []
+    for page_no in sorted(doc.pages):
+        ser_res = doc_ser.serialize(pages={page_no})
+        if ser_res.text:
+            exp_data.append(
+                DocChunk(
+                    text=ser_res.text,
+                    meta=DocMeta(
+                        doc_items=ser_res.get_unique_doc_items(),
+                        origin=doc.origin,
+                    ),
+                ).export_json_dict()
+            )
+
+    act_data = [c.export_json_dict() for c in chunker.chunk(dl_doc=doc)]
+    assert act_data == exp_data
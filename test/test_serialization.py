@@ -1,7 +1,9 @@
 """Test serialization."""
 
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
 from typing_extensions import override
 
@@ -9,8 +11,15 @@ from docling_core.transforms.serializer.base import (
     BaseDocSerializer,
     SerializationResult,
 )
-from docling_core.transforms.serializer.common import _DEFAULT_LABELS, create_ser_result
-from docling_core.transforms.serializer.doctags import DocTagsDocSerializer
+from docling_core.transforms.serializer.common import (
+    _DEFAULT_LABELS,
+    create_ser_result,
+    resolve_params,
+)
+from docling_core.transforms.serializer.doctags import (
+    DocTagsDocSerializer,
+    DocTagsParams,
+)
 from docling_core.transforms.serializer.html import (
     HTMLDocSerializer,
     HTMLOutputStyle,
@@ -20,12 +29,20 @@ from docling_core.transforms.serializer.markdown import (
     MarkdownDocSerializer,
     MarkdownParams,
     MarkdownTableSerializer,
+    MarkdownTextSerializer,
     OrigListItemMarkerMode,
     _get_annotation_ser_result,
 )
 from docling_core.transforms.visualizer.layout_visualizer import LayoutVisualizer
-from docling_core.types.doc.base import ImageRefMode
-from docling_core.types.doc.document import DoclingDocument, MiscAnnotation, TableItem
+from docling_core.types.doc.base import BoundingBox, ImageRefMode, Size
+from docling_core.types.doc.document import (
+    DocItem,
+    DoclingDocument,
+    MiscAnnotation,
+    ProvenanceItem,
+    TableItem,
+    TextItem,
+)
 from docling_core.types.doc.labels import DocItemLabel
 
 from .test_data_gen_flag import GEN_TEST_DATA
@@ -535,3 +552,247 @@ def test_doctags_rich_table():
     ser = DocTagsDocSerializer(doc=doc)
     actual = ser.serialize().text
     verify(exp_file=exp_file, actual=actual)
+
+
+class RecordingTextSerializer(MarkdownTextSerializer):
+    params_seen: list[MarkdownParams] = []
+
+    @override
+    def serialize(
+        self,
+        *,
+        item: TextItem,
+        doc_serializer: BaseDocSerializer,
+        doc: DoclingDocument,
+        **kwargs: Any,
+    ) -> SerializationResult:
+        self.params_seen.append(
+            resolve_params(
+                params_type=MarkdownParams,
+                doc_serializer=doc_serializer,
+                kwargs=kwargs,
+            )
+        )
+        return super().serialize(
+            item=item, doc_serializer=doc_serializer, doc=doc, **kwargs
+        )
+
+
+def test_md_params_resolved_once():
+    doc = _construct_doc()
+    text_ser = RecordingTextSerializer()
+    ser = MarkdownDocSerializer(doc=doc, text_serializer=text_ser)
+
+    assert ser.serialize().text == MarkdownDocSerializer(doc=doc).serialize().text
+    assert text_ser.params_seen
+    assert all(params is ser.params for params in text_ser.params_seen)
+
+    # overrides are applied, validating the patched params once per run
+    text_ser.params_seen.clear()
+    actual = ser.serialize(escape_underscores=False).text
+    exp_ser = MarkdownDocSerializer(
+        doc=doc, params=MarkdownParams(escape_underscores=False)
+    )
+    assert actual == exp_ser.serialize().text
+    patched = {id(p): p for p in text_ser.params_seen if p is not ser.params}
+    assert len(patched) == 1
+    assert not next(iter(patched.values())).escape_underscores
+    assert ser.params.escape_underscores
+
+
+class NestingTextSerializer(MarkdownTextSerializer):
+    nested: Optional[MarkdownDocSerializer] = None
+    nested_texts: list[str] = []
+
+    @override
+    def serialize(
+        self,
+        *,
+        item: TextItem,
+        doc_serializer: BaseDocSerializer,
+        doc: DoclingDocument,
+        **kwargs: Any,
+    ) -> SerializationResult:
+        if (nested := self.nested) is not None:
+            self.nested = None
+            self.nested_texts.append(nested.serialize().text)
+        return super().serialize(
+            item=item, doc_serializer=doc_serializer, doc=doc, **kwargs
+        )
+
+
+def test_md_params_run_of_copies():
+    doc = _construct_doc()
+    text_ser = NestingTextSerializer()
+    ser = MarkdownDocSerializer(doc=doc, text_serializer=text_ser)
+    expected = ser.serialize().text
+    raw = ser.model_copy(update={"params": MarkdownParams(indent=2)})
+    exp_raw = (
+        MarkdownDocSerializer(doc=doc, params=MarkdownParams(indent=2)).serialize().text
+    )
+    assert exp_raw != expected
+
+    # a copy serialized within the run of its original has its own params
+    text_ser.nested = raw
+    assert ser.serialize().text == expected
+    assert text_ser.nested_texts == [exp_raw]
+
+    # and so does the original, as well as the copy, serialized concurrently
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(
+            executor.map(lambda s: s.serialize().text, [ser, raw, ser.model_copy()] * 4)
+        )
+    assert results == [expected, exp_raw, expected] * 4
+
+
+def test_excluded_refs():
+    src = Path("./test/data/doc/2206.01062-1.0.0.json")
+    doc = DoclingDocument.load_from_json(src)
+    ser = MarkdownDocSerializer(doc=doc)
+    items = [
+        item
+        for item, _ in doc.iterate_items(
+            with_groups=True,
+            traverse_pictures=True,
+            included_content_layers=ser.params.layers,
+        )
+    ]
+
+    for params in (
+        {},
+        {"pages": {2}},
+        {"pages": {1, 3}, "start_idx": 5, "stop_idx": 100},
+        {"labels": {DocItemLabel.TEXT, DocItemLabel.TABLE}},
+    ):
+        exp_params = ser.params.merge_with_patch(patch=params)
+        expected = {
+            item.self_ref
+            for ix, item in enumerate(items)
+            if not exp_params.start_idx <= ix < exp_params.stop_idx
+            or (
+                isinstance(item, DocItem)
+                and (
+                    item.label not in exp_params.labels
+                    or (
+                        exp_params.pages is not None
+                        and (
+                            not item.prov
+                            or item.prov[0].page_no not in exp_params.pages
+                        )
+                    )
+                )
+            )
+        }
+        excluded = ser.get_excluded_refs(**params)
+        assert set(excluded) == expected
+        assert all(
+            (item.self_ref in excluded) == (item.self_ref in expected) for item in items
+        )
+        assert ser.get_excluded_refs(**params) is excluded
+
+    # the cache is bounded, e.g. when restricting to each page in turn
+    ref = next(item.self_ref for item in items if isinstance(item, DocItem))
+    for page_no in range(1000):
+        assert ref in ser.get_excluded_refs(pages={-page_no})
+    assert (
+        len(ser._excluded_refs_cache._entries) <= ser._excluded_refs_cache.max_entries
+    )
+
+    # a copy for another document does not reuse the cached refs
+    other_doc = _construct_doc()
+    other_ser = ser.model_copy(update={"doc": other_doc})
+    assert other_ser.get_excluded_refs(pages={2}) == MarkdownDocSerializer(
+        doc=other_doc
+    ).get_excluded_refs(pages={2})
+
+
+class CountingWriter(StringIO):
+    def __init__(self):
+        super().__init__()
+        self.num_writes = 0
+
+    @override
+    def write(self, s: str) -> int:
+        self.num_writes += 1
+        return super().write(s)
+
+
+def test_serialize_to_stream(tmp_path: Path):
+    src = Path("./test/data/doc/2206.01062-1.0.0.json")
+    doc = DoclingDocument.load_from_json(src)
+
+    for ser in (
+        MarkdownDocSerializer(doc=doc),
+        MarkdownDocSerializer(
+            doc=doc,
+            params=MarkdownParams(page_break_placeholder="<!-- page break -->"),
+        ),
+        HTMLDocSerializer(doc=doc),
+        HTMLDocSerializer(
+            doc=doc, params=HTMLParams(output_style=HTMLOutputStyle.SPLIT_PAGE)
+        ),
+        DocTagsDocSerializer(doc=doc),
+        DocTagsDocSerializer(doc=doc, params=DocTagsParams(add_page_break=False)),
+    ):
+        exp_text = ser.serialize().text
+        fw = CountingWriter()
+        ser.serialize_to_stream(fw)
+        assert fw.getvalue() == exp_text
+        if not isinstance(ser.params, HTMLParams) or (
+            ser.params.output_style == HTMLOutputStyle.SINGLE_COLUMN
+        ):
+            assert fw.num_writes > 1  # written part by part
+
+    # the params can be overridden as for serialize()
+    fw = CountingWriter()
+    MarkdownDocSerializer(doc=doc).serialize_to_stream(fw, pages={2})
+    exp_ser = MarkdownDocSerializer(doc=doc, params=MarkdownParams(pages={2}))
+    assert fw.getvalue() == exp_ser.serialize().text
+
+    filename = tmp_path / "doc.md"
+    doc.save_as_markdown(filename, page_break_placeholder="<!-- page break -->")
+    assert filename.read_text(encoding="utf-8") == doc.export_to_markdown(
+        page_break_placeholder="<!-- page break -->"
+    )
+    filename = tmp_path / "doc.html"
+    doc.save_as_html(filename)
+    assert filename.read_text(encoding="utf-8") == doc.export_to_html()
+    filename = tmp_path / "doc.dt"
+    doc.save_as_doctags(filename)
+    assert filename.read_text(encoding="utf-8") == doc.export_to_doctags()
+
+
+def test_page_breaks_not_taken_from_text():
+    def _prov(page_no: int) -> ProvenanceItem:
+        bbox = BoundingBox(l=0, t=0, r=1, b=1)
+        return ProvenanceItem(page_no=page_no, bbox=bbox, charspan=(0, 1))
+
+    marker = "#_#_DOCLING_DOC_PAGE_BREAK_1_2_#_#"
+    doc = DoclingDocument(name="pages")
+    for page_no in (1, 2):
+        doc.add_page(page_no=page_no, size=Size(width=100, height=100), metadata={})
+    doc.add_text(label=DocItemLabel.TEXT, text=f"Some text: {marker}", prov=_prov(1))
+    group = doc.add_list_group()
+    doc.add_list_item(text="Item on page 1", parent=group, prov=_prov(1))
+    doc.add_list_item(text="Item on page 2", parent=group, prov=_prov(2))
+    doc.add_text(label=DocItemLabel.TEXT, text="Text on page 2", prov=_prov(2))
+
+    ser = MarkdownDocSerializer(
+        doc=doc,
+        params=MarkdownParams(
+            page_break_placeholder="<!-- page break -->", escape_underscores=False
+        ),
+    )
+    assert ser.serialize().text == (
+        f"Some text: {marker}\n\n"
+        "- Item on page 1\n<!-- page break -->\n- Item on page 2\n\n"
+        "Text on page 2"
+    )
+
+    ser_res = HTMLDocSerializer(
+        doc=doc, params=HTMLParams(output_style=HTMLOutputStyle.SPLIT_PAGE)
+    ).serialize()
+    pages = ser_res.text.split("<div class='page'>")[1:]
+    assert len(pages) == 2
+    assert marker in pages[0] and "Item on page 1" in pages[0]
+    assert "Item on page 2" in pages[1] and "Text on page 2" in pages[1]